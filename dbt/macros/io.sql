@@ -1,5 +1,5 @@
 {#
-    Export a model to the prep folder in a CSV format.
+    Export a model to the prep folder, both as a gzipped CSV and as Parquet.
 
     Arguments:
       - relation: the model to be exported.
@@ -13,6 +13,9 @@
       {% call statement(name, fetch_result=True) %}
         COPY {{ relation }} TO '../data/prep/{{ model.name }}.csv.gz' (HEADER, DELIMITER ',', COMPRESSION gzip)
       {% endcall %}
+      {% call statement(name, fetch_result=True) %}
+        COPY {{ relation }} TO '../data/prep/{{ model.name }}.parquet' (FORMAT PARQUET, COMPRESSION zstd)
+      {% endcall %}
   {% else %}
       SELECT 1
   {% endif %}
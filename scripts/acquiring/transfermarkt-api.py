@@ -3,21 +3,30 @@ https://www.transfermarkt.com/ceapi/marketValueDevelopment/graph/{player_id}
 https://www.transfermarkt.co.uk/ceapi/transferHistory/list/{player_id}
 
 Usage:
-    python transfermarkt-api.py --seasons=<seasons> [--players=<ids>] [--clubs=<ids>] [--competitions=<ids>]
+    python transfermarkt-api.py --seasons=<seasons> [--players=<ids>] [--clubs=<ids>] [--competitions=<ids>] [--multi-season] [--incremental]
 
 Note that the will look for the players asset from the transfermarkt-scraper acquirer under
     data/raw/transfermarkt-scraper/{season}/players.json.gz
 """
 
 import pathlib
-from typing import List
+from typing import Callable, Dict, List, Tuple
 import json
 import gzip
 import argparse
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import hashlib
+import math
+import os
+import time
+from urllib.parse import urlparse
 
 import aiohttp
 import asyncio
+import pyarrow as pa
 
+from transfermarkt_datasets.core.cache import RawCache
 from transfermarkt_datasets.core.utils import (
   read_config,
   seasons_list
@@ -36,6 +45,12 @@ MARKET_VALUES_API = "https://www.transfermarkt.com/ceapi/marketValueDevelopment/
 TRANSFERS_API = "https://www.transfermarkt.co.uk/ceapi/transferHistory/list/"
 USER_AGENT = "transfermarkt-datasets/1.0 (https://github.com/dcaribou/transfermarkt-datasets)"
 
+# the assets fetched for each player, by the API they come from
+ENDPOINTS = {
+    "market values": MARKET_VALUES_API,
+    "transfers": TRANSFERS_API,
+}
+
 # how many times to re-request the players that came back with a null response
 MAX_BATCH_RETRIES = 2
 
@@ -43,6 +58,47 @@ MAX_BATCH_RETRIES = 2
 # and is never written over the raw data already on disk
 MAX_NULL_RESPONSE_RATE = 0.2
 
+# a partial file left by a failed run is only resumed by a run for the same season and
+# players, and up to this many hours after it was started
+MAX_PARTIAL_AGE_HOURS = 48
+
+# in incremental runs, players are requested again after this many days even if
+# nothing in their scraper record changed
+INCREMENTAL_TTL_DAYS = 28
+STATE_PATH = "data/raw/transfermarkt-api/players_state.json"
+
+# fields of the scraper players that move along with the market values and transfers
+CHANGE_SIGNAL_FIELDS = ["current_market_value", "highest_market_value"]
+
+# the scraper files are converted once to Parquet, shared with the raw assets
+raw_cache = RawCache()
+
+def read_raw_records(path: str, fields: List[str]) -> List[dict]:
+    """Read some fields of a raw JSON lines file through the raw cache.
+
+    Args:
+        path (str): Path to the (gzipped) JSON lines file.
+        fields (List[str]): Top level fields to read.
+
+    Returns:
+        List[dict]: One dict per line. Fields missing from a line are None.
+    """
+    try:
+        df = raw_cache.read(path, fields)
+        return df.to_dict(orient="records")
+    except pa.ArrowInvalid as e:
+        logging.debug(f"Cannot cache {path}, parsing it as JSON: {e}")
+
+    with gzip.open(path, mode="r") as z:
+        records = [json.loads(line) for line in z]
+    return [{field: record.get(field) for field in fields} for record in records]
+
+def parent_id(record: dict) -> str:
+    """Get the id of the parent of a scraper record, such as the club of a player."""
+
+    parent = record.get("parent") or {}
+    return (parent.get("href") or "").rstrip("/").split("/")[-1]
+
 
 # get the player ids from the players asset from transfermarkt-scraper source
 def get_player_ids(season: int, player_filter=None, club_filter=None, competition_filter=None) -> List[int]:
@@ -60,27 +116,22 @@ def get_player_ids(season: int, player_filter=None, club_filter=None, competitio
 
     players_asset_path = f"data/raw/transfermarkt-scraper/{season}/players.json.gz"
 
-    # read lines from a zipped file
-    with gzip.open(players_asset_path, mode="r") as z:
-        players = [json.loads(line) for line in z.readlines()]
+    players = read_raw_records(players_asset_path, ["href", "parent"])
 
     if player_filter:
         players = [p for p in players if p["href"].split("/")[-1] in player_filter]
     elif club_filter:
-        players = [p for p in players
-                   if p.get("parent", {}).get("href", "").split("/")[-1] in club_filter]
+        players = [p for p in players if parent_id(p) in club_filter]
     elif competition_filter:
         # Resolve competition IDs → club IDs from the clubs file, then filter players by club
         clubs_path = f"data/raw/transfermarkt-scraper/{season}/clubs.json.gz"
-        with gzip.open(clubs_path, mode="r") as z:
-            clubs = [json.loads(line) for line in z.readlines()]
+        clubs = read_raw_records(clubs_path, ["href", "parent"])
         club_ids = {
             c["href"].split("/")[-1] for c in clubs
-            if c.get("parent", {}).get("href", "").rstrip("/").split("/")[-1] in competition_filter
+            if parent_id(c) in competition_filter
         }
         logging.info(f"Competition filter resolved to {len(club_ids)} club IDs")
-        players = [p for p in players
-                   if p.get("parent", {}).get("href", "").split("/")[-1] in club_ids]
+        players = [p for p in players if parent_id(p) in club_ids]
 
     player_ids = [
         int(player["href"].split("/")[-1])
@@ -90,12 +141,222 @@ def get_player_ids(season: int, player_filter=None, club_filter=None, competitio
 
     return player_ids
 
+def change_signals(player: dict) -> dict:
+    """Get the values of a scraper player record that signal a change in their API data.
+
+    Args:
+        player (dict): The scraper record, with the CHANGE_SIGNAL_FIELDS and the parent.
+
+    Returns:
+        dict: The market values and the id of the parent club, JSON serializable.
+    """
+    signals = {}
+    for field in CHANGE_SIGNAL_FIELDS:
+        value = player.get(field)
+        # missing values come back as NaN from numeric columns
+        signals[field] = None if isinstance(value, float) and math.isnan(value) else value
+    signals["parent"] = parent_id(player)
+    return signals
+
+def get_change_signals(season: int) -> Dict[int, dict]:
+    """Get the change signals of every player in the players asset from the transfermarkt-scraper source.
+
+    Args:
+        season: The season year.
+
+    Returns:
+        Dict[int, dict]: The signals from `change_signals` for each player id.
+    """
+    players_asset_path = f"data/raw/transfermarkt-scraper/{season}/players.json.gz"
+    players = read_raw_records(players_asset_path, ["href", "parent"] + CHANGE_SIGNAL_FIELDS)
+    return {
+        int(player["href"].split("/")[-1]): change_signals(player)
+        for player in players
+    }
+
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 1  # seconds
 REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
 
+# statuses the API uses to throttle or block us, 429 requests are retried after the
+# time in its Retry-After header, up to MAX_RETRY_AFTER seconds
+THROTTLING_STATUSES = (403, 429)
+MAX_RETRY_AFTER = 300
+
+# requests to each API host are started at no more than this rate, with bursts of up to REQUEST_BURST
+REQUESTS_PER_SECOND = 20
+REQUEST_BURST = 20
+
+# the number of requests in flight grows by one for every window of healthy responses
+# and is cut by CONCURRENCY_BACKOFF on a failed one
+INITIAL_CONCURRENCY = 8
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 64
+CONCURRENCY_BACKOFF = 0.5
+
+# connections are kept open and reused across requests, up to this many for each host
+CONNECTIONS_PER_HOST = 32
+DNS_CACHE_SECONDS = 600
+
+class RequestSlot:
+    """A request admitted by a ConcurrencyController, to be marked as failed if the
+    API did not answer properly."""
+
+    def __init__(self, controller, ticket: int) -> None:
+        self.controller = controller
+        self.ticket = ticket
+        self.healthy = True
+
+    def fail(self) -> None:
+        self.healthy = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.healthy = False
+        await self.controller.release(self)
+
+class ConcurrencyController:
+    """Limit the requests to an API host with a token bucket and an adaptive concurrency window.
+
+    The token bucket caps the rate at which requests start. The window caps how many are
+    in flight and adapts to the responses with AIMD: it grows additively while responses
+    are healthy, and is cut multiplicatively on throttling (403 or 429), a server error,
+    a null body or a timeout, which is how a block starts to show. Failures of requests started before the last
+    cut are ignored, so a burst of failures only cuts the window once.
+
+    Args:
+        requests_per_second (float, optional): Rate at which tokens are added to the bucket.
+        burst (int, optional): Size of the bucket.
+        initial_concurrency (int, optional): Starting size of the window.
+        max_concurrency (int, optional): Largest size of the window.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = REQUESTS_PER_SECOND,
+        burst: int = REQUEST_BURST,
+        initial_concurrency: int = INITIAL_CONCURRENCY,
+        max_concurrency: int = MAX_CONCURRENCY) -> None:
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.limit = float(min(initial_concurrency, max_concurrency))
+
+        self.tokens = float(burst)
+        self.refilled_at = time.monotonic()
+
+        self.in_flight = 0
+        # number of cuts to the window, each request holds the value it started with
+        self.backoffs = 0
+        self.successes = 0
+        self.failures = 0
+
+        self._loop = None
+        self._condition = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # a condition belongs to one event loop, and the controller may outlive it
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def _take_token(self) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.requests_per_second)
+            self.refilled_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.requests_per_second)
+
+    async def slot(self) -> RequestSlot:
+        """Wait until a request is allowed to start.
+
+        Returns:
+            RequestSlot: To be used as an async context manager around the request.
+        """
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        try:
+            await self._take_token()
+        except BaseException:
+            await self.release(RequestSlot(self, self.backoffs))
+            raise
+        return RequestSlot(self, self.backoffs)
+
+    async def release(self, slot: RequestSlot) -> None:
+        """Account for the outcome of a finished request and adapt the window."""
+
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            if slot.healthy:
+                self.successes += 1
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            else:
+                self.failures += 1
+                if slot.ticket == self.backoffs:
+                    self.backoffs += 1
+                    self.limit = max(MIN_CONCURRENCY, self.limit * CONCURRENCY_BACKOFF)
+                    logging.info(f"Backing off to {int(self.limit)} concurrent requests")
+            # wake only as many waiters as there are free places in the window
+            condition.notify(max(int(self.limit) - self.in_flight, 0))
+
+class HostControllers:
+    """A ConcurrencyController for each API host, created on first use with the same settings.
+
+    The market values and transfers APIs live on different hosts, which throttle us
+    independently, so a block on one must not slow down the requests to the other.
+
+    Args:
+        **settings: Arguments to ConcurrencyController.
+    """
+
+    def __init__(self, **settings) -> None:
+        self.settings = settings
+        self.controllers = {}
+
+    def for_url(self, url: str) -> ConcurrencyController:
+        """Get the controller of the host of `url`."""
+
+        host = urlparse(url).netloc
+        if host not in self.controllers:
+            self.controllers[host] = ConcurrencyController(**self.settings)
+        return self.controllers[host]
+
+def retry_after_seconds(response) -> float:
+    """Get how long the API asked us to wait from the Retry-After header, if any.
+
+    Args:
+        response (aiohttp.ClientResponse): A throttled response
+
+    Returns:
+        float: Seconds to wait, up to MAX_RETRY_AFTER, or 0 if the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return 0
+    try:
+        seconds = float(value)
+    except ValueError:
+        # the header may also hold an HTTP date
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return 0
+    return min(max(seconds, 0), MAX_RETRY_AFTER)
+
 # helper function to fetch data from API
-async def fetch_data(session, url, player_id):
+async def fetch_data(session, url, player_id, controller: ConcurrencyController):
     """Fetch data from the API for a given URL and player ID.
     Retries up to MAX_RETRIES times with exponential backoff on transient errors.
 
@@ -103,6 +364,7 @@ async def fetch_data(session, url, player_id):
         session (aiohttp.ClientSession): The aiohttp session
         url (str): The API URL
         player_id (int): The player ID
+        controller (ConcurrencyController): Admits the request and learns from its outcome
 
     Returns:
         dict: The API response and player ID
@@ -113,113 +375,482 @@ async def fetch_data(session, url, player_id):
     }
 
     for attempt in range(MAX_RETRIES):
+        delay = RETRY_BACKOFF_BASE * (2 ** attempt)
         try:
-            async with session.get(url=url, headers=headers, ssl=False) as response:
-                if 400 <= response.status < 500:
-                    logging.warning(f"HTTP {response.status} for player {player_id}, not retrying")
-                    return {"response": None, "player_id": player_id}
-                if response.status >= 500:
-                    logging.warning(f"HTTP {response.status} for player {player_id}, attempt {attempt + 1}/{MAX_RETRIES}")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(RETRY_BACKOFF_BASE * (2 ** attempt))
-                        continue
-                    return {"response": None, "player_id": player_id}
-                try:
-                    body = await response.json()
-                except aiohttp.ContentTypeError as e:
-                    logging.error(f"Failed to parse response for player {player_id}: {e}")
-                    body = None
-                if body is None and attempt < MAX_RETRIES - 1:
-                    logging.warning(f"Null response for player {player_id}, attempt {attempt + 1}/{MAX_RETRIES}, retrying")
-                    await asyncio.sleep(RETRY_BACKOFF_BASE * (2 ** attempt))
-                    continue
-                return {"response": body, "player_id": player_id}
+            async with await controller.slot() as slot:
+                async with session.get(url=url, headers=headers, ssl=False) as response:
+                    if response.status in THROTTLING_STATUSES:
+                        # the API pushing back, which must shrink the window rather than grow it
+                        slot.fail()
+                    if response.status == 429:
+                        delay = max(delay, retry_after_seconds(response))
+                        logging.warning(f"HTTP 429 for player {player_id}, attempt {attempt + 1}/{MAX_RETRIES}")
+                        body = None
+                    elif 400 <= response.status < 500:
+                        logging.warning(f"HTTP {response.status} for player {player_id}, not retrying")
+                        return {"response": None, "player_id": player_id}
+                    elif response.status >= 500:
+                        slot.fail()
+                        logging.warning(f"HTTP {response.status} for player {player_id}, attempt {attempt + 1}/{MAX_RETRIES}")
+                        body = None
+                    else:
+                        try:
+                            body = await response.json()
+                        except aiohttp.ContentTypeError as e:
+                            logging.error(f"Failed to parse response for player {player_id}: {e}")
+                            body = None
+                        if body is None:
+                            slot.fail()
+                            logging.warning(f"Null response for player {player_id}, attempt {attempt + 1}/{MAX_RETRIES}")
+            if body is None and attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(delay)
+                continue
+            return {"response": body, "player_id": player_id}
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logging.warning(f"Request error for player {player_id}, attempt {attempt + 1}/{MAX_RETRIES}: {e}")
             if attempt < MAX_RETRIES - 1:
-                await asyncio.sleep(RETRY_BACKOFF_BASE * (2 ** attempt))
+                await asyncio.sleep(delay)
             else:
                 return {"response": None, "player_id": player_id}
 
-# for each player id, get the market value data from the API
-async def get_market_values(player_ids: List[int]) -> List[dict]:
-    """Get the market value data from the API for each player id.
+def create_session() -> aiohttp.ClientSession:
+    """Create a session with a connection pool bounded per host.
+    It must be created, and closed, inside the event loop that uses it."""
+
+    connector = aiohttp.TCPConnector(
+        limit=0,
+        limit_per_host=CONNECTIONS_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_SECONDS
+    )
+    return aiohttp.ClientSession(timeout=REQUEST_TIMEOUT, connector=connector)
+
+async def fetch_work(session, work: List[Tuple[str, int]], controllers: HostControllers,
+                     on_result: Callable[[int, dict], None]) -> None:
+    """Fetch a list of API requests through a work queue for each API host.
+
+    A fixed pool of workers for each host takes (API, player ID) pairs from the queue of
+    the host, so the number of pending coroutines does not grow with the number of players,
+    the controller of the host decides when each request starts, and a host that throttles
+    us does not hold up the requests to the others. Results are handed over as they arrive
+    rather than collected, so callers decide what to keep in memory.
 
     Args:
-        player_ids (List[int]): List of player ids
+        session (aiohttp.ClientSession): The aiohttp session
+        work (List[Tuple[str, int]]): The API URL and player ID of each request
+        controllers (HostControllers): Admit the requests to each host
+        on_result (Callable[[int, dict], None]): Called with the position in `work` and the
+            result (API response and player ID) of each request
+    """
+    queues = {}
+    for position, (api, player_id) in enumerate(work):
+        controller = controllers.for_url(api)
+        if controller not in queues:
+            queues[controller] = asyncio.Queue()
+        queues[controller].put_nowait((position, (api, player_id)))
+
+    async def worker(queue: asyncio.Queue, controller: ConcurrencyController):
+        while True:
+            try:
+                position, (api, player_id) = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            on_result(position, await fetch_data(session, api + str(player_id), player_id, controller))
+
+    await asyncio.gather(*[
+        worker(queue, controller)
+        for controller, queue in queues.items()
+        for _ in range(min(controller.max_concurrency, queue.qsize()))
+    ])
+
+class ResponseStore:
+    """The responses of one asset for a season, streamed to a partial JSON lines file.
+
+    Responses are appended to `{path}.partial` as they arrive, so they are not held in
+    memory and survive a crash. The partial file is also the checkpoint: a player is
+    done once its response is in it, and a later run for the same season only requests
+    the players that are not. The raw file at `path` is only replaced, atomically, once
+    the whole season is in and passes the checks in validate_responses.
+
+    The season, the players and the start time of the run that created the partial file
+    are kept next to it, in `{path}.partial.json`. A partial file left by a run for another
+    season or players, or started more than MAX_PARTIAL_AGE_HOURS ago, is discarded
+    instead of resumed.
 
-    Returns:
-        List[dict]: List of dicts with market value data
+    Args:
+        path (str): The raw file for the asset and season.
+        label (str): Name of the asset, used in log and error messages.
+        keep (set, optional): Players whose response in the current raw file is carried
+            over instead of requested again, in incremental runs. Players whose request
+            fails in those runs also keep their response from the raw file.
+        season (int, optional): The season of the raw file.
     """
 
-    logging.info(f"Requesting market values for {len(player_ids)} players")
+    def __init__(self, path: str, label: str, keep: set = None, season: int = None) -> None:
+        self.path = path
+        self.partial_path = path + ".partial"
+        self.run_path = self.partial_path + ".json"
+        self.label = label
+        self.season = season
+        self.incremental = keep is not None
+        self.keep = keep or set()
+
+        self.completed = set()
+        # players whose response comes from the raw file rather than from a request
+        self.carried = set()
+        self.null_ids = set()
+        self.file = None
+
+    def open(self, player_ids: List[int]) -> List[int]:
+        """Open the partial file, resuming from it if a previous run left one.
+
+        Args:
+            player_ids (List[int]): The players to be fetched for the season.
+
+        Returns:
+            List[int]: The players that still need to be requested, in the original order.
+        """
+        run = {
+            "season": self.season,
+            "players": hashlib.sha256(json.dumps(sorted(player_ids)).encode("utf-8")).hexdigest(),
+        }
 
-    async with aiohttp.ClientSession(timeout=REQUEST_TIMEOUT) as session:
-        tasks = [fetch_data(session, MARKET_VALUES_API + str(player_id), player_id) for player_id in player_ids]
+        if os.path.exists(self.partial_path):
+            stale = self._stale_reason(run)
+            if stale:
+                logging.warning(f"Discarding {self.partial_path}, as {stale}")
+                os.remove(self.partial_path)
+            else:
+                self._resume(set(player_ids))
 
-        # Use asyncio.gather to execute the tasks concurrently
-        responses = await asyncio.gather(*tasks)
+        if not os.path.exists(self.partial_path):
+            with open(self.run_path, "w") as f:
+                json.dump(dict(run, started_at=datetime.now(timezone.utc).isoformat()), f)
 
-    return responses
+        self.file = open(self.partial_path, "a")
+        if self.keep and os.path.exists(self.path):
+            self._carry_over(self.keep & set(player_ids))
 
-# for each player id, get the transfer history data from the API
-async def get_transfers(player_ids: List[int]) -> List[dict]:
-    """Get the transfer history data from the API for each player id.
+        return [player_id for player_id in player_ids if player_id not in self.completed]
 
-    Args:
-        player_ids (List[int]): List of player ids
+    def _stale_reason(self, run: dict) -> str:
+        # why the partial file cannot be resumed by `run`, or None if it can
+        try:
+            with open(self.run_path) as f:
+                previous = json.load(f)
+            started_at = datetime.fromisoformat(previous["started_at"])
+        except (OSError, ValueError, KeyError):
+            return "the run that left it is unknown"
+
+        if previous.get("season") != run["season"]:
+            return f"it was left by a run for season {previous.get('season')}"
+        if previous.get("players") != run["players"]:
+            return "it was left by a run for other players"
+        if datetime.now(timezone.utc) - started_at > timedelta(hours=MAX_PARTIAL_AGE_HOURS):
+            return f"it was started more than {MAX_PARTIAL_AGE_HOURS} hours ago"
+        return None
+
+    def _carry_over(self, player_ids: set) -> None:
+        carried = 0
+        with open(self.path) as raw:
+            for line in raw:
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    continue
+                if item["player_id"] in player_ids and item["response"] is not None:
+                    self.add(item)
+                    self.carried.add(item["player_id"])
+                    carried += 1
+
+        logging.info(f"Carrying over {carried} unchanged {self.label} responses from {self.path}")
+
+    def _resume(self, player_ids: set) -> None:
+        # keep the good responses for the requested players and drop the rest, such as
+        # null responses or a line cut short by a crash
+        tmp_path = f"{self.partial_path}.{os.getpid()}.tmp"
+        with open(self.partial_path) as partial, open(tmp_path, "w") as tmp:
+            for line in partial:
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    continue
+                player_id = item["player_id"]
+                if item["response"] is None or player_id not in player_ids or player_id in self.completed:
+                    continue
+                tmp.write(line if line.endswith("\n") else line + "\n")
+                self.completed.add(player_id)
+                if player_id in self.keep:
+                    self.carried.add(player_id)
+        os.replace(tmp_path, self.partial_path)
+
+        logging.info(f"Resuming {self.label} from {self.partial_path}, {len(self.completed)} players already done")
+
+    def add(self, item: dict) -> None:
+        """Record the result of a request. Null responses are only kept as ids, to be retried."""
+
+        player_id = item["player_id"]
+        if item["response"] is None:
+            self.null_ids.add(player_id)
+            return
+
+        self.null_ids.discard(player_id)
+        if player_id in self.completed:
+            return
+        self.file.write(json.dumps(item) + "\n")
+        self.file.flush()
+        self.completed.add(player_id)
+
+    def close(self) -> None:
+        if self.file is not None and not self.file.closed:
+            self.file.close()
+
+    def _previous_responses(self, player_ids: set) -> Dict[int, str]:
+        previous = {}
+        if not os.path.exists(self.path):
+            return previous
+        with open(self.path) as raw:
+            for line in raw:
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    continue
+                if item["player_id"] in player_ids and item["response"] is not None:
+                    previous[item["player_id"]] = line if line.endswith("\n") else line + "\n"
+        return previous
+
+    def finish(self) -> None:
+        """Check the requests of the run, then write the null responses left after retries
+        and make the partial file durable.
+
+        Only the requests made in the run count towards the checks, responses carried over
+        from the raw file do not. In incremental runs, players whose request failed keep
+        their response from the raw file instead of a null one.
+
+        Raises:
+            RuntimeError: If the result would not pass validate_responses. The partial
+                file is kept, so that a later run resumes from it.
+        """
+        self.close()
+
+        null_ids = self.null_ids - self.completed
+        requested = len(self.completed - self.carried) + len(null_ids)
+        # a run with nothing to request has nothing to check, unless it has nothing at all
+        if requested or not self.completed:
+            validate_counts(requested, len(null_ids), self.path, self.label)
+
+        previous = self._previous_responses(null_ids) if self.incremental else {}
+        if previous:
+            logging.info(f"Keeping the previous {self.label} response of {len(previous)} failed players")
+
+        with open(self.partial_path, "a") as f:
+            for player_id in sorted(null_ids):
+                f.write(previous.get(player_id) or json.dumps({"response": None, "player_id": player_id}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def commit(self) -> None:
+        """Move the partial file over the raw file."""
+
+        os.replace(self.partial_path, self.path)
+        if os.path.exists(self.run_path):
+            os.remove(self.run_path)
+
+class PlayerState:
+    """What was last fetched for each player, for incremental runs to request only the
+    players that are likely to have changed.
+
+    For each player, the state keeps the change signals from the scraper record it was
+    fetched with, a fingerprint of the last response of each asset and when it was
+    fetched. A player is due for a new request when it is not in the state, when its
+    market values or club in the scraper data moved since, or when it was fetched more
+    than `ttl_days` ago. Everyone else keeps their previous response.
 
-    Returns:
-        List[dict]: List of dicts with transfer history data
+    Args:
+        path (str, optional): The JSON file holding the state.
+        ttl_days (int, optional): Days after which a player is requested again regardless.
+        now (datetime, optional): The time of the run.
     """
 
-    logging.info(f"Requesting transfer history for {len(player_ids)} players")
-
-    async with aiohttp.ClientSession(timeout=REQUEST_TIMEOUT) as session:
-        tasks = [fetch_data(session, TRANSFERS_API + str(player_id), player_id) for player_id in player_ids]
+    def __init__(self, path: str = STATE_PATH, ttl_days: int = INCREMENTAL_TTL_DAYS, now: datetime = None) -> None:
+        self.path = path
+        self.ttl = timedelta(days=ttl_days)
+        self.now = now or datetime.now(timezone.utc)
+
+        self.players = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.players = {int(player_id): entry for player_id, entry in json.load(f).items()}
+
+        # current signals of the players, to be stored along with their responses
+        self.signals = {}
+        self.changed_responses = 0
+        self.unchanged_responses = 0
+
+    def due(self, signals: Dict[int, dict]) -> set:
+        """Pick the players to be requested in this run.
+
+        Args:
+            signals (Dict[int, dict]): The current change signals of each player, from `change_signals`.
+
+        Returns:
+            set: The players due for a new request.
+        """
+        self.signals.update(signals)
+
+        reasons = {"new": 0, "changed": 0, "expired": 0}
+        due = set()
+        for player_id, player_signals in signals.items():
+            entry = self.players.get(player_id)
+            if entry is None:
+                reason = "new"
+            elif entry["signals"] != player_signals:
+                reason = "changed"
+            elif self.now - datetime.fromisoformat(entry["fetched_at"]) > self.ttl:
+                reason = "expired"
+            else:
+                continue
+            reasons[reason] += 1
+            due.add(player_id)
 
-        # Use asyncio.gather to execute the tasks concurrently
-        responses = await asyncio.gather(*tasks)
+        logging.info(
+            f"Incremental run: {len(due)}/{len(signals)} players due "
+            f"({reasons['new']} new, {reasons['changed']} changed, {reasons['expired']} expired)"
+        )
+        return due
+
+    def record(self, label: str, item: dict) -> None:
+        """Store the fingerprint of a fetched response."""
+
+        player_id = item["player_id"]
+        fingerprint = hashlib.sha256(
+            json.dumps(item["response"], sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+
+        entry = self.players.setdefault(player_id, {"fingerprints": {}})
+        if entry["fingerprints"].get(label) == fingerprint:
+            self.unchanged_responses += 1
+        else:
+            self.changed_responses += 1
+        entry["fingerprints"][label] = fingerprint
+        entry["signals"] = self.signals.get(player_id, entry.get("signals"))
+        entry["fetched_at"] = self.now.isoformat()
+
+    def save(self) -> None:
+        logging.info(
+            f"Fetched responses: {self.changed_responses} changed, {self.unchanged_responses} unchanged"
+        )
+        pathlib.Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({str(player_id): entry for player_id, entry in self.players.items()}, f)
+        os.replace(tmp_path, self.path)
 
-    return responses
+class FanOutStore:
+    """The responses of one asset for several seasons, each written to the stores of all
+    the seasons the player belongs to. It stands in for a ResponseStore in `fetch_players`.
 
-def fetch_with_retries(fetch_all, player_ids: List, label: str) -> List[dict]:
-    """Fetch responses for `player_ids`, re-requesting the ones that come back null.
+    Args:
+        stores (Dict[int, ResponseStore]): The store of each season.
+        player_ids_by_season (Dict[int, List[int]]): The players to be fetched for each season.
+        state (PlayerState, optional): Records the responses fetched, in incremental runs.
+    """
 
-    The API intermittently returns null for individual players, and rejects
-    whole runs when it decides to block us. Retrying only the failed players
-    keeps a partial failure from turning into a lost season.
+    def __init__(self, stores: Dict[int, ResponseStore], player_ids_by_season: Dict[int, List[int]],
+                 state: PlayerState = None) -> None:
+        self.stores = stores
+        self.player_ids_by_season = player_ids_by_season
+        self.state = state
+        self.stores_by_player = {}
+        for season, store in stores.items():
+            for player_id in player_ids_by_season[season]:
+                self.stores_by_player.setdefault(player_id, []).append(store)
+
+    @property
+    def completed(self) -> set:
+        return set().union(*[store.completed for store in self.stores.values()])
+
+    @property
+    def null_ids(self) -> set:
+        return set().union(*[store.null_ids for store in self.stores.values()]) - self.completed
+
+    def open(self, player_ids: List[int]) -> List[int]:
+        pending = set()
+        for season, store in self.stores.items():
+            pending.update(store.open(self.player_ids_by_season[season]))
+        # a player is requested again if any of its seasons is missing it, and then
+        # only the seasons missing it take the response
+        return [player_id for player_id in player_ids if player_id in pending]
+
+    def add(self, item: dict) -> None:
+        stores = self.stores_by_player.get(item["player_id"], [])
+        for store in stores:
+            store.add(item)
+        if self.state is not None and stores and item["response"] is not None:
+            self.state.record(stores[0].label, item)
+
+    def close(self) -> None:
+        for store in self.stores.values():
+            store.close()
+
+async def fetch_players(session, player_ids: List[int], controllers: HostControllers,
+                        stores: Dict[str, ResponseStore], endpoints: Dict[str, str] = None) -> None:
+    """Fetch every endpoint for each player in a single pass, re-requesting the null responses.
+
+    The requests for all endpoints are fetched together, each host at its own pace, so
+    that the pass takes about as long as the slower endpoint rather than the sum of both.
+    Batch retries only re-request the failed pairs. Results go to the store of their
+    asset as they arrive.
 
     Args:
-        fetch_all: Coroutine function taking a list of player ids
-        player_ids (List): The players to request
-        label (str): Name of the asset, used for logging
-
-    Returns:
-        List[dict]: One response per requested player, in the original order
+        session (aiohttp.ClientSession): The aiohttp session
+        player_ids (List[int]): The players to request
+        controllers (HostControllers): Admit the requests to each host
+        stores (Dict[str, ResponseStore]): Store for each asset name, opened here
+        endpoints (Dict[str, str], optional): API URL for each asset name. It defaults to ENDPOINTS.
     """
-    results = asyncio.run(fetch_all(player_ids))
+    endpoints = endpoints or ENDPOINTS
+
+    pending = {label: set(stores[label].open(player_ids)) for label in endpoints}
+    labels, work = [], []
+    for player_id in player_ids:
+        for label, api in endpoints.items():
+            if player_id in pending[label]:
+                labels.append(label)
+                work.append((api, player_id))
+
+    logging.info(f"Requesting {len(work)} {', '.join(endpoints)} responses for {len(player_ids)} players")
+
+    failed = []
+
+    def on_result(position: int, item: dict) -> None:
+        if item["response"] is None:
+            failed.append(position)
+        stores[labels[position]].add(item)
+
+    await fetch_work(session, work, controllers, on_result)
 
     for attempt in range(MAX_BATCH_RETRIES):
-        null_ids = [item["player_id"] for item in results if item["response"] is None]
-        if not null_ids:
+        if not failed:
             break
         logging.warning(
             f"Batch retry {attempt + 1}/{MAX_BATCH_RETRIES}: "
-            f"{len(null_ids)} players with null {label} responses"
+            f"{len(failed)} requests with null responses"
+        )
+        positions = sorted(failed)
+        failed.clear()
+        await fetch_work(
+            session,
+            [work[position] for position in positions],
+            controllers,
+            lambda retry_position, item: on_result(positions[retry_position], item)
         )
-        retry_lookup = {item["player_id"]: item for item in asyncio.run(fetch_all(null_ids))}
-        results = [
-            retry_lookup.get(item["player_id"], item) if item["response"] is None else item
-            for item in results
-        ]
-
-    null_count = sum(1 for item in results if item["response"] is None)
-    logging.info(
-        f"{label} complete: {len(results)} total, {null_count} null responses remaining"
-    )
 
-    return results
+    for label in endpoints:
+        store = stores[label]
+        logging.info(
+            f"{label} complete: {len(store.completed) + len(store.null_ids)} total, "
+            f"{len(store.null_ids)} null responses remaining"
+        )
 
 def validate_responses(data: List[dict], path: str, label: str) -> None:
     """Check that an acquisition result is good enough to overwrite raw data.
@@ -238,17 +869,31 @@ def validate_responses(data: List[dict], path: str, label: str) -> None:
     Raises:
         RuntimeError: If the result is empty or too many responses are null.
     """
-    if not data:
+    null_count = sum(1 for item in data if item["response"] is None)
+    validate_counts(len(data), null_count, path, label)
+
+def validate_counts(total: int, null_count: int, path: str, label: str) -> None:
+    """The checks in validate_responses, from the number of responses and of null ones.
+
+    Args:
+        total (int): Number of responses
+        null_count (int): Number of null responses
+        path (str): Path the data would be written to, used in error messages
+        label (str): Name of the asset, used in log and error messages
+
+    Raises:
+        RuntimeError: If the result is empty or too many responses are null.
+    """
+    if not total:
         raise RuntimeError(
             f"{label} acquisition returned no records; refusing to overwrite {path}"
         )
 
-    null_count = sum(1 for item in data if item["response"] is None)
-    null_rate = null_count / len(data)
+    null_rate = null_count / total
 
     if null_rate > MAX_NULL_RESPONSE_RATE:
         raise RuntimeError(
-            f"{label} acquisition returned {null_count}/{len(data)} "
+            f"{label} acquisition returned {null_count}/{total} "
             f"({null_rate:.1%}) null responses, above the "
             f"{MAX_NULL_RESPONSE_RATE:.0%} threshold; refusing to overwrite {path}. "
             "This usually means the API blocked the run."
@@ -256,7 +901,7 @@ def validate_responses(data: List[dict], path: str, label: str) -> None:
 
     if null_count:
         logging.warning(
-            f"Persisting {label} with {null_count}/{len(data)} null responses "
+            f"Persisting {label} with {null_count}/{total} null responses "
             f"({null_rate:.1%})"
         )
 
@@ -276,46 +921,151 @@ def persist_data(data: List[dict], path: str, label: str) -> None:
     with open(path, "w") as f:
         f.writelines(json.dumps(item) + "\n" for item in data)
 
-def run_for_season(season: int, player_filter=None, club_filter=None, competition_filter=None) -> None:
-    """Run all steps for a given season.
+def target_paths(season: int) -> Dict[str, str]:
+    """Get the raw file of each asset for a season."""
+
+    return {
+        "market values": f"data/raw/transfermarkt-api/{season}/market_values.json",
+        "transfers": f"data/raw/transfermarkt-api/{season}/transfers.json",
+    }
+
+async def run_for_seasons(seasons: List[int], session, controllers: HostControllers,
+                          player_filter=None, club_filter=None, competition_filter=None,
+                          state: PlayerState = None) -> None:
+    """Run all steps for a set of seasons, requesting each player only once.
+
+    Each response holds the whole career of a player, so it is the same for every season
+    the player appears in. Players are requested once for the union of the seasons, and
+    each response is written to the raw files of all the seasons the player belongs to.
 
     Args:
-        season (int): The season to process
+        seasons (List[int]): The seasons to process
+        session (aiohttp.ClientSession): The session shared by every season
+        controllers (HostControllers): Limit the requests to each API host.
         player_filter: Optional set of player IDs to filter.
         club_filter: Optional set of club IDs to filter.
         competition_filter: Optional set of competition IDs to filter.
+        state (PlayerState, optional): In incremental runs, only the players due according to
+            the state are requested, and the others keep their response from the raw files.
+
+    Raises:
+        RuntimeError: If any of the seasons fails the checks in validate_responses. The
+            other seasons are persisted.
     """
-    target_market_values_path = f"data/raw/transfermarkt-api/{season}/market_values.json"
-    target_transfers_path = f"data/raw/transfermarkt-api/{season}/transfers.json"
+    logging.info(f"Starting player data acquisition for seasons {', '.join(map(str, seasons))}")
 
-    logging.info(f"Starting player data acquisition for season {season}")
+    player_ids_by_season = {}
+    for season in seasons:
+        # create target directories if they do not exist
+        for path in target_paths(season).values():
+            pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
 
-    # create target directories if they do not exist
-    pathlib.Path(target_market_values_path).parent.mkdir(parents=True, exist_ok=True)
-    pathlib.Path(target_transfers_path).parent.mkdir(parents=True, exist_ok=True)
+        # get player IDs for the season
+        player_ids_by_season[season] = get_player_ids(
+            season, player_filter=player_filter, club_filter=club_filter, competition_filter=competition_filter
+        )
 
-    # get player IDs for the season
-    player_ids = get_player_ids(season, player_filter=player_filter,
-                                club_filter=club_filter, competition_filter=competition_filter)
+    player_ids = list(dict.fromkeys(
+        player_id
+        for season_player_ids in player_ids_by_season.values()
+        for player_id in season_player_ids
+    ))
+    if len(seasons) > 1:
+        requested = sum(len(season_player_ids) for season_player_ids in player_ids_by_season.values())
+        logging.info(f"{len(player_ids)} distinct players across {len(seasons)} seasons, out of {requested}")
+
+    keep = set()
+    if state is not None:
+        signals = {}
+        for season in seasons:
+            # the latest season has the latest record of a player
+            signals.update(get_change_signals(season))
+        due = state.due({player_id: signals.get(player_id) for player_id in player_ids})
+        keep = set(player_ids) - due
+
+    season_stores = {
+        season: {label: ResponseStore(path, label, keep, season) for label, path in target_paths(season).items()}
+        for season in seasons
+    }
+    stores = {
+        label: FanOutStore(
+            {season: season_stores[season][label] for season in seasons},
+            player_ids_by_season,
+            state
+        )
+        for label in ENDPOINTS
+    }
 
-    # collect market values and transfers for players in SEASON
-    market_values = fetch_with_retries(get_market_values, player_ids, "market values")
+    # collect market values and transfers for the players in SEASONS in a single pass,
+    # streaming them to the partial files (resuming from them if a previous run left any)
+    try:
+        await fetch_players(session, player_ids, controllers, stores)
+    finally:
+        for store in stores.values():
+            store.close()
+
+    for host, controller in controllers.controllers.items():
+        logging.info(
+            f"Requests to {host} so far: {controller.successes} healthy, {controller.failures} failed, "
+            f"{controller.backoffs} back-offs, ending at {int(controller.limit)} concurrent requests"
+        )
+
+    failed_seasons = []
+    for season in seasons:
+        logging.info(f"Persisting market values and transfers for season {season}")
 
-    transfers = fetch_with_retries(get_transfers, player_ids, "transfers")
+        # check both before replacing either, so a failed run cannot leave one file
+        # updated and the other stale
+        try:
+            for store in season_stores[season].values():
+                store.finish()
+        except RuntimeError as e:
+            logging.error(f"Not persisting season {season}: {e}")
+            failed_seasons.append(season)
+            continue
 
-    # filter out player ids in responses that are not in the original list
-    transfers = [item for item in transfers if item["player_id"] in player_ids]
+        for store in season_stores[season].values():
+            store.commit()
+
+    if failed_seasons:
+        raise RuntimeError(
+            f"Acquisition failed for seasons {', '.join(map(str, failed_seasons))}; "
+            "their partial files are kept for the next run"
+        )
+
+    # only once every season is persisted, so the state never gets ahead of the raw files
+    if state is not None:
+        state.save()
+
+async def run_for_season(season: int, session, controllers: HostControllers, **kwargs) -> None:
+    """Run all steps for a given season.
 
-    logging.info(f"Persisting market values and transfers for season {season}")
+    Args:
+        season (int): The season to process
+        session (aiohttp.ClientSession): The session shared by every season
+        controllers (HostControllers): Limit the requests to each API host.
+        **kwargs: Player, club or competition filter and incremental state, as in `run_for_seasons`.
+    """
+    await run_for_seasons([season], session, controllers, **kwargs)
 
-    # check both before writing either, so a failed run cannot leave one file
-    # updated and the other stale
-    validate_responses(market_values, target_market_values_path, "market values")
-    validate_responses(transfers, target_transfers_path, "transfers")
+async def run(seasons: List[int], controllers: HostControllers, multi_season: bool = False,
+              state: PlayerState = None, **filters) -> None:
+    """Run the acquisition for every season in one event loop, over one connection pool.
 
-    # persist market values and transfers to files
-    persist_data(market_values, target_market_values_path, "market values")
-    persist_data(transfers, target_transfers_path, "transfers")
+    Args:
+        seasons (List[int]): The seasons to process
+        controllers (HostControllers): Limit the requests to each API host.
+        multi_season (bool, optional): Request each player once for all the seasons,
+            instead of once for every season they appear in.
+        state (PlayerState, optional): Only request the players due according to the state.
+        **filters: Player, club or competition filter, as in `run_for_seasons`.
+    """
+    async with create_session() as session:
+        if multi_season:
+            await run_for_seasons(seasons, session, controllers, state=state, **filters)
+        else:
+            for season in seasons:
+                await run_for_season(season, session, controllers, state=state, **filters)
 
 def main():
     """Parse arguments and run the acquisition for every requested season."""
@@ -342,6 +1092,36 @@ def main():
       help="Comma-separated player IDs to filter (e.g., 28003,1122196). Only fetches data for these players.",
       default=None
     )
+    parser.add_argument(
+      '--requests-per-second',
+      help="Highest rate at which requests to each API host are started.",
+      default=REQUESTS_PER_SECOND,
+      type=float
+    )
+    parser.add_argument(
+      '--max-concurrency',
+      help="Highest number of requests to each API host in flight at the same time.",
+      default=MAX_CONCURRENCY,
+      type=int
+    )
+
+    parser.add_argument(
+      '--multi-season',
+      help="Request each player once for all the seasons, instead of once for every season they appear in.",
+      action="store_true"
+    )
+    parser.add_argument(
+      '--incremental',
+      help="Only request the players whose market values or club changed in the scraper data since they were "
+           "last requested, or that were last requested more than --ttl-days ago.",
+      action="store_true"
+    )
+    parser.add_argument(
+      '--ttl-days',
+      help="In incremental runs, days after which a player is requested again regardless.",
+      default=INCREMENTAL_TTL_DAYS,
+      type=int
+    )
 
     parsed = parser.parse_args()
 
@@ -356,9 +1136,17 @@ def main():
 
     expanded_seasons = seasons_list(parsed.seasons)
 
-    for season in expanded_seasons:
-        run_for_season(season, player_filter=player_filter, club_filter=club_filter,
-                       competition_filter=competition_filter)
+    controllers = HostControllers(
+        requests_per_second=parsed.requests_per_second,
+        burst=max(int(parsed.requests_per_second), 1),
+        max_concurrency=parsed.max_concurrency
+    )
+
+    state = PlayerState(ttl_days=parsed.ttl_days) if parsed.incremental else None
+
+    asyncio.run(run(expanded_seasons, controllers, multi_season=parsed.multi_season, state=state,
+                    player_filter=player_filter, club_filter=club_filter,
+                    competition_filter=competition_filter))
 
 
 if __name__ == "__main__":
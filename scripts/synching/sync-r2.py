@@ -27,7 +27,11 @@ def sync_to_r2(prep_dir):
         aws_secret_access_key=os.environ["AWS_SECRET_ACCESS_KEY"],
     )
 
-    for filepath in sorted(glob.glob(os.path.join(prep_dir, "*.csv.gz"))):
+    prep_files = (
+        glob.glob(os.path.join(prep_dir, "*.csv.gz")) +
+        glob.glob(os.path.join(prep_dir, "*.parquet"))
+    )
+    for filepath in sorted(prep_files):
         filename = os.path.basename(filepath)
         key = f"{R2_PREFIX}/{filename}"
         print(f"  {filename} -> s3://{R2_BUCKET}/{key}")
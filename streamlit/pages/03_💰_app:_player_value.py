@@ -58,9 +58,6 @@ mart = player_valuations.merge(
     on="player_id"
 )
 
-# rows with invalid dates exist in the source data and should not define "latest" value
-mart["date"] = pd.to_datetime(mart["date"], errors="coerce")
-
 baselined_mart = mart[
     (mart["name"].isin(player_names))
 ]
@@ -70,6 +67,8 @@ baselined_mart = mart[
 st.header("Most valued Players")
 
 
+# rows with invalid dates exist in the source data and are loaded as NaT,
+# they should not define "latest" value
 most_valued_players = (
     baselined_mart[baselined_mart["date"].notna()]
         .sort_values(by="date")
@@ -19,15 +19,19 @@ st.markdown("""
 -----
 """)
 
-# pull up assets to be used in the calculations
-
-competitions = td.assets["cur_competitions"].prep_df
-club_games = td.assets["cur_club_games"].prep_df
-games = td.assets["cur_games"].prep_df.copy()
-clubs = td.assets["cur_clubs"].prep_df
-
-# TODO: it's kind of annoying that this does not come in with the correct type already
-games["season"] = pd.to_datetime(games["season"], format="%Y")
+# the filters only need the distinct values of a few columns, which are queried from
+# the prepared files rather than loading the assets
+
+competition_options = td.query(
+    "SELECT DISTINCT competition_id FROM competitions ORDER BY competition_id"
+)["competition_id"]
+seasons_range = td.query(
+    "SELECT min(season) AS first_season, max(season) AS last_season FROM games"
+).iloc[0]
+manager_options = td.query(
+    "SELECT DISTINCT own_manager_name FROM club_games "
+    "WHERE own_manager_name IS NOT NULL ORDER BY own_manager_name"
+)["own_manager_name"]
 
 # define the set of leagues to be used in the app
 
@@ -45,15 +49,14 @@ with st.expander("Baseline Filters"):
 
     competition_ids = col1.multiselect(
         "Domestic competition IDs",
-        options=competitions["competition_id"].unique(),
+        options=competition_options,
         default=DEFAULT_COMPETITIONS
     )
 
-    all_seasons = games["season"].dt.year.unique()
     seasons_limits = col2.slider(
         label="Seasons",
-        min_value=int(min(all_seasons)),
-        max_value=int(max(all_seasons)),
+        min_value=int(seasons_range["first_season"]),
+        max_value=int(seasons_range["last_season"]),
         step=1,
         value=DEFAULT_SEASONS
     )
@@ -61,7 +64,7 @@ with st.expander("Baseline Filters"):
 
     managers = col1.multiselect(
         label="Managers",
-        options=club_games["own_manager_name"].unique(),
+        options=manager_options,
         default=DEFAULT_MANAGERS
     )
 
@@ -70,29 +73,22 @@ with st.expander("Baseline Filters"):
     )
 
 # create a data mart with all required measures and dimensions
-# for the base mart we use a "club game" granularity
-
-mart = club_games.merge(
-        games,
-        how="left",
-        on="game_id"
-    ).merge(
-        clubs[["club_id", "name", "domestic_competition_id"]].rename(
-            columns={
-                "name": "club_name",
-                "domestic_competition_id": "club_domestic_competition_id"
-            }
-        ),
-        how="left",
-        on="club_id"
-    )
-
-baselined_mart = mart[
-    (mart["season"].dt.year.isin(seasons)) &
-    (mart["club_domestic_competition_id"].isin(competition_ids)) & 
-    (mart["own_manager_name"].isin(managers)) &
-    (mart["competition_type"].isin(DEFAULT_COMPETITION_TYPES))
-]
+# for the base mart we use a "club game" granularity, and the baseline filters
+# are pushed down to each asset before joining
+
+baselined_mart = td.join(
+    "cur_club_games", "cur_games", "cur_clubs",
+    columns=[
+        "cur_clubs.name", "season", "own_manager_name", "competition_type", "is_win"
+    ],
+    where=[
+        ("season", "in", seasons),
+        ("cur_clubs.domestic_competition_id", "in", competition_ids),
+        ("own_manager_name", "in", managers),
+        ("competition_type", "in", DEFAULT_COMPETITION_TYPES)
+    ]
+).rename(columns={"name": "club_name"})
+baselined_mart["season"] = pd.to_datetime(baselined_mart["season"], format="%Y")
 
 # manager perfomance is evaluated on its win percentage
 # we want to calculate manages win percentage by season and competition type
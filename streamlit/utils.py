@@ -16,9 +16,10 @@ sys.path.insert(0, cwd)
 from transfermarkt_datasets.core.dataset import Dataset
 from transfermarkt_datasets.core.asset import Asset
 
-@st.cache_data
+@st.cache_resource
 def load_td() -> Dataset:
     """Instantiate and initialise a Dataset, so it can be used in the app.
+    Assets are loaded lazily, the first time a page accesses them.
 
     Returns:
         Dataset: A transfermark_datasets.core.Dataset that is initialised and ready to be used.
@@ -27,8 +28,7 @@ def load_td() -> Dataset:
     if os.environ["STREAMLIT"] == "cloud":
         os.system("dvc pull data/prep")
 
-    td = Dataset()
-    td.load_assets()
+    td = Dataset(lazy=True)
 
     return td
 
@@ -128,7 +128,7 @@ def draw_asset_explore(asset: Asset) -> None:
             options=options,
             key=(asset.name + "-" + at_col)
         )
-        if selected:
+        if not pd.isna(selected) and selected != "":
             df = df[df[at_col] == selected]
 
     MAX_DF_LENGTH = 20
@@ -204,8 +204,7 @@ def get_records_delta(asset: Asset, offset: int = 7) -> int:
     df = asset.prep_df
 
     if "date" in df.columns:
-        dt = pd.to_datetime(df["date"])
-        delta = len(df[dt > (datetime.now() - timedelta(days=offset))])
+        delta = len(df[df["date"] > (datetime.now() - timedelta(days=offset))])
         return delta
     else:
         return None
@@ -1,5 +1,3 @@
-from frictionless import checks
-
 import pandas as pd
 
 from transfermarkt_datasets.core.asset import Asset
@@ -33,8 +31,8 @@ class CurAppearancesAsset(Asset):
           description="ID of the club that the player currently belongs to."
         ),
         Field(name="date", type="date", tags=["explore"]),
-        Field(name="player_name", type="string", tags=["explore"]),
-        Field(name="competition_id", type="string"),
+        Field(name="player_name", type="string", tags=["explore", "entity_name"]),
+        Field(name="competition_id", type="string", tags=["categorical"]),
         Field(name="yellow_cards", type="integer"),
         Field(name="red_cards", type="integer"),
         Field(name="goals", type="integer"),
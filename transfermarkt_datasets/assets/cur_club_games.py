@@ -1,5 +1,4 @@
 from typing import List
-from frictionless import checks
 
 from datetime import datetime
 
@@ -41,14 +40,15 @@ class CurClubGamesAsset(Asset):
     self.schema.add_field(Field(name='game_id', type='integer'))
     self.schema.add_field(Field(name='own_goals', type='integer'))
     self.schema.add_field(Field(name='own_position', type='integer'))
-    self.schema.add_field(Field(name='own_manager_name', type="string", tags=["explore"]))
+    self.schema.add_field(Field(name='own_manager_name', type="string", tags=["explore", "entity_name"]))
     self.schema.add_field(Field(name='opponent_id', type='integer'))
     self.schema.add_field(Field(name='opponent_goals', type='integer'))
     self.schema.add_field(Field(name='opponent_position', type='integer'))
-    self.schema.add_field(Field(name='opponent_manager_name', type='string'))
+    self.schema.add_field(Field(name='opponent_manager_name', type='string', tags=["entity_name"]))
     self.schema.add_field(Field(
       name="hosting",
       type="string",
+      tags=["categorical"],
       description="'Home' if the game took place at the club home stadium and 'Away' if at its opponent stadium"
     ))
     self.schema.add_field(Field(
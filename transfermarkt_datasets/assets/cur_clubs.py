@@ -1,5 +1,3 @@
-from frictionless import checks
-
 from datetime import datetime
 
 import pandas as pd
@@ -23,8 +21,8 @@ class CurClubsAsset(Asset):
 
     self.schema.add_field(Field(name='club_id', type='integer'))
     self.schema.add_field(Field(name='club_code', type='string'))
-    self.schema.add_field(Field(name='name', type='string'))
-    self.schema.add_field(Field(name='domestic_competition_id', type='string', tags=["explore"]))
+    self.schema.add_field(Field(name='name', type='string', tags=["entity_name"]))
+    self.schema.add_field(Field(name='domestic_competition_id', type='string', tags=["explore", "categorical"]))
     self.schema.add_field(Field(
         name='total_market_value',
         type='number',
@@ -39,7 +37,7 @@ class CurClubsAsset(Asset):
     self.schema.add_field(Field(name='stadium_name', type='string'))
     self.schema.add_field(Field(name='stadium_seats', type='integer'))
     self.schema.add_field(Field(name='net_transfer_record', type='string'))
-    self.schema.add_field(Field(name='coach_name', type='string'))
+    self.schema.add_field(Field(name='coach_name', type='string', tags=["entity_name"]))
     self.schema.add_field(Field(
       name='url',
       type='string',
@@ -18,7 +18,7 @@ class CurCountriesAsset(RawAsset):
                 Field(name="country_id", type="integer"),
                 Field(name="country_name", type="string", tags=["explore"]),
                 Field(name="country_code", type="string"),
-                Field(name="confederation", type="string"),
+                Field(name="confederation", type="string", tags=["categorical"]),
                 Field(name="total_clubs", type="integer"),
                 Field(name="total_players", type="integer"),
                 Field(name="url", type="string", form="uri"),
@@ -23,11 +23,11 @@ class CurGameLineupsAsset(Asset):
         Field(name='game_id', type='integer'),
         Field(name='player_id', type='integer'),
         Field(name='club_id', type='integer'),
-        Field(name='type', type='string'),
-        Field(name='player_name', type='string'),
-        Field(name='team_captain', type='string'),
-        Field(name='number', type='string'),
-        Field(name='position', type='string'),
+        Field(name='type', type='string', tags=["categorical"]),
+        Field(name='player_name', type='string', tags=["entity_name"]),
+        Field(name='team_captain', type='string', tags=["categorical"]),
+        Field(name='number', type='string', tags=["categorical"]),
+        Field(name='position', type='string', tags=["categorical"]),
         Field(name='date', type='date'),
       ]
     )
@@ -1,5 +1,3 @@
-from frictionless import checks
-
 from transfermarkt_datasets.core.asset import Asset
 from transfermarkt_datasets.core.schema import Schema, Field
 class CurGamesAsset(Asset):
@@ -17,10 +15,10 @@ class CurGamesAsset(Asset):
     self.schema = Schema(
       fields=[
         Field(name='game_id', type='integer'),
-        Field(name='competition_id', type='string', tags=["explore"]),
-        Field(name='competition_type', type='string'),
+        Field(name='competition_id', type='string', tags=["explore", "categorical"]),
+        Field(name='competition_type', type='string', tags=["categorical"]),
         Field(name='season', type='integer', tags=["explore"]),
-        Field(name='round', type='string', tags=["explore"]),
+        Field(name='round', type='string', tags=["explore", "categorical"]),
         Field(name='date', type='date', tags=["explore"]),
         Field(name='home_club_id', type='integer'),
         Field(name='away_club_id', type='integer'),
@@ -29,12 +27,12 @@ class CurGamesAsset(Asset):
         Field(name='aggregate', type='string'),
         Field(name='home_club_position', type='integer'),
         Field(name='away_club_position', type='integer'),
-        Field(name='home_club_name', type='string', tags=["explore"]),
-        Field(name='away_club_name', type='string', tags=["explore"]),
-        Field(name='home_club_manager_name', type='string'),
-        Field(name='away_club_manager_name', type='string'),
-        Field(name='home_club_formation', type='string'),
-        Field(name='away_club_formation', type='string'),
+        Field(name='home_club_name', type='string', tags=["explore", "categorical", "entity_name"]),
+        Field(name='away_club_name', type='string', tags=["explore", "categorical", "entity_name"]),
+        Field(name='home_club_manager_name', type='string', tags=["entity_name"]),
+        Field(name='away_club_manager_name', type='string', tags=["entity_name"]),
+        Field(name='home_club_formation', type='string', tags=["categorical"]),
+        Field(name='away_club_formation', type='string', tags=["categorical"]),
         Field(name='stadium', type='string'),
         Field(name='attendance', type='integer'),
         Field(name='referee', type='string'),
@@ -19,7 +19,7 @@ class CurNationalTeamsAsset(RawAsset):
                 Field(name="name", type="string", tags=["explore"]),
                 Field(name="country_id", type="integer"),
                 Field(name="country_name", type="string"),
-                Field(name="confederation", type="string"),
+                Field(name="confederation", type="string", tags=["categorical"]),
                 Field(name="squad_size", type="integer"),
                 Field(
                     name="total_market_value",
@@ -1,5 +1,3 @@
-from frictionless import checks
-
 import pandas as pd
 
 from transfermarkt_datasets.core.asset import Asset
@@ -21,13 +19,13 @@ class CurPlayerValuationsAsset(Asset):
       fields=[
         Field(name='date', type='date'),
         Field(name='player_id', type='integer'),
-        Field(name='current_club_name', type='string'),
+        Field(name='current_club_name', type='string', tags=["categorical", "entity_name"]),
         Field(name='current_club_id', type='integer'),
         Field(name='market_value_in_eur', type='number'),
         Field(
           name='player_club_domestic_competition_id',
           type='string',
-          tags=["explore"]
+          tags=["explore", "categorical"]
         )
       ]
     )
@@ -1,5 +1,3 @@
-from frictionless import checks
-
 import pandas as pd
 import numpy as np
 
@@ -24,16 +22,16 @@ class CurPlayersAsset(RawAsset):
     self.schema = Schema(
       fields=[
         Field(name="player_id", type="integer"),
-        Field(name="name", type="string"),
+        Field(name="name", type="string", tags=["entity_name"]),
         Field(name="current_club_id", type="integer"),
-        Field(name="current_club_name", type="string", tags=["explore"]),
-        Field(name="country_of_citizenship", type="string"),
-        Field(name="country_of_birth", type="string"),
+        Field(name="current_club_name", type="string", tags=["explore", "categorical", "entity_name"]),
+        Field(name="country_of_citizenship", type="string", tags=["categorical"]),
+        Field(name="country_of_birth", type="string", tags=["categorical"]),
         Field(name="city_of_birth", type="string"),
         Field(name="date_of_birth", type="date"),
-        Field(name="position", type="string"),
-        Field(name="sub_position", type="string"),
-        Field(name="foot", type="string"),
+        Field(name="position", type="string", tags=["categorical"]),
+        Field(name="sub_position", type="string", tags=["categorical"]),
+        Field(name="foot", type="string", tags=["categorical"]),
         Field(name="height_in_cm", type="integer"),
         Field(
           name="market_value_in_eur",
@@ -47,7 +45,7 @@ class CurPlayersAsset(RawAsset):
         ),
         Field(name="agent_name", type="string"),
         Field(name="contract_expiration_date", type="date"),
-        Field(name="current_club_domestic_competition_id", type="string"),
+        Field(name="current_club_domestic_competition_id", type="string", tags=["categorical"]),
         Field(name="first_name", type="string"),
         Field(name="last_name", type="string"),
         Field(name="player_code", type="string"),
@@ -68,5 +66,5 @@ class CurPlayersAsset(RawAsset):
     self.schema.primary_key = ["player_id"]
     self.schema.foreign_keys = [
       {"fields": "current_club_id", "reference": {"resource": "cur_clubs", "fields": "club_id"}},
-      {"fields": "domestic_competition_id", "reference": {"resource": "cur_competition", "fields": "competition_id"}},
+      {"fields": "current_club_domestic_competition_id", "reference": {"resource": "cur_competitions", "fields": "competition_id"}},
     ]
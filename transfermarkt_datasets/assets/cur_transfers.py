@@ -1,5 +1,3 @@
-from frictionless import checks
-
 from transfermarkt_datasets.core.asset import RawAsset
 from transfermarkt_datasets.core.schema import Schema, Field
 
@@ -18,13 +16,13 @@ class CurTransfersAsset(RawAsset):
         self.schema = Schema(
             fields=[
                 Field(name="player_id", type="integer"),
-                Field(name="player_name", type="string"),
+                Field(name="player_name", type="string", tags=["entity_name"]),
                 Field(name="transfer_date", type="date"),
-                Field(name="transfer_season", type="string"),
+                Field(name="transfer_season", type="string", tags=["categorical"]),
                 Field(name="from_club_id", type="integer"),
                 Field(name="to_club_id", type="integer"),
-                Field(name="from_club_name", type="string", tags=["explore"]),
-                Field(name="to_club_name", type="string", tags=["explore"]),
+                Field(name="from_club_name", type="string", tags=["explore", "categorical", "entity_name"]),
+                Field(name="to_club_name", type="string", tags=["explore", "categorical", "entity_name"]),
                 Field(
                     name="transfer_fee",
                     type="number",
@@ -1,16 +1,38 @@
-from frictionless import Detector
-from frictionless.resource import Resource
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from typing import TYPE_CHECKING, Dict, Iterator, List, Union
+
 import pandas as pd
 import logging
 import logging.config
+import os
+import uuid
 
+from transfermarkt_datasets.core.compact import compact_dataframe
+from transfermarkt_datasets.core.index import KeyIndex
+from transfermarkt_datasets.core.profile import profile_chunks, read_profile, write_profile
 from transfermarkt_datasets.core.schema import Schema
+from transfermarkt_datasets.core.validation import (
+  DEFAULT_CHUNKSIZE,
+  DEFAULT_MAX_ERRORS,
+  validate_file
+)
+
+if TYPE_CHECKING:
+  from frictionless.resource import Resource
 
 from transfermarkt_datasets.core.utils import (
+  Filters,
+  concat_preallocated,
+  read_json_lines,
   read_config,
-  get_sample_values
+  get_filters_columns,
+  filter_dataframe,
+  normalize_filters
 )
 
+DEFAULT_PROFILE_CHUNKSIZE = 100_000
+
 class FailedAssetValidation(Exception):
   pass
 
@@ -26,10 +48,33 @@ class Asset:
 
   def __init__(
     self,
-    settings: dict = None) -> None:
+    settings: dict = None,
+    lazy: bool = False) -> None:
 
       self._prep_df = None
       self.settings = settings
+      self.lazy = lazy
+      self.cache = None
+      # dictionary-encode categorical fields and downcast integers on load
+      self.compact = False
+      # entity names are encoded through a dictionary shared with other assets, if set
+      self.string_pool = None
+      self._string_pool_version = None
+
+      # a dataset snapshot holding this asset, read instead of the prepared file if set
+      self.snapshot = None
+
+      # fingerprint of the prepared file that prep_df was loaded from, and how it was loaded
+      self.loaded_fingerprint = None
+      self._load_options = {}
+      self._profile = None
+      # tells apart the dataframes assigned to prep_df, which do not come from the file
+      self._assigned_token = None
+
+      # key indexes over prep_df, which can be persisted next to the cache entry
+      # only while prep_df holds the full, unfiltered contents of that entry
+      self._indexes = {}
+      self._indexes_persistable = False
       self.log = logging.getLogger("main")
       self.prep_location = "data/prep"
       self.datapackage_descriptor_path = f"{self.prep_location}/dataset-metadata.json"
@@ -40,23 +85,53 @@ class Asset:
 
       self.schema = Schema()
 
+  def __getstate__(self) -> dict:
+    # the string pool is shared with the other assets in the process, a copy sent to a
+    # worker process would not be, so assets are sent without it and their entity names
+    # are encoded back in the parent
+    state = self.__dict__.copy()
+    state["string_pool"] = None
+    state["_string_pool_version"] = None
+    return state
+
   def __str__(self) -> str:
       return f'Asset(name={self.name})'
 
   @property
   def prep_df(self):
+    if self._prep_df is None and self.lazy:
+      self.log.debug("Lazily loading %s from prep", self.name)
+      self.load_from_prep()
+
+    # the shared dictionary grew since prep_df was encoded, move it to the new dtype
+    if (self._prep_df is not None and self.string_pool is not None
+        and self._string_pool_version != self.string_pool.version):
+      # taken before encoding, so that values added meanwhile by another asset are seen as new
+      version = self.string_pool.version
+      self._prep_df = self.string_pool.encode(self._prep_df, self.schema.entity_name_field_names)
+      self._string_pool_version = version
+
     return self._prep_df
 
+  @property
+  def is_loaded(self) -> bool:
+    """Whether the prepared dataframe has been materialized already.
+    Unlike accessing `prep_df`, checking this never triggers a load.
+    """
+    return self._prep_df is not None
+
   @prep_df.setter
   def prep_df(self, df):
 
     df_type = type(df)
     if df_type != pd.DataFrame:
       raise InvalidPreparedDF(f"Invalid df type: {df_type}")
-    else:
-      df_cols = list(df.columns.values)
+
+    field_names = self.schema.field_names
+    df_cols = list(df.columns.values)
+    if df_cols != field_names:
       df_cols_set = set(df_cols)
-      schema_cols_set = set(self.schema.field_names)
+      schema_cols_set = set(field_names)
       set_difference = (df_cols_set - schema_cols_set).union(
         schema_cols_set - df_cols_set
       )
@@ -64,9 +139,16 @@ class Asset:
         raise InvalidPreparedDF(
           f"{self.name}: fields do not match provided schema: {set_difference}"
         )
+      # reorder the columns into a new frame over the same arrays, rather than copying them
+      df = pd.DataFrame({name: df[name] for name in field_names}, copy=False)
 
-    field_names = self.schema.field_names
-    self._prep_df = df[field_names]
+    self._prep_df = df
+    self._indexes = {}
+    self._indexes_persistable = False
+    self._string_pool_version = None
+    self.loaded_fingerprint = None
+    self._assigned_token = uuid.uuid4().hex
+    self._profile = None
 
   @property
   def file_name(self) -> str:
@@ -80,17 +162,399 @@ class Asset:
   def prep_path(self) -> str:
     return f"{self.prep_location}/{self.file_name}"
 
+  @property
+  def parquet_file_name(self) -> str:
+    return self.file_name.replace(".csv.gz", "").replace(".csv", "") + ".parquet"
+
+  @property
+  def parquet_path(self) -> str:
+    return f"{self.prep_location}/{self.parquet_file_name}"
+
   @property
   def frictionless_resource_name(self) -> str:
     return self.file_name_uncompressed.replace(".csv", "")
 
-  def load_from_prep(self):
+  def load_from_prep(self, columns: List[str] = None, filters: Filters = None, engine: str = None):
     """Load prepared dataset from the local to a pandas dataframe.
+
+    Args:
+        columns (List[str], optional): Only load these fields. It defaults to all fields in the schema.
+        filters (Filters, optional): Only load rows matching these pyarrow-style filters.
+        engine (str, optional): The CSV parser to be used by pandas ("c", "python" or "pyarrow").
+          It is ignored when reading from Parquet.
+
+    Raises:
+        InvalidPreparedDF: If any of the requested columns is not a field in the schema.
     """
-    self.prep_df = pd.read_csv(
-      filepath_or_buffer=self.prep_path
+    if columns is not None:
+      unknown_columns = set(columns) - set(self.schema.field_names)
+      if unknown_columns:
+        raise InvalidPreparedDF(
+          f"{self.name}: fields do not match provided schema: {unknown_columns}"
+        )
+
+    # taken before reading, so that a file replaced during the read is seen as changed
+    fingerprint = self.prep_fingerprint()
+    string_pool_version = self.string_pool.version if self.string_pool is not None else None
+
+    df = self.read_prep(columns=columns, filters=filters, engine=engine)
+
+    if columns is None:
+      self.prep_df = df
+      self._indexes_persistable = self.cache is not None and not filters
+    else:
+      # a projection is a valid subset of the schema, keep it in schema order
+      self._prep_df = df[[name for name in self.schema.field_names if name in columns]]
+      self._indexes = {}
+      self._indexes_persistable = False
+      self._profile = None
+
+    self._string_pool_version = string_pool_version
+
+    self.loaded_fingerprint = fingerprint
+    self._load_options = dict(columns=columns, filters=filters, engine=engine)
+
+  def prep_fingerprint(self) -> Dict:
+    """Fingerprint the prepared file that the asset reads from.
+
+    With a cache, the fingerprint includes the content hash, which the cache only
+    recomputes for modified files. Otherwise, it is the size and modification time.
+
+    Returns:
+        Dict: The "path" of the file and its "size", "mtime_ns" and, with a cache, "sha256".
+    """
+    read_path = self.read_path
+    if self.cache is not None:
+      fingerprint = dict(self.cache.fingerprint(read_path))
+    else:
+      stat = os.stat(read_path)
+      fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    fingerprint["path"] = read_path
+    return fingerprint
+
+  @property
+  def memory_version(self) -> str:
+    """What sets the loaded `prep_df` apart from the contents of the prepared file: a token
+    of the dataframe if it was assigned rather than loaded, or the filters it was loaded
+    with. It is None if the asset is not loaded or holds the file contents.
+    """
+    if not self.is_loaded:
+      return None
+    if self.loaded_fingerprint is None:
+      return f"assigned:{self._assigned_token}"
+    if self._load_options.get("filters"):
+      return f"filters:{normalize_filters(self._load_options['filters'])}"
+    return None
+
+  def has_changed(self) -> bool:
+    """Whether the prepared file changed since `prep_df` was loaded from it.
+    Files that were only touched are not seen as changed when content hashes are available.
+    """
+    if self.loaded_fingerprint is None or not os.path.exists(self.read_path):
+      return False
+
+    loaded, current = self.loaded_fingerprint, self.prep_fingerprint()
+    if loaded["path"] != current["path"]:
+      return True
+    if "sha256" in loaded and "sha256" in current:
+      return loaded["sha256"] != current["sha256"]
+    return (loaded["size"], loaded["mtime_ns"]) != (current["size"], current["mtime_ns"])
+
+  def reload(self) -> None:
+    """Load the asset again from the prepared file, with the same columns and filters as the last load.
+    The new dataframe replaces the current one only once it is fully read.
+    """
+    self.load_from_prep(**self._load_options)
+
+  def read_prep(self, columns: List[str] = None, filters: Filters = None, engine: str = None) -> pd.DataFrame:
+    """Read the prepared file into a dataframe typed after the asset schema.
+
+    The Parquet file is preferred when it exists, so that the projection and the
+    filters are pushed down to the reader. Otherwise the gzipped CSV is read and
+    filtered after parsing. Either way, column types are taken from the schema
+    rather than inferred, and date fields are parsed into datetimes (invalid dates
+    become NaT). Filter values on date fields should be given as `pd.Timestamp`.
+    In `compact` mode, categorical fields are dictionary-encoded and integer fields
+    downcast to the narrowest type that holds their values.
+
+    If the asset has a `snapshot` or a `cache`, the data is read from there instead. If
+    it has a `string_pool`, entity name fields are encoded through it.
+
+    Args:
+        columns (List[str], optional): Only read these columns.
+        filters (Filters, optional): Only read rows matching these pyarrow-style filters.
+        engine (str, optional): The CSV parser to be used by pandas.
+
+    Returns:
+        pd.DataFrame: The prepared dataframe.
+    """
+    if self.snapshot is not None:
+      df = self.snapshot.read(self.name, columns=columns, filters=filters)
+      if self.compact:
+        df = compact_dataframe(df, self.schema)
+    elif self.cache is not None:
+      df = self.cache.read(
+        source_path=self.source_path,
+        build=lambda: self._read_prep_file(engine=engine),
+        salt=self.cache_salt,
+        columns=columns,
+        filters=filters
+      )
+    else:
+      df = self._read_prep_file(columns=columns, filters=filters, engine=engine)
+
+    if self.string_pool is not None:
+      df = self.string_pool.encode(df, self.schema.entity_name_field_names)
+
+    return df
+
+  @property
+  def source_path(self) -> str:
+    """The prepared file that the asset is read from, Parquet if available.
+    """
+    if os.path.exists(self.parquet_path):
+      return self.parquet_path
+    else:
+      return self.prep_path
+
+  @property
+  def read_path(self) -> str:
+    """The file that the asset is actually read from, the snapshot if set or `source_path` otherwise.
+    """
+    if self.snapshot is not None:
+      return self.snapshot.path
+    return self.source_path
+
+  @property
+  def schema_signature(self) -> str:
+    return ",".join(
+      f"{field.name}:{field.type}" for field in self.schema.fields
+    )
+
+  @property
+  def cache_salt(self) -> str:
+    """Key material for the cache entries, which depend on the schema and the loading mode.
+    """
+    if self.compact:
+      return self.schema_signature + ":compact"
+    return self.schema_signature
+
+  def _read_prep_file(self, columns: List[str] = None, filters: Filters = None, engine: str = None) -> pd.DataFrame:
+    from_parquet = os.path.exists(self.parquet_path)
+
+    if from_parquet:
+      df = pd.read_parquet(
+        self.parquet_path,
+        columns=columns,
+        filters=filters
+      )
+      dtypes = {
+        name: dtype for name, dtype in self.schema.pandas_dtypes.items()
+        if name in df.columns
+      }
+      df = df.astype(dtypes)
+    else:
+      usecols = None
+      if columns is not None:
+        usecols = list(columns) + [
+          column for column in get_filters_columns(filters)
+          if column not in columns
+        ]
+      df = pd.read_csv(
+        filepath_or_buffer=self.prep_path,
+        usecols=usecols,
+        dtype=self.schema.pandas_dtypes,
+        engine=engine
+      )
+
+    df = self._parse_dates(df)
+
+    if not from_parquet and filters:
+      df = filter_dataframe(df, filters).reset_index(drop=True)
+      if columns is not None:
+        df = df[list(columns)]
+
+    if self.compact:
+      df = compact_dataframe(df, self.schema)
+
+    return df
+
+  def _parse_dates(self, df: pd.DataFrame) -> pd.DataFrame:
+    for field_name in self.schema.date_field_names:
+      if field_name in df.columns and not pd.api.types.is_datetime64_any_dtype(df[field_name]):
+        df[field_name] = pd.to_datetime(
+          df[field_name],
+          format="ISO8601",
+          errors="coerce"
+        )
+    return df
+
+  def iter_prep_chunks(self, chunksize: int = DEFAULT_PROFILE_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Read the prepared data in chunks of up to `chunksize` rows, typed after the schema.
+    Only one chunk is held in memory at a time.
+    """
+    if self.snapshot is not None:
+      for batch in self.snapshot.table(self.name).to_batches(max_chunksize=chunksize):
+        yield batch.to_pandas()
+    elif os.path.exists(self.parquet_path):
+      import pyarrow.parquet as pq
+
+      for batch in pq.ParquetFile(self.parquet_path).iter_batches(batch_size=chunksize):
+        df = batch.to_pandas()
+        dtypes = {
+          name: dtype for name, dtype in self.schema.pandas_dtypes.items()
+          if name in df.columns
+        }
+        yield self._parse_dates(df.astype(dtypes))
+    else:
+      chunks = pd.read_csv(
+        filepath_or_buffer=self.prep_path,
+        dtype=self.schema.pandas_dtypes,
+        chunksize=chunksize
+      )
+      for df in chunks:
+        yield self._parse_dates(df)
+
+  @property
+  def profile_path(self) -> str:
+    return f"{self.prep_location}/{self.frictionless_resource_name}.profile.json"
+
+  def profile(self, chunksize: int = DEFAULT_PROFILE_CHUNKSIZE) -> Dict[str, Dict]:
+    """Profile the asset fields: null counts, min and max, approximate distinct counts,
+    top values, a random sample and the first distinct values.
+
+    The profile is computed in a single pass over the data, in chunks. Profiles of the
+    prepared file are persisted next to it, and reused for as long as the file does
+    not change. The prepared dataframe is profiled instead when it is loaded, and
+    only persisted if it holds the full contents of the file.
+
+    Args:
+        chunksize (int, optional): How many rows to profile at a time.
+
+    Returns:
+        Dict[str, Dict]: The profile of each field in the schema.
+    """
+    if self._profile is not None:
+      return self._profile
+
+    fingerprint = None
+    if not self.is_loaded:
+      fingerprint = self.prep_fingerprint()
+    elif not self._load_options.get("columns") and not self._load_options.get("filters"):
+      fingerprint = self.loaded_fingerprint
+
+    profile = None
+    if fingerprint is not None:
+      profile = read_profile(self.profile_path, fingerprint)
+
+    if profile is None:
+      if self.is_loaded:
+        df = self._prep_df
+        chunks = (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+      else:
+        chunks = self.iter_prep_chunks(chunksize)
+      profile = profile_chunks(chunks, self.schema.field_names)
+
+      if fingerprint is not None and os.path.isdir(self.prep_location):
+        write_profile(self.profile_path, fingerprint, profile)
+
+    self._profile = profile
+    return profile
+
+  def get_index(self, columns: Union[str, List[str]]) -> KeyIndex:
+    """Get an index over some key columns of the prepared dataframe, building it on first use.
+
+    When the asset was fully loaded through a cache, the index is also persisted next
+    to the cache entry, so later processes load it instead of building it again.
+
+    Args:
+        columns (Union[str, List[str]]): The key columns to be indexed.
+
+    Returns:
+        KeyIndex: The index.
+    """
+    if isinstance(columns, str):
+      columns = [columns]
+
+    # access prep_df first, in case a lazy load resets the indexes
+    df = self.prep_df
+
+    key = tuple(columns)
+    if key not in self._indexes:
+      index_path = None
+      if self._indexes_persistable:
+        index_path = self.cache.index_path(self.source_path, columns, self.cache_salt)
+
+      if index_path and os.path.exists(index_path):
+        index = KeyIndex.load(index_path)
+      else:
+        index = KeyIndex.build(df, columns)
+        if index_path:
+          index.save(index_path)
+
+      self._indexes[key] = index
+
+    return self._indexes[key]
+
+  def get(self, key) -> pd.Series:
+    """Get the row with a given primary key, for example `players.get(28003)`.
+
+    Args:
+        key: The primary key value, or a tuple of values for composite primary keys.
+
+    Raises:
+        KeyError: If there is no row with that key.
+
+    Returns:
+        pd.Series: The row.
+    """
+    positions = self.get_index(self.schema.primary_key).lookup(key)
+    if len(positions) == 0:
+      raise KeyError(key)
+    return self.prep_df.iloc[positions[0]]
+
+  def rows_for(self, column: Union[str, List[str]], value) -> pd.DataFrame:
+    """Get the rows with a given value in a key column, for example `appearances.rows_for("game_id", 2229332)`.
+
+    Args:
+        column (Union[str, List[str]]): The key column, usually a foreign key.
+        value: The value to look up, or a tuple of values if `column` is a list.
+
+    Returns:
+        pd.DataFrame: The matching rows, in their original order.
+    """
+    positions = self.get_index(column).lookup(value)
+    return self.prep_df.iloc[positions]
+
+  def validate_prep(self, chunksize: int = DEFAULT_CHUNKSIZE, max_errors: int = DEFAULT_MAX_ERRORS) -> Dict:
+    """Validate every row in the prepared file against the asset schema, in chunks.
+
+    Args:
+        chunksize (int, optional): How many rows to hold in memory at a time.
+        max_errors (int, optional): How many errors to keep in the report. All errors are counted.
+
+    Returns:
+        Dict: A frictionless report task descriptor for the prepared file.
+    """
+    return validate_file(
+      path=self.prep_path,
+      schema=self.schema,
+      name=self.frictionless_resource_name,
+      chunksize=chunksize,
+      max_errors=max_errors
     )
 
+  def memory_usage(self) -> pd.Series:
+    """Get the memory held by each column of the prepared dataframe, in bytes.
+    String and categorical columns are measured deep, including the values they point to.
+
+    Returns:
+        pd.Series: Bytes per column, plus the index. Empty if the asset is not loaded.
+    """
+    if not self.is_loaded:
+      return pd.Series(dtype="int64")
+    return self._prep_df.memory_usage(index=True, deep=True)
+
   def load_from_stage(self):
     self.prep_df = pd.read_csv(
       filepath_or_buffer=self.stage_path
@@ -102,33 +566,47 @@ class Asset:
       index=False
     )
 
-  def schema_as_dataframe(self) -> pd.DataFrame:
+  def schema_as_dataframe(self, with_profile: bool = False) -> pd.DataFrame:
     """Render the asset schema as a pandas dataframe.
 
+    Sample values are taken from the asset profile, so the data is only scanned the first
+    time and not on every render.
+
+    Args:
+        with_profile (bool, optional): Add the null count, approximate distinct count, min and max of each field.
+
     Returns:
         pd.DataFrame: A pandas dataframe representing the asset schema.
     """
+    profile = self.profile()
 
     fields = [field.name for field in  self.schema.fields]
     types = [field.type for field in  self.schema.fields]
     descriptions = [field.description for field in  self.schema.fields]
     sample_values = [
-      get_sample_values(self.prep_df, field.name, 3)
+      profile[field.name]["first_values"]
       for field in self.schema.fields
     ]
 
+    data = dict(
+      description=descriptions,
+      type=types,
+      sample_values=sample_values
+    )
+    if with_profile:
+      for stat in ["nulls", "distinct", "min", "max"]:
+        data[stat] = [profile[field.name][stat] for field in self.schema.fields]
+
     df = pd.DataFrame(
-      data=dict(
-        description=descriptions,
-        type=types,
-        sample_values=sample_values
-      ),
+      data=data,
       index=fields
     )
     
     return df
 
-  def as_frictionless_resource(self) -> Resource:
+  def as_frictionless_resource(self) -> "Resource":
+    from frictionless import Detector
+    from frictionless.resource import Resource
 
     detector = Detector(schema_sync=True)
     resource = Resource(
@@ -141,48 +619,102 @@ class Asset:
 
     return resource
 
+@functools.lru_cache(maxsize=None)
+def configured_seasons(config_file: str = "config.yml") -> List[int]:
+  """Get the seasons in the project config. The config is only read once per process.
+  """
+  return list(read_config(config_file)["defintions"]["seasons"])
+
 class RawAsset(Asset):
 
   raw_file_name = None
 
-  def __init__(self, settings: dict = None) -> None:
-    super().__init__(settings)
+  def __init__(self, settings: dict = None, lazy: bool = False) -> None:
+    super().__init__(settings, lazy)
 
     self.raw_df = None
     self.raw_files_path = "data/raw/transfermarkt-scraper"
+    # raw files are read from their Parquet conversion in this cache, if set
+    self.raw_cache = None
 
     if not self.raw_file_name:
       file_name = self.name.replace("base_", "")
       self.raw_file_name = file_name + ".json.gz"
 
-  def load_raw(self):
+  @property
+  def seasons(self) -> List[int]:
+    """The seasons to read raw data for, from the asset settings if set or the project config otherwise.
+    """
+    if self.settings and self.settings.get("seasons"):
+      return list(self.settings["seasons"])
+    return configured_seasons()
+
+  def read_raw_file(self, path: str, fields: List[str] = None) -> pd.DataFrame:
+    """Read a raw JSON lines file, with the pyarrow parser if possible or pandas otherwise.
+    With a `raw_cache`, the file is read from its Parquet conversion.
+
+    Args:
+        path (str): Path to the file.
+        fields (List[str], optional): Only read these fields.
+
+    Returns:
+        pd.DataFrame: The raw records.
+    """
+    import pyarrow as pa
+
+    if self.raw_cache is not None:
+      try:
+        return self.raw_cache.read(path, fields)
+      except pa.ArrowInvalid as e:
+        self.log.debug("Cannot cache %s: %s", path, e)
+
+    try:
+      return read_json_lines(path, fields)
+    except pa.ArrowInvalid as e:
+      self.log.debug("Falling back to pandas to read %s: %s", path, e)
+
+    df = pd.read_json(
+      path,
+      lines=True,
+      convert_dates=True,
+      orient={'index', 'date'}
+    )
+    if fields is not None:
+      df = df[[field for field in fields if field in df.columns]]
+    return df
+
+  def read_raw_season(self, season: int, fields: List[str] = None) -> pd.DataFrame:
+    season_file = f"{self.raw_files_path}/{season}/{self.raw_file_name}"
+
+    self.log.debug("Reading raw data from %s", season_file)
+    df = self.read_raw_file(season_file, fields)
+    df["season"] = season
+    df["season_file"] = season_file
+
+    return df
+
+  def load_raw(self, fields: List[str] = None, workers: int = None):
+    """Load the raw data of the asset for all seasons into `raw_df`.
+
+    Seasons are read in parallel, each with the multithreaded pyarrow JSON parser.
+
+    Args:
+        fields (List[str], optional): Only read these fields from the raw files. It defaults to all fields.
+        workers (int, optional): How many seasons to read at the same time. It defaults to one per season,
+          up to the number of CPUs.
+    """
 
     raw_dfs = []
 
     if "competitions" in self.raw_file_name:
-        df = pd.read_json(
-          f"data/competitions.json",
-          lines=True,
-          convert_dates=True,
-          orient={'index', 'date'}
-        )
+        df = self.read_raw_file("data/competitions.json", fields)
         raw_dfs.append(df)
     else:
-      seasons = read_config()["defintions"]["seasons"]
-      for season in seasons:
-
-        season_file = f"{self.raw_files_path}/{season}/{self.raw_file_name}"
-
-        self.log.debug("Reading raw data from %s", season_file)
-        df = pd.read_json(
-          season_file,
-          lines=True,
-          convert_dates=True,
-          orient={'index', 'date'}
-        )
-        df["season"] = season
-        df["season_file"] = season_file
-        if len(df) > 0:
-          raw_dfs.append(df)
-
-    self.raw_df = pd.concat(raw_dfs, axis=0)
+      seasons = self.seasons
+      workers = workers or min(len(seasons), os.cpu_count() or 1)
+      with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        dfs = list(pool.map(lambda season: self.read_raw_season(season, fields), seasons))
+      raw_dfs = [df for df in dfs if len(df) > 0]
+      del dfs
+
+    self.raw_df = concat_preallocated(raw_dfs)
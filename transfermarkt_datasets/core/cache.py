@@ -0,0 +1,289 @@
+"""Local caches for prepared and raw files, stored in columnar formats.
+
+Parsing the gzipped prep files is by far the most expensive part of loading a dataset.
+The prep cache converts each file once into an uncompressed Arrow file that later loads
+memory-map instead of parsing, so that repeated loads are close to free and processes
+on the same host share the OS page cache rather than holding a private copy each.
+
+The raw cache does the same for the JSON lines files from the scraper, which are
+converted once into typed Parquet files so that later reads are columnar scans of only
+the fields needed instead of decoding every line.
+"""
+import hashlib
+import json
+import logging
+import os
+from typing import Callable, Dict, List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from transfermarkt_datasets.core.utils import Filters, get_filters_columns
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def table_to_pandas(table: pa.Table, columns: List[str] = None, filters: Filters = None) -> pd.DataFrame:
+  """Filter and project an Arrow table and convert it to pandas, without copies for
+  the column types that allow it.
+
+  Args:
+      table (pa.Table): The table, which must hold the filter columns as well as `columns`.
+      columns (List[str], optional): Only keep these columns.
+      filters (Filters, optional): Only keep rows matching these pyarrow-style filters.
+
+  Returns:
+      pd.DataFrame: The dataframe.
+  """
+  if filters:
+    table = table.filter(pq.filters_to_expression(filters))
+  if columns is not None:
+    table = table.select(list(columns))
+
+  return table.to_pandas(split_blocks=True)
+
+def file_fingerprint(path: str, known: Dict = None) -> Dict:
+  """Fingerprint a file by its size, modification time and content hash.
+
+  Hashing is the expensive part, so when a previous fingerprint is `known` and
+  the size and modification time still match it, its hash is reused.
+
+  Args:
+      path (str): Path to the file.
+      known (Dict, optional): A previously computed fingerprint for the same file.
+
+  Returns:
+      Dict: A dict with the "size", "mtime_ns" and "sha256" of the file.
+  """
+  stat = os.stat(path)
+  fingerprint = {
+    "size": stat.st_size,
+    "mtime_ns": stat.st_mtime_ns
+  }
+
+  if known and all(known.get(key) == value for key, value in fingerprint.items()):
+    fingerprint["sha256"] = known["sha256"]
+    return fingerprint
+
+  sha256 = hashlib.sha256()
+  with open(path, "rb") as f:
+    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+      sha256.update(chunk)
+  fingerprint["sha256"] = sha256.hexdigest()
+
+  return fingerprint
+
+class PrepCache:
+  """Cache of parsed prep files as memory-mappable Arrow files.
+
+  Entries are keyed by the fingerprint of the source file plus a caller provided
+  `salt` (for example, a signature of the schema used to type the data), so a new
+  release or a schema change never serves stale data. Writing an entry removes the
+  entries of older versions of the source, but keeps those of the current version
+  with other salts, which other readers may still be using.
+  """
+
+  def __init__(self, cache_dir: str = "data/prep/.cache") -> None:
+    self.cache_dir = cache_dir
+    self.log = logging.getLogger("main")
+
+  def _stem(self, source_path: str) -> str:
+    return os.path.basename(source_path)
+
+  def _fingerprint_path(self, source_path: str) -> str:
+    return os.path.join(self.cache_dir, self._stem(source_path) + ".fingerprint.json")
+
+  def fingerprint(self, source_path: str) -> Dict:
+    """Get the fingerprint of a source file, reusing the last known hash when possible.
+    """
+    fingerprint_path = self._fingerprint_path(source_path)
+
+    known = None
+    if os.path.exists(fingerprint_path):
+      with open(fingerprint_path) as f:
+        known = json.load(f)
+
+    fingerprint = file_fingerprint(source_path, known)
+
+    if fingerprint != known:
+      os.makedirs(os.path.dirname(fingerprint_path), exist_ok=True)
+      tmp_path = f"{fingerprint_path}.{os.getpid()}.tmp"
+      with open(tmp_path, "w") as f:
+        json.dump(fingerprint, f)
+      os.replace(tmp_path, fingerprint_path)
+
+    return fingerprint
+
+  def entry_path(self, source_path: str, salt: str = "") -> str:
+    """Get the path of the cache entry for the current version of a source file.
+
+    Entries are named after the source, its version and the salt, as
+    `{stem}-{version}-{salt key}.arrow`.
+    """
+    fingerprint = self.fingerprint(source_path)
+    version = fingerprint["sha256"][:16]
+    salt_key = hashlib.sha256(salt.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(self.cache_dir, f"{self._stem(source_path)}-{version}-{salt_key}.arrow")
+
+  def _remove_stale(self, entry_path: str, suffixes: tuple) -> None:
+    """Remove the cache files next to `entry_path`, with one of the `suffixes`, that were
+    built from another version of its source.
+    """
+    entry_dir, entry_name = os.path.split(entry_path)
+    stem, version, _ = entry_name.rsplit("-", 2)
+    for file_name in os.listdir(entry_dir):
+      if not (file_name.endswith(suffixes) and file_name.startswith(stem + "-")):
+        continue
+      # entries named before the version was part of the name have none
+      key = file_name[len(stem) + 1:]
+      file_version = key.split("-", 1)[0] if "-" in key else None
+      if file_version != version:
+        try:
+          os.remove(os.path.join(entry_dir, file_name))
+        except FileNotFoundError:
+          # another process removed it first
+          pass
+
+  def index_path(self, source_path: str, columns: List[str], salt: str = "") -> str:
+    """Get the path of a key index over the current version of a source file.
+    Indexes are stored next to the cache entry they were built from.
+    """
+    entry_path = self.entry_path(source_path, salt)
+    return entry_path[:-len(".arrow")] + "." + ",".join(columns) + ".index"
+
+  def read(
+    self,
+    source_path: str,
+    build: Callable[[], pd.DataFrame],
+    salt: str = "",
+    columns: List[str] = None,
+    filters: Filters = None) -> pd.DataFrame:
+    """Read a source file through the cache.
+
+    On a miss, `build` is called to parse the source file and the result is stored
+    before being returned. On a hit, the cache entry is memory-mapped and converted
+    to pandas, without copies for the column types that allow it.
+
+    Args:
+        source_path (str): The file being cached.
+        build (Callable[[], pd.DataFrame]): Parses the full source file.
+        salt (str, optional): Extra key material, such as a schema signature.
+        columns (List[str], optional): Only read these columns from the cache entry.
+        filters (Filters, optional): Only read rows matching these pyarrow-style filters.
+
+    Returns:
+        pd.DataFrame: The cached dataframe.
+    """
+    entry_path = self.entry_path(source_path, salt)
+
+    if not os.path.exists(entry_path):
+      self.log.debug("Cache miss for %s, building %s", source_path, entry_path)
+      self.write(entry_path, build())
+    else:
+      self.log.debug("Cache hit for %s, reading %s", source_path, entry_path)
+
+    read_columns = columns
+    if columns is not None:
+      read_columns = list(columns) + [
+        column for column in get_filters_columns(filters)
+        if column not in columns
+      ]
+
+    table = feather.read_table(
+      entry_path,
+      columns=read_columns,
+      memory_map=True
+    )
+
+    return table_to_pandas(table, columns, filters)
+
+  def write(self, entry_path: str, df: pd.DataFrame) -> None:
+    """Store a dataframe as a cache entry, replacing the entries of older versions of the source.
+
+    The entry is written uncompressed, so it can be memory-mapped, and moved in place
+    atomically, so concurrent readers never see a partial file.
+    """
+    os.makedirs(self.cache_dir, exist_ok=True)
+
+    tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+    feather.write_feather(
+      pa.Table.from_pandas(df, preserve_index=False),
+      tmp_path,
+      compression="uncompressed"
+    )
+    os.replace(tmp_path, entry_path)
+
+    self._remove_stale(entry_path, (".arrow", ".index"))
+
+class RawCache(PrepCache):
+  """Cache of raw JSON lines files as typed Parquet files.
+
+  Entries are keyed by the fingerprint of the source file, like in `PrepCache`, and laid
+  out in the cache folder following the path of the source file relative to `raw_root`,
+  since every season has a file with the same name.
+
+  Args:
+      cache_dir (str, optional): Where to keep the Parquet files.
+      raw_root (str, optional): The folder holding the raw files.
+  """
+
+  def __init__(self, cache_dir: str = "data/raw/.cache", raw_root: str = "data/raw") -> None:
+    super().__init__(cache_dir)
+    self.raw_root = raw_root
+
+  def _stem(self, source_path: str) -> str:
+    relative_path = os.path.relpath(os.path.abspath(source_path), os.path.abspath(self.raw_root))
+    if relative_path.startswith(os.pardir):
+      # files outside of raw_root are laid out by their absolute path
+      relative_path = os.path.abspath(source_path).lstrip(os.sep)
+    return relative_path
+
+  def entry_path(self, source_path: str, salt: str = "") -> str:
+    return super().entry_path(source_path, salt)[:-len(".arrow")] + ".parquet"
+
+  def read(self, source_path: str, fields: List[str] = None) -> pd.DataFrame:
+    """Read a raw JSON lines file through the cache.
+
+    On a miss, the whole file is parsed with the pyarrow JSON parser and stored. Then only
+    the `fields` are read from the cache entry.
+
+    Args:
+        source_path (str): The (optionally gzipped) JSON lines file.
+        fields (List[str], optional): Top level fields to read. Fields that do not exist are ignored.
+
+    Raises:
+        pyarrow.ArrowInvalid: If pyarrow cannot parse the file, for example because it is empty
+          or a field changes type across lines. Nothing is cached in that case.
+
+    Returns:
+        pd.DataFrame: The parsed records.
+    """
+    import pyarrow.json as pajson
+
+    entry_path = self.entry_path(source_path)
+
+    if not os.path.exists(entry_path):
+      self.log.debug("Cache miss for %s, building %s", source_path, entry_path)
+      self.write(entry_path, pajson.read_json(source_path))
+    else:
+      self.log.debug("Cache hit for %s, reading %s", source_path, entry_path)
+
+    columns = None
+    if fields is not None:
+      names = pq.read_schema(entry_path).names
+      columns = [name for name in fields if name in names]
+
+    return pq.read_table(entry_path, columns=columns).to_pandas()
+
+  def write(self, entry_path: str, table: pa.Table) -> None:
+    """Store a parsed file as a cache entry, replacing the entries of older versions of the source.
+    """
+    entry_dir = os.path.dirname(entry_path)
+    os.makedirs(entry_dir, exist_ok=True)
+
+    tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+    pq.write_table(table, tmp_path, compression="zstd")
+    os.replace(tmp_path, entry_path)
+
+    self._remove_stale(entry_path, (".parquet",))
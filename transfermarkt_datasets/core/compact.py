@@ -0,0 +1,108 @@
+"""A compact in-memory representation for the prepared dataframes.
+
+String fields that repeat a small set of values (tagged as categorical in the schema)
+are dictionary-encoded into pandas categoricals, so each distinct value is held once
+and the rows hold small integer codes. Integer fields are downcast to the narrowest
+nullable integer type that holds all their values.
+
+Entity names (clubs, players, managers) repeat across assets rather than within one,
+so in a dataset they are encoded through a `StringPool` shared by all the assets.
+"""
+import threading
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from transfermarkt_datasets.core.schema import Schema
+
+# nullable integer types, from the narrowest
+INTEGER_DTYPES = ["Int8", "Int16", "Int32", "Int64"]
+
+def smallest_integer_dtype(values: pd.Series) -> str:
+  """Get the narrowest nullable integer type that can hold all of `values`.
+  """
+  if values.isna().all():
+    return INTEGER_DTYPES[0]
+
+  low, high = values.min(), values.max()
+  for dtype in INTEGER_DTYPES:
+    limits = np.iinfo(dtype.lower())
+    if limits.min <= low and high <= limits.max:
+      return dtype
+  return INTEGER_DTYPES[-1]
+
+def compact_dataframe(df: pd.DataFrame, schema: Schema) -> pd.DataFrame:
+  """Dictionary-encode the categorical fields and downcast the integer fields of `df`.
+
+  Args:
+      df (pd.DataFrame): A dataframe typed after `schema`. Fields of the schema that are not in it are skipped.
+      schema (Schema): The schema of the dataframe.
+
+  Returns:
+      pd.DataFrame: The compacted dataframe.
+  """
+  dtypes = {
+    name: "category" for name in schema.categorical_field_names
+    if name in df.columns and not isinstance(df[name].dtype, pd.CategoricalDtype)
+  }
+  dtypes.update({
+    name: smallest_integer_dtype(df[name]) for name in schema.integer_field_names
+    if name in df.columns
+  })
+
+  return df.astype(dtypes)
+
+class StringPool:
+  """A dictionary of strings shared by the entity name fields of all the assets in a dataset.
+
+  Fields encoded through the pool become categoricals of one and the same dtype, so
+  each distinct name is held once for the whole dataset, and comparisons and merges
+  of names across assets run on integer codes. The pool grows as assets are loaded.
+  New names are appended, so existing codes stay valid, and `version` is bumped so
+  that columns encoded earlier can be moved to the new dtype. Assets may be loaded in
+  parallel threads, so additions to the pool are serialized by a lock.
+  """
+
+  def __init__(self) -> None:
+    self.dtype = pd.CategoricalDtype(categories=pd.Index([], dtype=object))
+    self.version = 0
+    self._lock = threading.Lock()
+
+  def __getstate__(self) -> dict:
+    state = self.__dict__.copy()
+    del state["_lock"]
+    return state
+
+  def __setstate__(self, state: dict) -> None:
+    self.__dict__.update(state)
+    self._lock = threading.Lock()
+
+  def __len__(self) -> int:
+    return len(self.dtype.categories)
+
+  def add(self, values: pd.Series) -> None:
+    """Add the distinct values in `values` that are not in the pool yet.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+      uniques = values.cat.categories
+    else:
+      uniques = values.dropna().unique()
+    uniques = pd.Index(uniques, dtype=object)
+
+    with self._lock:
+      new = uniques[~uniques.isin(self.dtype.categories)].unique()
+      if len(new) > 0:
+        self.dtype = pd.CategoricalDtype(categories=self.dtype.categories.append(new))
+        self.version += 1
+
+  def encode(self, df: pd.DataFrame, field_names: List[str]) -> pd.DataFrame:
+    """Encode the `field_names` in `df` as categoricals of the pool dtype, adding any new values to the pool.
+    """
+    field_names = [name for name in field_names if name in df.columns]
+    for name in field_names:
+      self.add(df[name])
+
+    # the pool only grows, so its latest dtype holds the values added above
+    dtype = self.dtype
+    return df.astype({name: dtype for name in field_names})
@@ -1,15 +1,48 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import json
 import pathlib
-from typing import Dict, List
-
-from frictionless.package import Package
+import time
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 import importlib
 import inflection
 import os
 import logging.config
 
-from transfermarkt_datasets.core.utils import read_config
+import numpy as np
+import pandas as pd
+
+from transfermarkt_datasets.core.asset import Asset, RawAsset
+from transfermarkt_datasets.core.integrity import (
+  as_field_list,
+  check_primary_key,
+  check_foreign_key
+)
+from transfermarkt_datasets.core.utils import (
+  Filters,
+  read_config,
+  filter_dataframe,
+  normalize_filters
+)
+from transfermarkt_datasets.core.validation import (
+  DEFAULT_CHUNKSIZE,
+  DEFAULT_MAX_ERRORS,
+  build_report
+)
+
+if TYPE_CHECKING:
+  from frictionless import Report
+
+ASSET_MANIFEST_FILE_NAME = "manifest.json"
+
+# written by scripts/synching/export-duckdb.py, with the commit of the release in a "version" table
+RELEASE_DATABASE_FILE_NAME = "transfermarkt-datasets.duckdb"
+
+SNAPSHOT_FILE_NAME = "transfermarkt-datasets.snapshot"
+
+# above this number of distinct keys, a join reads the joined asset with an "in" filter
+# or a vectorized isin, rather than looking up the keys one by one in its index
+INDEX_JOIN_MAX_KEYS = 1000
 
 class AssetNotFound(Exception):
   """Exception to be raised when attempting to load an asset that is not defined.
@@ -22,6 +55,31 @@ class AssetNotFound(Exception):
 class InvalidStagingLocation(Exception):
   pass
 
+class InvalidJoin(Exception):
+  pass
+
+def read_asset(asset: Asset, engine: str = None) -> Tuple[pd.DataFrame, Dict]:
+  """Read an asset's prepared file, timing the read.
+  This is a module level function so that it can be sent to worker processes.
+  """
+  start = time.perf_counter()
+  df = asset.read_prep(engine=engine)
+  stats = {
+    "seconds": time.perf_counter() - start,
+    "bytes": os.path.getsize(asset.read_path)
+  }
+  return df, stats
+
+def load_asset(asset: Asset, engine: str = None) -> Dict:
+  """Load an asset's prepared file in place, timing the load.
+  """
+  start = time.perf_counter()
+  asset.load_from_prep(engine=engine)
+  return {
+    "seconds": time.perf_counter() - start,
+    "bytes": os.path.getsize(asset.read_path)
+  }
+
 class Dataset:
   def __init__(
     self,
@@ -29,6 +87,13 @@ class Dataset:
     config_file="config.yml",
     assets_root=".",
     assets_relative_path="transfermarkt_datasets/assets",
+    lazy=False,
+    cache_dir=None,
+    use_manifest=True,
+    cache_results=False,
+    results_cache_dir=None,
+    compact=False,
+    raw_cache_dir=None
 
     ) -> None:
 
@@ -40,6 +105,31 @@ class Dataset:
       self.prep_folder_path = "data/prep"
       self.assets = {}
 
+      # prepared files are parsed once and then memory-mapped from cache_dir, if set
+      self.cache = None
+      if cache_dir:
+        from transfermarkt_datasets.core.cache import PrepCache
+        self.cache = PrepCache(cache_dir)
+
+      # raw files are converted once to Parquet in raw_cache_dir, if set
+      self.raw_cache = None
+      if raw_cache_dir:
+        from transfermarkt_datasets.core.cache import RawCache
+        self.raw_cache = RawCache(raw_cache_dir)
+
+      # query and join results are kept in memory, and in results_cache_dir if set
+      self.results_cache = None
+      if cache_results:
+        from transfermarkt_datasets.core.results import ResultCache
+        self.results_cache = ResultCache(results_cache_dir)
+      self._release_commit = (None, None)
+
+      # in compact mode, entity names across all assets share a single dictionary
+      self.string_pool = None
+      if compact:
+        from transfermarkt_datasets.core.compact import StringPool
+        self.string_pool = StringPool()
+
       if self.config.get("logging"):
         logging.config.dictConfig(self.config["logging"])
       else:
@@ -47,16 +137,26 @@ class Dataset:
 
       self.log = logging.getLogger("main")
 
-      for file in pathlib.Path(os.path.join(self.assets_root, self.assets_relative_path)).glob("**/*.py"):
-        filename = file.name
-        class_ = self.get_asset_def(filename.split(".")[0])
-        asset = class_()
+      # the manifest saves walking and importing the assets folder just to find the assets
+      asset_defs = (use_manifest and self.read_asset_manifest()) or self.discover_assets()
+      for asset_def in asset_defs.values():
+        class_ = self.get_asset_def(asset_def["module"], asset_def["class"])
+        asset = class_(lazy=lazy)
+        asset.cache = self.cache
+        asset.compact = compact
+        asset.string_pool = self.string_pool
+        if isinstance(asset, RawAsset):
+          asset.raw_cache = self.raw_cache
         self.assets[asset.name] = asset
 
   @property
   def assets_module(self):
     return self.assets_relative_path.replace("/", ".")
 
+  @property
+  def asset_manifest_path(self) -> str:
+    return os.path.join(self.assets_root, self.assets_relative_path, ASSET_MANIFEST_FILE_NAME)
+
   @property
   def asset_names(self):
     """Return the names of the asset in the dataset.
@@ -66,18 +166,253 @@ class Dataset:
     """
     return list(self.assets.keys())
 
-  def load_assets(self):
-    """Load all assets in the dataset from local.
+  def get_release_commit(self) -> str:
+    """Get the commit the release database in the prep folder was exported from, if there is one.
+    """
+    release_path = os.path.join(self.prep_folder_path, RELEASE_DATABASE_FILE_NAME)
+    if not os.path.exists(release_path):
+      return None
+
+    stat = os.stat(release_path)
+    signature, commit = self._release_commit
+    if signature != (stat.st_size, stat.st_mtime_ns):
+      import duckdb
+      with duckdb.connect(release_path, read_only=True) as connection:
+        commit = connection.execute("SELECT commit_hash FROM version").fetchone()[0]
+      self._release_commit = ((stat.st_size, stat.st_mtime_ns), commit)
+
+    return commit
+
+  def get_version(self) -> str:
+    """Get a version string that changes whenever any of the prepared files changes.
+
+    It combines the commit of the release database, if there is one, with a fingerprint
+    of each prepared file: the content hash when a prep cache is set (the cache only
+    rehashes files that were modified) or the size and modification time otherwise.
+    Compact mode, and loaded assets that do not hold the contents of their file (assigned
+    dataframes or filtered loads), are part of the version too, as joins are served from them.
+
+    Returns:
+        str: The dataset version.
+    """
+    parts = [f"release:{self.get_release_commit()}", f"compact:{self.string_pool is not None}"]
+    for asset_name in sorted(self.assets):
+      read_path = self.assets[asset_name].read_path
+      if not os.path.exists(read_path):
+        continue
+      if self.cache:
+        fingerprint = self.cache.fingerprint(read_path)["sha256"]
+      else:
+        stat = os.stat(read_path)
+        fingerprint = f"{stat.st_size}-{stat.st_mtime_ns}"
+      parts.append(f"{read_path}:{fingerprint}")
+    for asset_name in sorted(self.assets):
+      memory_version = self.assets[asset_name].memory_version
+      if memory_version is not None:
+        parts.append(f"{asset_name}:{memory_version}")
+
+    return "|".join(parts)
+
+  def load_assets(
+    self,
+    names: List[str] = None,
+    engine: str = None,
+    workers: int = 1,
+    executor: str = "thread") -> Dict[str, Dict]:
+    """Load assets in the dataset from local.
+
+    Assets can be loaded concurrently. Decompressing and parsing the prepared files
+    largely releases the GIL, so a thread pool is usually enough; a process pool
+    sidesteps the GIL entirely at the cost of pickling each dataframe back. In compact
+    mode, worker processes read without the shared string pool, and entity names are
+    encoded through it once the dataframes are back.
+
+    Args:
+        names (List[str], optional): Names of the assets to be loaded. It defaults to all public assets.
+          Use it to warm up a lazy dataset with the assets that are known to be needed.
+        engine (str, optional): The CSV parser to be used by pandas, for example "pyarrow".
+        workers (int, optional): How many assets to load at the same time. Defaults to 1 (sequential).
+        executor (str, optional): Either "thread" or "process". Defaults to "thread".
+
+    Raises:
+        AssetNotFound: If any of the requested names is not an asset in the dataset.
+
+    Returns:
+        Dict[str, Dict]: Load stats per asset, with the "seconds" it took to load and the "bytes" read from disk.
+    """
+    if names is None:
+      names = [
+        asset_name for asset_name, asset in self.assets.items()
+        if asset.public
+      ]
+
+    for asset_name in names:
+      if asset_name not in self.assets:
+        raise AssetNotFound(asset_name)
+
+    if executor not in ("thread", "process"):
+      raise ValueError(f"Invalid executor: {executor}")
+
+    stats = {}
+
+    if workers <= 1:
+      for asset_name in names:
+        stats[asset_name] = load_asset(self.assets[asset_name], engine)
+    elif executor == "thread":
+      with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+          asset_name: pool.submit(load_asset, self.assets[asset_name], engine)
+          for asset_name in names
+        }
+        for asset_name, future in futures.items():
+          stats[asset_name] = future.result()
+    else:
+      with ProcessPoolExecutor(max_workers=workers) as pool:
+        fingerprints = {
+          asset_name: self.assets[asset_name].prep_fingerprint()
+          for asset_name in names
+        }
+        futures = {
+          asset_name: pool.submit(read_asset, self.assets[asset_name], engine)
+          for asset_name in names
+        }
+        for asset_name, future in futures.items():
+          df, stats[asset_name] = future.result()
+          asset = self.assets[asset_name]
+          string_pool_version = None
+          if asset.string_pool is not None:
+            string_pool_version = asset.string_pool.version
+            df = asset.string_pool.encode(df, asset.schema.entity_name_field_names)
+          asset.prep_df = df
+          asset._string_pool_version = string_pool_version
+          asset.loaded_fingerprint = fingerprints[asset_name]
+          asset._load_options = dict(columns=None, filters=None, engine=engine)
+
+    for asset_name, asset_stats in stats.items():
+      self.log.info(
+        "Loaded %s in %.2fs (%d bytes)",
+        asset_name, asset_stats["seconds"], asset_stats["bytes"]
+      )
+
+    return stats
+
+  def refresh(self, names: List[str] = None) -> Dict[str, Dict]:
+    """Reload the loaded assets whose prepared files changed since they were loaded.
+
+    Assets are reloaded one at a time, with the columns and filters of their last load,
+    and each new dataframe is swapped in only once it is fully read. Unchanged assets
+    are kept as they are, and so are assets that were never loaded.
+
+    Args:
+        names (List[str], optional): Names of the assets to be refreshed. It defaults to all assets.
+
+    Raises:
+        AssetNotFound: If any of the requested names is not an asset in the dataset.
+
+    Returns:
+        Dict[str, Dict]: Load stats for each reloaded asset, as in `load_assets`.
+    """
+    if names is None:
+      names = self.asset_names
+
+    for asset_name in names:
+      if asset_name not in self.assets:
+        raise AssetNotFound(asset_name)
+
+    stats = {}
+    for asset_name in names:
+      asset = self.assets[asset_name]
+      if not asset.is_loaded or not asset.has_changed():
+        continue
+
+      start = time.perf_counter()
+      asset.reload()
+      stats[asset_name] = {
+        "seconds": time.perf_counter() - start,
+        "bytes": os.path.getsize(asset.read_path)
+      }
+      self.log.info(
+        "Refreshed %s in %.2fs (%d bytes)",
+        asset_name, stats[asset_name]["seconds"], stats[asset_name]["bytes"]
+      )
+
+    return stats
+
+  def memory_report(self) -> pd.DataFrame:
+    """Report the memory held by each column of the loaded assets.
+
+    Categoricals that share their categories (see `StringPool`) count them only once,
+    against the first column that holds them.
+
+    Returns:
+        pd.DataFrame: One row per asset and column (including the index), with the column
+          "dtype" and the deep size in "bytes". Sum by asset with `report.groupby("asset")["bytes"].sum()`.
     """
+    records = []
+    shared_categories = set()
     for asset_name, asset in self.assets.items():
-      if asset.public:
-        asset.load_from_prep()
+      if not asset.is_loaded:
+        continue
+      df = asset.prep_df
+      for column, nbytes in asset.memory_usage().items():
+        dtype = df.index.dtype if column == "Index" else df[column].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+          if id(dtype.categories) in shared_categories:
+            nbytes -= dtype.categories.memory_usage(deep=True)
+          shared_categories.add(id(dtype.categories))
+        records.append({
+          "asset": asset_name,
+          "column": column,
+          "dtype": str(dtype),
+          "bytes": int(nbytes)
+        })
+
+    return pd.DataFrame.from_records(records, columns=["asset", "column", "dtype", "bytes"])
 
-  def get_asset_def(self, asset_name):
-    class_name = inflection.camelize(asset_name) + "Asset"
+  def get_asset_def(self, asset_name, class_name=None):
+    class_name = class_name or inflection.camelize(asset_name) + "Asset"
     module = importlib.import_module(f"{self.assets_module}.{asset_name}")
     class_ = getattr(module, class_name)
     return class_
+
+  def discover_assets(self) -> Dict[str, Dict]:
+    """Find the asset definitions by importing every module in the assets folder.
+
+    Returns:
+        Dict[str, Dict]: The "module" and "class" that define each asset, by asset name.
+    """
+    asset_defs = {}
+
+    assets_path = pathlib.Path(os.path.join(self.assets_root, self.assets_relative_path))
+    for file in sorted(assets_path.glob("**/*.py")):
+      module_name = file.name.split(".")[0]
+      class_ = self.get_asset_def(module_name)
+      asset_defs[class_.name] = {
+        "module": module_name,
+        "class": class_.__name__
+      }
+
+    return asset_defs
+
+  def read_asset_manifest(self) -> Dict[str, Dict]:
+    """Read the asset definitions from the assets manifest, if there is one.
+
+    Returns:
+        Dict[str, Dict]: The asset definitions as in `discover_assets`, or None if there is no manifest.
+    """
+    if not os.path.exists(self.asset_manifest_path):
+      return None
+
+    with open(self.asset_manifest_path) as f:
+      return json.load(f)
+
+  def write_asset_manifest(self) -> None:
+    """Write the assets manifest from the asset definitions found in the assets folder.
+    It must be regenerated every time an asset is added, removed or renamed.
+    """
+    with open(self.asset_manifest_path, "w") as f:
+      json.dump(self.discover_assets(), f, indent=2)
+      f.write("\n")
   
   def get_relationships(self) -> List[Dict]:
     """Get assets relationships.
@@ -106,12 +441,521 @@ class Dataset:
 
     return relationships
 
+  def join(
+    self,
+    *asset_names: str,
+    columns: List[str] = None,
+    where: Filters = None,
+    how: str = "left") -> pd.DataFrame:
+    """Join assets along their relationships, for example
+    `join("cur_club_games", "cur_games", "cur_clubs", columns=["own_manager_name", "season", "cur_clubs.name"])`.
+
+    Each asset after the first is joined to one of the assets before it, on the keys of
+    the relationship between them. Projections and filters are pushed down, so only the
+    needed columns are read, and each joined asset is restricted to the keys present on
+    the left side of the join (through its key index, if loaded) before merging.
+
+    Args:
+        *asset_names (str): The assets to join, starting from the one that drives the join.
+        columns (List[str], optional): Columns in the result. Columns can be qualified with the asset
+          name ("cur_clubs.name"), otherwise they are taken from the first asset that has them.
+          It defaults to all columns in all assets.
+        where (Filters, optional): A list of (column, op, value) predicates that are AND-ed together.
+          Columns are resolved like in `columns`.
+        how (str, optional): How to merge the assets after the first one ("left" or "inner").
+          Assets with predicates in `where` are always inner joined. Defaults to "left".
+
+    Raises:
+        AssetNotFound: If any of the assets is not in the dataset.
+        InvalidJoin: If an asset is not related to the assets before it, or a column cannot be resolved.
+
+    Returns:
+        pd.DataFrame: The joined dataframe. Columns are named after the field, or prefixed with the
+          resource name ("clubs_name") if more than one asset contributes a field with that name.
+    """
+    if not asset_names:
+      raise InvalidJoin("At least one asset is needed for a join")
+    for asset_name in asset_names:
+      if asset_name not in self.assets:
+        raise AssetNotFound(asset_name)
+
+    if self.results_cache:
+      from transfermarkt_datasets.core.results import spec_key
+      import pyarrow as pa
+
+      version = self.get_version()
+      key = spec_key({
+        "join": list(asset_names),
+        "columns": columns,
+        "where": normalize_filters(where),
+        "how": how
+      })
+      table = self.results_cache.get(version, key)
+      if table is None:
+        result = self._join(asset_names, columns, where, how)
+        self.results_cache.put(version, key, pa.Table.from_pandas(result, preserve_index=False))
+        return result
+      return table.to_pandas()
+
+    return self._join(asset_names, columns, where, how)
+
+  def _join(
+    self,
+    asset_names: Tuple[str],
+    columns: List[str],
+    where: Filters,
+    how: str) -> pd.DataFrame:
+
+    def resolve(column: str) -> Tuple[str, str]:
+      if "." in column:
+        asset_name, field_name = column.split(".", 1)
+        if asset_name in asset_names and field_name in self.assets[asset_name].schema.field_names:
+          return asset_name, field_name
+      else:
+        for asset_name in asset_names:
+          if column in self.assets[asset_name].schema.field_names:
+            return asset_name, column
+      raise InvalidJoin(f"Cannot resolve column {column} in {list(asset_names)}")
+
+    # resolve the keys to join each asset on
+    relationships = self.get_relationships()
+    steps = []
+    joined = [asset_names[0]]
+    for asset_name in asset_names[1:]:
+      step = None
+      for relationship in relationships:
+        source = as_field_list(relationship["on"]["source"])
+        target = as_field_list(relationship["on"]["target"])
+        if relationship["from"] in joined and relationship["to"] == asset_name:
+          step = (relationship["from"], source, asset_name, target)
+        elif relationship["to"] in joined and relationship["from"] == asset_name:
+          step = (relationship["to"], target, asset_name, source)
+        if step:
+          break
+      if step is None:
+        raise InvalidJoin(f"{asset_name} is not related to any of {joined}")
+      steps.append(step)
+      joined.append(asset_name)
+
+    # resolve the columns to be read from each asset
+    if columns is None:
+      selected = [
+        (asset_name, field_name)
+        for asset_name in asset_names
+        for field_name in self.assets[asset_name].schema.field_names
+      ]
+    else:
+      selected = [resolve(column) for column in columns]
+
+    conjunctions = normalize_filters(where)
+    if len(conjunctions) > 1:
+      raise InvalidJoin("Only a list of AND-ed predicates is supported in joins")
+
+    filters = {asset_name: [] for asset_name in asset_names}
+    for column, op, value in (conjunctions[0] if conjunctions else []):
+      asset_name, field_name = resolve(column)
+      filters[asset_name].append((field_name, op, value))
+
+    needed = {asset_name: [] for asset_name in asset_names}
+    def need(asset_name, field_names):
+      needed[asset_name].extend(
+        field_name for field_name in field_names
+        if field_name not in needed[asset_name]
+      )
+
+    for asset_name, field_name in selected:
+      need(asset_name, [field_name])
+    for left_name, left_fields, right_name, right_fields in steps:
+      need(left_name, left_fields)
+      need(right_name, right_fields)
+    for asset_name, asset_filters in filters.items():
+      need(asset_name, [field_name for field_name, _, _ in asset_filters])
+
+    def read(asset_name: str, extra_filters: List[Tuple] = None) -> pd.DataFrame:
+      asset = self.assets[asset_name]
+      asset_filters = filters[asset_name] + (extra_filters or [])
+      if asset.is_loaded and set(needed[asset_name]).issubset(asset.prep_df.columns):
+        df = filter_dataframe(asset.prep_df, asset_filters)[needed[asset_name]]
+      else:
+        df = asset.read_prep(columns=needed[asset_name], filters=asset_filters or None)
+      return df.add_prefix(f"{asset_name}.")
+
+    result = read(asset_names[0])
+
+    for left_name, left_fields, right_name, right_fields in steps:
+      left_on = [f"{left_name}.{field_name}" for field_name in left_fields]
+      right_on = [f"{right_name}.{field_name}" for field_name in right_fields]
+
+      # only the rows matching keys on the left side are needed from the right side
+      keys = result[left_on[0]].dropna().unique()
+      right = self.assets[right_name]
+      if (
+        right.is_loaded and not filters[right_name] and len(keys) <= INDEX_JOIN_MAX_KEYS and
+        # the asset may have been loaded with only some of its columns
+        set(needed[right_name]).issubset(right.prep_df.columns)
+      ):
+        index = right.get_index(right_fields[0])
+        positions = np.concatenate(
+          [index.lookup(key) for key in keys] + [np.array([], dtype=np.int64)]
+        )
+        right_df = (
+          right.prep_df.iloc[np.sort(positions)][needed[right_name]]
+            .add_prefix(f"{right_name}.")
+        )
+      else:
+        right_df = read(right_name, [(right_fields[0], "in", list(keys))])
+
+      result = result.merge(
+        right_df,
+        how="inner" if filters[right_name] else how,
+        left_on=left_on,
+        right_on=right_on
+      )
+
+    result = result[[f"{asset_name}.{field_name}" for asset_name, field_name in selected]]
+
+    field_names = [field_name for _, field_name in selected]
+    result.columns = [
+      field_name if field_names.count(field_name) == 1
+      else f"{self.assets[asset_name].frictionless_resource_name}_{field_name}"
+      for asset_name, field_name in selected
+    ]
+
+    return result.reset_index(drop=True)
+
+  def query(self, sql: str, output: str = "pandas", batch_size: int = 1_000_000):
+    """Run a SQL query over the prepared files of the public assets, with DuckDB.
+
+    Every asset with a prepared file is available as a view named after its
+    `frictionless_resource_name` (games, appearances, ...), reading the Parquet file
+    if there is one and the gzipped CSV otherwise. Queries run out-of-core and in
+    parallel in DuckDB, without loading the assets into pandas first.
+
+    Args:
+        sql (str): The query, for example "SELECT player_id, sum(goals) FROM appearances GROUP BY 1".
+        output (str, optional): "pandas" for a dataframe, "arrow" for a pyarrow Table, or "batches" for
+          a pyarrow RecordBatchReader that streams the result. Defaults to "pandas".
+        batch_size (int, optional): Rows per batch with the "batches" output.
+
+    Returns:
+        The query result, in the requested output format. Unless it is streamed, the result
+          is served from the results cache when the dataset has one and the data has not changed.
+    """
+    if output not in ("pandas", "arrow", "batches"):
+      raise ValueError(f"Invalid output: {output}")
+
+    if self.results_cache and output != "batches":
+      from transfermarkt_datasets.core.results import normalize_sql, spec_key
+
+      version = self.get_version()
+      key = spec_key({"query": normalize_sql(sql)})
+      table = self.results_cache.get(version, key)
+      if table is None:
+        table = self._query(sql).to_arrow_table()
+        self.results_cache.put(version, key, table)
+      return table if output == "arrow" else table.to_pandas()
+
+    relation = self._query(sql)
+
+    if output == "pandas":
+      return relation.df()
+    elif output == "arrow":
+      return relation.to_arrow_table()
+    else:
+      return relation.to_arrow_reader(batch_size)
+
+  def _query(self, sql: str):
+    import duckdb
+
+    connection = duckdb.connect()
+    for asset in self.assets.values():
+      if asset.public and asset.snapshot is not None:
+        # Arrow tables in the snapshot are scanned in place
+        connection.register(asset.frictionless_resource_name, asset.snapshot.table(asset.name))
+        continue
+      if not asset.public or not os.path.exists(asset.source_path):
+        continue
+      if asset.source_path.endswith(".parquet"):
+        reader = f"read_parquet('{asset.source_path}')"
+      else:
+        reader = f"read_csv_auto('{asset.source_path}', header=true)"
+      connection.execute(
+        f"CREATE VIEW {asset.frictionless_resource_name} AS SELECT * FROM {reader}"
+      )
+
+    return connection.sql(sql)
+
+  def validate_integrity(self, names: List[str] = None, sample_size: int = 5) -> Dict:
+    """Validate primary key uniqueness and foreign key coverage across assets.
+
+    Only the key columns are used. They are taken from the assets that are already
+    loaded, or read from the prepared files otherwise, without loading the assets.
+
+    Args:
+        names (List[str], optional): Names of the assets to validate. It defaults to all public assets.
+        sample_size (int, optional): How many offending keys to report per check. Defaults to 5.
+
+    Returns:
+        Dict: A report with a "valid" flag and the list of "checks" that were run, each with
+          its number of "violations" and a "sample" of the offending keys. Keys that cannot be
+          checked, such as keys on fields that are not in the schema, fail with an "error".
+    """
+    if names is None:
+      names = [
+        asset_name for asset_name, asset in self.assets.items()
+        if asset.public
+      ]
+
+    relationships = [
+      relationship for relationship in self.get_relationships()
+      if relationship["from"] in names
+    ]
+
+    # keys on fields that are not in the schemas cannot be read, they are reported instead
+    def unknown_fields(asset_name, fields):
+      field_names = self.assets[asset_name].schema.field_names
+      return [f"{asset_name}.{field}" for field in fields if field not in field_names]
+
+    errors = {}
+    for asset_name in names:
+      unknown = unknown_fields(asset_name, self.assets[asset_name].schema.primary_key or [])
+      if unknown:
+        errors[("primary-key", asset_name)] = f"Unknown primary key fields: {', '.join(unknown)}"
+    for position, relationship in enumerate(relationships):
+      if relationship["to"] not in self.assets:
+        errors[position] = f"Unknown referenced asset: {relationship['to']}"
+        continue
+      unknown = (
+        unknown_fields(relationship["from"], as_field_list(relationship["on"]["source"])) +
+        unknown_fields(relationship["to"], as_field_list(relationship["on"]["target"]))
+      )
+      if unknown:
+        errors[position] = f"Unknown foreign key fields: {', '.join(unknown)}"
+
+    # collect every key column needed per asset, so that each asset is read once
+    key_columns = {asset_name: [] for asset_name in names}
+    def require(asset_name, fields):
+      columns = key_columns.setdefault(asset_name, [])
+      columns.extend(field for field in fields if field not in columns)
+
+    for asset_name in names:
+      if ("primary-key", asset_name) not in errors:
+        require(asset_name, self.assets[asset_name].schema.primary_key or [])
+    for position, relationship in enumerate(relationships):
+      if position not in errors:
+        require(relationship["from"], as_field_list(relationship["on"]["source"]))
+        require(relationship["to"], as_field_list(relationship["on"]["target"]))
+
+    key_frames = {}
+    for asset_name, columns in key_columns.items():
+      if not columns or asset_name not in self.assets:
+        continue
+      asset = self.assets[asset_name]
+      if asset.is_loaded and set(columns).issubset(asset.prep_df.columns):
+        key_frames[asset_name] = asset.prep_df[columns]
+      else:
+        key_frames[asset_name] = asset.read_prep(columns=columns)
+
+    checks = []
+
+    for asset_name in names:
+      primary_key = self.assets[asset_name].schema.primary_key
+      if not primary_key:
+        continue
+      check = {
+        "type": "primary-key",
+        "asset": asset_name,
+        "fields": primary_key
+      }
+      if ("primary-key", asset_name) in errors:
+        check.update({
+          "rows": 0,
+          "violations": 1,
+          "sample": [],
+          "error": errors[("primary-key", asset_name)]
+        })
+      else:
+        check.update(check_primary_key(key_frames[asset_name], primary_key, sample_size))
+      checks.append(check)
+
+    for position, relationship in enumerate(relationships):
+      check = {
+        "type": "foreign-key",
+        "asset": relationship["from"],
+        "reference": relationship["to"],
+        "on": relationship["on"]
+      }
+      if position in errors:
+        check.update({
+          "rows": 0,
+          "violations": 1,
+          "sample": [],
+          "error": errors[position]
+        })
+      else:
+        check.update(check_foreign_key(
+          key_frames[relationship["from"]],
+          key_frames[relationship["to"]],
+          as_field_list(relationship["on"]["source"]),
+          as_field_list(relationship["on"]["target"]),
+          sample_size
+        ))
+      checks.append(check)
+
+    for check in checks:
+      if check.get("error"):
+        self.log.error("Integrity check %s failed for %s: %s", check["type"], check["asset"], check["error"])
+      elif check["violations"] > 0:
+        self.log.warning(
+          "Integrity check %s failed for %s: %d violations",
+          check["type"], check["asset"], check["violations"]
+        )
+
+    return {
+      "valid": all(check["violations"] == 0 for check in checks),
+      "checks": checks
+    }
+
+  def validate_fields(
+    self,
+    names: List[str] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_errors: int = DEFAULT_MAX_ERRORS) -> "Report":
+    """Validate every row of the prepared files against the assets' field types.
+
+    This is a streaming, vectorized alternative to validating the datapackage with
+    frictionless, which is too slow to validate the larger assets in full.
+
+    Args:
+        names (List[str], optional): Names of the assets to validate. It defaults to all public assets.
+        chunksize (int, optional): How many rows to hold in memory at a time.
+        max_errors (int, optional): How many errors to keep in the report per asset. All errors are counted.
+
+    Returns:
+        Report: A frictionless validation report, with one task per asset.
+    """
+    from frictionless import Report
+
+    if names is None:
+      names = [
+        asset_name for asset_name, asset in self.assets.items()
+        if asset.public
+      ]
+
+    start = time.perf_counter()
+    tasks = []
+    for asset_name in names:
+      task = self.assets[asset_name].validate_prep(chunksize, max_errors)
+      self.log.info(
+        "Validated %s: %d rows, %d errors",
+        asset_name, task["stats"]["rows"], task["stats"]["errors"]
+      )
+      tasks.append(task)
+
+    return Report.from_descriptor(
+      build_report(tasks, time.perf_counter() - start)
+    )
+
+  def write_snapshot(self, path: str = None, names: List[str] = None) -> str:
+    """Write assets into a single snapshot file, that `open_snapshot` loads from one memory map.
+
+    The snapshot holds the data of each asset as Arrow, along with the asset schemas and
+    the relationships between them.
+
+    Args:
+        path (str, optional): Path to the snapshot file. Defaults to a file in the prep folder.
+        names (List[str], optional): Names of the assets to be included. It defaults to all public assets.
+
+    Raises:
+        AssetNotFound: If any of the requested names is not an asset in the dataset.
+
+    Returns:
+        str: The path to the snapshot file.
+    """
+    import pyarrow as pa
+    from transfermarkt_datasets.core.snapshot import write_snapshot as write_snapshot_file
+
+    if path is None:
+      path = os.path.join(self.prep_folder_path, SNAPSHOT_FILE_NAME)
+    if names is None:
+      names = [
+        asset_name for asset_name, asset in self.assets.items()
+        if asset.public
+      ]
+
+    tables = {}
+    assets = {}
+    for asset_name in names:
+      if asset_name not in self.assets:
+        raise AssetNotFound(asset_name)
+      asset = self.assets[asset_name]
+
+      if asset.is_loaded and list(asset.prep_df.columns) == asset.schema.field_names:
+        df = asset.prep_df
+      else:
+        df = asset.read_prep()
+
+      tables[asset_name] = pa.Table.from_pandas(df, preserve_index=False)
+      assets[asset_name] = {
+        "resource_name": asset.frictionless_resource_name,
+        "description": asset.description,
+        "schema": asset.schema.as_descriptor()
+      }
+
+    write_snapshot_file(
+      path,
+      tables,
+      metadata={
+        "assets": assets,
+        "relationships": [
+          relationship for relationship in self.get_relationships()
+          if relationship["from"] in tables and relationship["to"] in tables
+        ]
+      }
+    )
+    self.log.info("Wrote a snapshot of %d assets to %s", len(tables), path)
+
+    return path
+
+  @classmethod
+  def open_snapshot(cls, path: str, **kwargs) -> "Dataset":
+    """Open a dataset that reads its assets from a snapshot file written by `write_snapshot`.
+
+    The file is memory-mapped and assets are read from it on first access, without opening
+    the prepared files. Numeric columns without nulls are exposed without copies.
+
+    Args:
+        path (str): Path to the snapshot file.
+        **kwargs: Other arguments for the `Dataset`. The dataset is lazy unless told otherwise.
+
+    Raises:
+        InvalidSnapshot: If the file is not a snapshot.
+
+    Returns:
+        Dataset: The dataset.
+    """
+    from transfermarkt_datasets.core.snapshot import Snapshot
+
+    snapshot = Snapshot(path)
+
+    kwargs.setdefault("lazy", True)
+    td = cls(**kwargs)
+    for asset_name in snapshot.asset_names:
+      if asset_name in td.assets:
+        td.assets[asset_name].snapshot = snapshot
+      else:
+        td.log.warning("Asset %s in the snapshot is not defined, skipping it", asset_name)
+
+    return td
+
   def as_frictionless_package(self, basepath=None, exclude_private=False) -> None:
     """Create an save to local a file descriptor tha defines a "datapackage" for this dataset.
 
     Args:
         basepath (str, optional): Base path of prepared files. It defaults to the "prep" folder path.
     """
+    from frictionless.package import Package
+
     base_path = basepath or self.prep_folder_path
     package = Package(basepath=base_path)
 
@@ -137,10 +981,29 @@ class Dataset:
     
     return package
   
-  def write_datapackage(self):
+  def write_datapackage(self, profile: bool = True):
+    """Write the datapackage descriptor of the dataset to the prep folder.
+
+    Args:
+        profile (bool, optional): Add the profile of each field (see `Asset.profile`) to its
+          descriptor, for the assets with prepared data. Defaults to True.
+    """
     pkg = self.as_frictionless_package()
     pkg_as_json = json.loads(pkg.to_json())
 
+    if profile:
+      assets = {
+        asset.frictionless_resource_name: asset
+        for asset in self.assets.values()
+      }
+      for resource in pkg_as_json["resources"]:
+        asset = assets.get(resource["name"])
+        if asset is None or not (asset.is_loaded or os.path.exists(asset.read_path)):
+          continue
+        asset_profile = asset.profile()
+        for field in resource["schema"]["fields"]:
+          field["profile"] = asset_profile[field["name"]]
+
     # recursively sort a json object by key
     def sort_dict_by_key(d):
       return {k: sort_dict_by_key(v) if isinstance(v, dict) else v for k, v in sorted(d.items())}
@@ -0,0 +1,93 @@
+"""Key indexes over the prepared dataframes, for entity lookups without full scans.
+
+An index keeps the key values of a dataframe in sorted order, together with the
+position of each row. Unique keys (such as primary keys) are then looked up through
+a hash table and repeated keys (such as foreign keys) through a binary search, instead
+of a boolean mask over the whole dataframe on every lookup.
+"""
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+POSITION_COLUMN = "__position"
+
+class KeyIndex:
+  """Index from the values of one or more key columns to the positions of the rows holding them.
+  """
+
+  def __init__(self, columns: List[str], sorted_keys: pd.DataFrame, positions: np.ndarray) -> None:
+    self.columns = list(columns)
+    self.positions = positions
+
+    if len(self.columns) == 1:
+      self.index = pd.Index(sorted_keys[self.columns[0]])
+    else:
+      self.index = pd.MultiIndex.from_frame(sorted_keys[self.columns])
+
+  def __len__(self) -> int:
+    return len(self.positions)
+
+  @classmethod
+  def build(cls, df: pd.DataFrame, columns: Union[str, List[str]]) -> "KeyIndex":
+    """Build an index over the `columns` of `df`.
+    """
+    if isinstance(columns, str):
+      columns = [columns]
+
+    keys = df[columns].reset_index(drop=True)
+    # null keys cannot be looked up, leaving them out keeps the index monotonic
+    keys = keys[keys.notna().all(axis=1)]
+    sorted_keys = keys.sort_values(columns, kind="stable")
+
+    return cls(
+      columns=columns,
+      sorted_keys=sorted_keys.reset_index(drop=True),
+      positions=sorted_keys.index.to_numpy()
+    )
+
+  @property
+  def is_unique(self) -> bool:
+    return self.index.is_unique
+
+  def lookup(self, key) -> np.ndarray:
+    """Get the positions of the rows with a given key.
+
+    Args:
+        key: A value for single column indexes, or a tuple of values for multi-column ones.
+
+    Returns:
+        np.ndarray: The row positions, empty if the key does not exist.
+    """
+    try:
+      loc = self.index.get_loc(key)
+    except (KeyError, TypeError):
+      return np.array([], dtype=self.positions.dtype)
+
+    if isinstance(loc, (int, np.integer)):
+      return self.positions[loc:loc + 1]
+    else:
+      # keys are sorted, so repeated keys come back as a slice
+      return self.positions[loc]
+
+  def save(self, path: str) -> None:
+    """Persist the index to an Arrow (Feather) file.
+    """
+    if isinstance(self.index, pd.MultiIndex):
+      df = self.index.to_frame(index=False)
+    else:
+      df = self.index.to_frame(index=False, name=self.columns[0])
+    df[POSITION_COLUMN] = self.positions
+    df.to_feather(path)
+
+  @classmethod
+  def load(cls, path: str) -> "KeyIndex":
+    """Load an index persisted with `save`.
+    """
+    df = pd.read_feather(path)
+    columns = [column for column in df.columns if column != POSITION_COLUMN]
+    return cls(
+      columns=columns,
+      sorted_keys=df[columns],
+      positions=df[POSITION_COLUMN].to_numpy()
+    )
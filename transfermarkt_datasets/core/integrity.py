@@ -0,0 +1,76 @@
+"""Vectorized referential integrity checks for the dataset assets.
+
+Primary keys are checked for nulls and duplicates, and foreign keys for values that
+are missing from the referenced asset. All checks run as hash based pandas operations
+over the key columns only, so the full dataset is validated in seconds.
+"""
+from typing import Dict, List, Union
+
+import pandas as pd
+
+def as_field_list(fields: Union[str, List[str]]) -> List[str]:
+  """Foreign keys may reference a single field by name or a list of fields.
+  """
+  if isinstance(fields, str):
+    return [fields]
+  return list(fields)
+
+def sample_records(df: pd.DataFrame, sample_size: int) -> List[Dict]:
+  sample = df.head(sample_size).astype(object)
+  return sample.where(sample.notna(), None).to_dict(orient="records")
+
+def check_primary_key(df: pd.DataFrame, fields: List[str], sample_size: int = 5) -> Dict:
+  """Check that the primary key `fields` are never null and unique in `df`.
+
+  Returns:
+      Dict: The number of rows checked, the number of rows violating the key and a sample of the offending keys.
+  """
+  keys = df[fields]
+
+  null_keys = keys.isna().any(axis=1)
+  duplicated_keys = keys.duplicated(keep="first") & ~null_keys
+  violations = null_keys | duplicated_keys
+
+  return {
+    "rows": len(df),
+    "nulls": int(null_keys.sum()),
+    "duplicates": int(duplicated_keys.sum()),
+    "violations": int(violations.sum()),
+    "sample": sample_records(keys[violations], sample_size)
+  }
+
+def check_foreign_key(
+  source: pd.DataFrame,
+  target: pd.DataFrame,
+  source_fields: List[str],
+  target_fields: List[str],
+  sample_size: int = 5) -> Dict:
+  """Check that every non null key in `source` exists in `target`.
+
+  Returns:
+      Dict: The number of rows checked, the number of rows violating the key and a sample of the missing keys.
+  """
+  source_keys = source[source_fields]
+  source_keys = source_keys[source_keys.notna().all(axis=1)]
+
+  if len(source_fields) == 1:
+    missing = ~source_keys[source_fields[0]].isin(target[target_fields[0]])
+  else:
+    target_keys = target[target_fields].drop_duplicates()
+    target_keys.columns = source_fields
+    matched = source_keys.merge(
+      target_keys,
+      how="left",
+      on=source_fields,
+      indicator=True
+    )["_merge"]
+    missing = pd.Series(
+      (matched == "left_only").to_numpy(),
+      index=source_keys.index
+    )
+
+  return {
+    "rows": len(source_keys),
+    "violations": int(missing.sum()),
+    "sample": sample_records(source_keys[missing].drop_duplicates(), sample_size)
+  }
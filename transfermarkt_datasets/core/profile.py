@@ -0,0 +1,233 @@
+"""Single-pass, bounded-memory profiling of the asset fields.
+
+Dataframes are profiled chunk by chunk. For each field, a `FieldProfiler` keeps running
+counts, the min and max, a HyperLogLog sketch for the number of distinct values, the
+counts of the most frequent values seen so far, a reservoir sample and the first few
+distinct values. None of them grows with the size of the data, so the prepared files
+can be profiled without loading them whole.
+"""
+import json
+import os
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from transfermarkt_datasets.core.utils import get_sample_values
+
+DEFAULT_TOP_K = 5
+DEFAULT_SAMPLE_SIZE = 10
+DEFAULT_FIRST_VALUES = 3
+
+# 2^12 registers, for a standard error of about 1.6% in distinct counts
+HLL_PRECISION = 12
+
+# the top values are kept from the counts of this many candidates
+TOP_K_CANDIDATES_FACTOR = 20
+
+def to_python(value):
+  """Convert a pandas or numpy scalar into a JSON serializable Python value.
+  """
+  if value is None or value is pd.NaT or (np.ndim(value) == 0 and pd.isna(value)):
+    return None
+  if isinstance(value, (pd.Timestamp, np.datetime64)):
+    return pd.Timestamp(value).isoformat()
+  if isinstance(value, np.generic):
+    return value.item()
+  return value
+
+def leading_zeros(values: np.ndarray) -> np.ndarray:
+  """Count the leading zero bits of each of a set of uint64 values (64 for zero).
+  Each half is counted separately, as uint32 values are exact in float64.
+  """
+  high = (values >> np.uint64(32)).astype(np.float64)
+  low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+
+  with np.errstate(divide="ignore"):
+    high_zeros = 31 - np.floor(np.log2(high))
+    low_zeros = 63 - np.floor(np.log2(low))
+
+  zeros = np.where(high > 0, high_zeros, np.where(low > 0, low_zeros, 64))
+  return zeros.astype(np.int64)
+
+class HyperLogLog:
+  """HyperLogLog sketch of the number of distinct values in a stream.
+  """
+
+  def __init__(self, precision: int = HLL_PRECISION) -> None:
+    self.precision = precision
+    self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+  def update(self, values: pd.Series) -> None:
+    if len(values) == 0:
+      return
+
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+    buckets = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+    rest = hashes << np.uint64(self.precision)
+    ranks = np.minimum(leading_zeros(rest), 64 - self.precision) + 1
+
+    np.maximum.at(self.registers, buckets, ranks.astype(np.uint8))
+
+  def estimate(self) -> int:
+    m = len(self.registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+
+    # small ranges are better estimated by linear counting of the empty registers
+    empty = int(np.count_nonzero(self.registers == 0))
+    if estimate <= 2.5 * m and empty > 0:
+      estimate = m * np.log(m / empty)
+
+    return int(round(estimate))
+
+class FieldProfiler:
+  """Running statistics for the values of a field, updated one chunk at a time.
+
+  Args:
+      top_k (int, optional): How many of the most frequent values to report.
+      sample_size (int, optional): Size of the reservoir sample.
+      first_values (int, optional): How many of the first distinct values to keep.
+      seed (int, optional): Seed for the reservoir sampling, so profiles are reproducible.
+  """
+
+  def __init__(
+    self,
+    top_k: int = DEFAULT_TOP_K,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    first_values: int = DEFAULT_FIRST_VALUES,
+    seed: int = 0) -> None:
+
+    self.top_k = top_k
+    self.sample_size = sample_size
+    self.first_values_size = first_values
+    self.rng = np.random.default_rng(seed)
+
+    self.count = 0
+    self.nulls = 0
+    # non null values seen so far
+    self.seen = 0
+    self.min = None
+    self.max = None
+    self.sketch = HyperLogLog()
+    self.counts = pd.Series(dtype="int64")
+    self.sample = []
+    self.first_values = []
+
+  def update(self, values: pd.Series) -> None:
+    """Add a chunk of values to the profile.
+    """
+    self.count += len(values)
+    non_null = values.dropna()
+    self.nulls += len(values) - len(non_null)
+
+    if isinstance(non_null.dtype, pd.CategoricalDtype):
+      non_null = non_null.astype(non_null.cat.categories.dtype)
+
+    if len(non_null) > 0:
+      self._update_range(non_null)
+      self.sketch.update(non_null)
+      self._update_counts(non_null)
+      self._update_sample(non_null)
+      self._update_first_values(non_null)
+
+    self.seen += len(non_null)
+
+  def _update_range(self, values: pd.Series) -> None:
+    try:
+      low, high = values.min(), values.max()
+    except TypeError:
+      # values that cannot be ordered, such as mixed types
+      return
+    self.min = low if self.min is None else min(self.min, low)
+    self.max = high if self.max is None else max(self.max, high)
+
+  def _update_counts(self, values: pd.Series) -> None:
+    counts = values.value_counts(sort=False)
+    counts = self.counts.add(counts, fill_value=0).astype("int64")
+    self.counts = counts.nlargest(self.top_k * TOP_K_CANDIDATES_FACTOR)
+
+  def _update_sample(self, values: pd.Series) -> None:
+    values = values.to_numpy(dtype=object)
+    # 1-based positions of the values in the stream of non null values
+    positions = self.seen + np.arange(1, len(values) + 1)
+
+    # the first values fill the reservoir, then the value at position t replaces
+    # a random slot with probability sample_size / t (later replacements win, as
+    # in a sequential pass)
+    filling = positions <= self.sample_size
+    self.sample.extend(values[filling])
+
+    replacing = ~filling
+    if not replacing.any():
+      return
+    slots = (self.rng.random(int(replacing.sum())) * positions[replacing]).astype(np.int64)
+    accepted = slots < self.sample_size
+
+    sample = np.array(self.sample, dtype=object)
+    sample[slots[accepted]] = values[replacing][accepted]
+    self.sample = list(sample)
+
+  def _update_first_values(self, values: pd.Series) -> None:
+    missing = self.first_values_size - len(self.first_values)
+    if missing <= 0:
+      return
+    for value in get_sample_values(values.to_frame(name="values"), "values", self.first_values_size):
+      if value not in self.first_values and len(self.first_values) < self.first_values_size:
+        self.first_values.append(value)
+
+  def result(self) -> Dict:
+    """Get the profile as a JSON serializable dict.
+    """
+    top = self.counts.sort_values(ascending=False, kind="stable").head(self.top_k)
+    return {
+      "count": self.count,
+      "nulls": self.nulls,
+      "min": to_python(self.min),
+      "max": to_python(self.max),
+      "distinct": min(self.sketch.estimate(), self.count - self.nulls),
+      "top": [[to_python(value), int(count)] for value, count in top.items()],
+      "sample": [to_python(value) for value in self.sample],
+      "first_values": [to_python(value) for value in self.first_values]
+    }
+
+def profile_chunks(chunks: Iterable[pd.DataFrame], field_names: List[str], **kwargs) -> Dict[str, Dict]:
+  """Profile the `field_names` over a stream of dataframe chunks.
+
+  Args:
+      chunks (Iterable[pd.DataFrame]): The data, one chunk at a time.
+      field_names (List[str]): The fields to be profiled. Fields missing from the chunks are profiled as empty.
+      **kwargs: Options for each `FieldProfiler`.
+
+  Returns:
+      Dict[str, Dict]: The profile of each field.
+  """
+  profilers = {name: FieldProfiler(**kwargs) for name in field_names}
+
+  for chunk in chunks:
+    for name, profiler in profilers.items():
+      if name in chunk.columns:
+        profiler.update(chunk[name])
+
+  return {name: profiler.result() for name, profiler in profilers.items()}
+
+def read_profile(path: str, fingerprint: Dict) -> Dict[str, Dict]:
+  """Read a profile persisted with `write_profile`, if it was computed from a file with the same `fingerprint`.
+  """
+  try:
+    with open(path) as f:
+      persisted = json.load(f)
+  except (OSError, ValueError):
+    return None
+
+  if persisted.get("fingerprint") != fingerprint:
+    return None
+  return persisted["fields"]
+
+def write_profile(path: str, fingerprint: Dict, profile: Dict[str, Dict]) -> None:
+  """Persist a profile along with the `fingerprint` of the file it was computed from.
+  """
+  tmp_path = f"{path}.{os.getpid()}.tmp"
+  with open(tmp_path, "w") as f:
+    json.dump({"fingerprint": fingerprint, "fields": profile}, f, indent=2)
+  os.replace(tmp_path, path)
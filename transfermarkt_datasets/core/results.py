@@ -0,0 +1,162 @@
+"""A versioned cache for query and join results, bounded in memory and on disk.
+
+The same aggregations are computed over and over against data that only changes
+with a new release. Results are cached as Arrow tables keyed by the normalized query
+(or join spec) and the version of the dataset they were computed from, so a repeated
+query is served without touching the prepared files and a new release never serves
+an entry built from the previous one. Both the in-memory and the on-disk tiers are
+LRUs bounded by size.
+"""
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+import re
+from typing import Dict, Optional
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 2 * 1024 * 1024 * 1024
+
+VERSION_LENGTH = 16
+
+# comments and whitespace runs outside of quoted literals and identifiers
+SQL_TOKENS = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")|(?:\s|--[^\n]*|/\*.*?\*/)+""", re.DOTALL)
+
+def normalize_sql(sql: str) -> str:
+  """Normalize a query so that formatting differences map to the same cache entry.
+  Comments are dropped, whitespace is collapsed and a trailing semicolon dropped,
+  leaving literals untouched.
+  """
+  normalized = SQL_TOKENS.sub(lambda match: match.group(1) or " ", sql.strip())
+  return normalized.rstrip(";").strip()
+
+def spec_key(spec: Dict) -> str:
+  """Hash a JSON serializable spec of a query or join into a cache key.
+  """
+  serialized = json.dumps(spec, sort_keys=True, default=str)
+  return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+class ResultCache:
+  """LRU cache of result tables for a given dataset version.
+
+  Entries only ever match the version they were stored with. When the version moves
+  on, entries of other versions are dropped from memory. On disk they are kept, as
+  other datasets sharing the folder may still be at those versions, until the size
+  bound evicts them as the least recently used.
+
+  Args:
+      cache_dir (str, optional): Where to keep results on disk. Results are only kept in memory if not set.
+      max_memory_bytes (int, optional): Size bound of the in-memory tier.
+      max_disk_bytes (int, optional): Size bound of the on-disk tier.
+  """
+
+  def __init__(
+    self,
+    cache_dir: str = None,
+    max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+    max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES) -> None:
+
+    self.cache_dir = cache_dir
+    self.max_memory_bytes = max_memory_bytes
+    self.max_disk_bytes = max_disk_bytes
+
+    self.version = None
+    self.entries = OrderedDict()
+    self.memory_bytes = 0
+
+    self.log = logging.getLogger("main")
+
+  def _set_version(self, version: str) -> None:
+    if version == self.version:
+      return
+
+    self.entries.clear()
+    self.memory_bytes = 0
+    self.version = version
+
+  def _version_prefix(self, version: str) -> str:
+    return hashlib.sha256(version.encode("utf-8")).hexdigest()[:VERSION_LENGTH] + "-"
+
+  def _entry_path(self, key: str) -> str:
+    return os.path.join(self.cache_dir, f"{self._version_prefix(self.version)}{key}.arrow")
+
+  def get(self, version: str, key: str) -> Optional[pa.Table]:
+    """Get the result stored under `key` for `version`, or None if there is none.
+    """
+    self._set_version(version)
+
+    if key in self.entries:
+      self.entries.move_to_end(key)
+      self.log.debug("Result cache hit in memory for %s", key)
+      return self.entries[key]
+
+    if self.cache_dir:
+      entry_path = self._entry_path(key)
+      if os.path.exists(entry_path):
+        # the modification time orders the on-disk entries by last use
+        os.utime(entry_path)
+        self.log.debug("Result cache hit on disk for %s", key)
+        table = feather.read_table(entry_path, memory_map=True)
+        self._remember(key, table)
+        return table
+
+    return None
+
+  def put(self, version: str, key: str, table: pa.Table) -> None:
+    """Store a result under `key` for `version`, evicting the least recently used entries.
+    """
+    self._set_version(version)
+    self._remember(key, table)
+
+    if self.cache_dir and table.nbytes <= self.max_disk_bytes:
+      os.makedirs(self.cache_dir, exist_ok=True)
+      entry_path = self._entry_path(key)
+      tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+      feather.write_feather(table, tmp_path, compression="uncompressed")
+      os.replace(tmp_path, entry_path)
+      self._evict_disk()
+
+  def _remember(self, key: str, table: pa.Table) -> None:
+    if table.nbytes > self.max_memory_bytes:
+      return
+
+    if key in self.entries:
+      self.memory_bytes -= self.entries.pop(key).nbytes
+    self.entries[key] = table
+    self.memory_bytes += table.nbytes
+
+    while self.memory_bytes > self.max_memory_bytes:
+      _, evicted = self.entries.popitem(last=False)
+      self.memory_bytes -= evicted.nbytes
+
+  def _evict_disk(self) -> None:
+    paths = [
+      os.path.join(self.cache_dir, file_name)
+      for file_name in os.listdir(self.cache_dir)
+      if file_name.endswith(".arrow")
+    ]
+    stats = sorted(
+      ((os.stat(path), path) for path in paths),
+      key=lambda item: item[0].st_mtime_ns
+    )
+
+    disk_bytes = sum(stat.st_size for stat, _ in stats)
+    for stat, path in stats:
+      if disk_bytes <= self.max_disk_bytes:
+        break
+      os.remove(path)
+      disk_bytes -= stat.st_size
+
+  def clear(self) -> None:
+    """Drop every entry, in memory and on disk.
+    """
+    self.entries.clear()
+    self.memory_bytes = 0
+    if self.cache_dir and os.path.isdir(self.cache_dir):
+      for file_name in os.listdir(self.cache_dir):
+        if file_name.endswith(".arrow"):
+          os.remove(os.path.join(self.cache_dir, file_name))
@@ -1,7 +1,24 @@
 
-from typing import List
-
-import frictionless
+from typing import TYPE_CHECKING, Dict, List
+
+# frictionless is slow to import and only needed to build datapackages,
+# so it is imported on first use
+if TYPE_CHECKING:
+    import frictionless
+
+# pandas dtypes for each field type, nullable where pandas' defaults are not
+# (dates are parsed separately, see Schema.date_field_names)
+PANDAS_DTYPES = {
+    "string": "string",
+    "integer": "Int64",
+    "number": "float64",
+    "boolean": "boolean",
+}
+
+# fields with this tag repeat a small set of values, and are dictionary-encoded in compact loads
+CATEGORICAL_TAG = "categorical"
+# names of clubs, players and managers, which compact datasets encode in a dictionary shared across assets
+ENTITY_NAME_TAG = "entity_name"
 
 class Field:
     def __init__(
@@ -21,7 +38,9 @@ class Field:
     def __eq__(self, __o: object) -> bool:
         return self.name == __o.name
 
-    def as_frictionless_field(self) -> frictionless.Field:
+    def as_frictionless_field(self) -> "frictionless.Field":
+        import frictionless
+
         type_map = {
             "string": frictionless.fields.StringField,
             "integer": frictionless.fields.IntegerField,
@@ -39,6 +58,10 @@ class Field:
             kwargs["format"] = self.form
         return field_class(**kwargs)
 
+    @property
+    def pandas_dtype(self) -> str:
+        return PANDAS_DTYPES.get(self.type)
+
     def has_tag(self, tag: str) -> bool:
         if tag in self.tags:
             return True
@@ -60,6 +83,44 @@ class Schema:
     def field_names(self):
         return [field.name for field in self.fields]
     
+    @property
+    def pandas_dtypes(self) -> Dict[str, str]:
+        """Map field names to the pandas dtype to be used when reading them.
+        Fields without an explicit dtype (dates, arrays) are left out.
+        """
+        return {
+            field.name: field.pandas_dtype
+            for field in self.fields if field.pandas_dtype
+        }
+
+    @property
+    def date_field_names(self) -> List[str]:
+        return [
+            field.name for field in self.fields
+            if field.type in ("date", "datetime")
+        ]
+
+    @property
+    def categorical_field_names(self) -> List[str]:
+        return [
+            field.name for field in self.get_fields_by_tag(CATEGORICAL_TAG)
+            if field.type == "string"
+        ]
+
+    @property
+    def entity_name_field_names(self) -> List[str]:
+        return [
+            field.name for field in self.get_fields_by_tag(ENTITY_NAME_TAG)
+            if field.type == "string"
+        ]
+
+    @property
+    def integer_field_names(self) -> List[str]:
+        return [
+            field.name for field in self.fields
+            if field.type == "integer"
+        ]
+
     def add_field(self, field: Field) -> None:
         self.fields.append(
             field
@@ -73,7 +134,28 @@ class Schema:
 
         return matched_tag
 
-    def as_frictionless_schema(self) -> frictionless.schema.Schema:
+    def as_descriptor(self) -> Dict:
+        """Describe the schema as a frictionless-style dict, without importing frictionless.
+        """
+        fields = []
+        for field in self.fields:
+            descriptor = {"name": field.name, "type": field.type}
+            if field.description:
+                descriptor["description"] = field.description
+            if field.form:
+                descriptor["format"] = field.form
+            if field.tags:
+                descriptor["tags"] = field.tags
+            fields.append(descriptor)
+
+        return {
+            "fields": fields,
+            "primaryKey": self.primary_key,
+            "foreignKeys": self.foreign_keys
+        }
+
+    def as_frictionless_schema(self) -> "frictionless.schema.Schema":
+        import frictionless
 
         fl_fields = [field.as_frictionless_field()
             for field in self.fields
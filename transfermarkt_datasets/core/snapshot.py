@@ -0,0 +1,130 @@
+"""A single-file snapshot of the dataset, for loading every asset from one memory map.
+
+A snapshot holds one Arrow IPC file section per asset, followed by a JSON footer with
+the location of each section, the asset schemas and the relationships between assets.
+
+    | magic | padding | asset section | padding | ... | footer | footer length | magic |
+
+Sections are aligned to 64 bytes, so that once the snapshot is memory-mapped every
+asset is read as an Arrow table that points into the map, without copies.
+"""
+import json
+import os
+from typing import Dict, List
+
+import pandas as pd
+import pyarrow as pa
+
+from transfermarkt_datasets.core.cache import table_to_pandas
+from transfermarkt_datasets.core.utils import Filters
+
+MAGIC = b"TMDSNAP1"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+class InvalidSnapshot(Exception):
+  pass
+
+def write_snapshot(path: str, tables: Dict[str, pa.Table], metadata: Dict = None) -> None:
+  """Write Arrow tables into a snapshot file, replacing it atomically.
+
+  Args:
+      path (str): Path to the snapshot file.
+      tables (Dict[str, pa.Table]): Tables to be stored, by asset name.
+      metadata (Dict, optional): Extra metadata to store in the footer. The "assets" key
+        is merged with the location of each section.
+  """
+  metadata = dict(metadata or {})
+  assets = {
+    asset_name: dict(descriptor)
+    for asset_name, descriptor in metadata.get("assets", {}).items()
+  }
+
+  tmp_path = f"{path}.{os.getpid()}.tmp"
+  with open(tmp_path, "wb") as f:
+
+    def pad() -> None:
+      f.write(b"\0" * (-f.tell() % ALIGNMENT))
+
+    f.write(MAGIC)
+    pad()
+
+    for asset_name, table in tables.items():
+      sink = pa.BufferOutputStream()
+      with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+      section = sink.getvalue()
+
+      assets.setdefault(asset_name, {}).update({
+        "offset": f.tell(),
+        "length": section.size,
+        "rows": table.num_rows
+      })
+      f.write(section)
+      pad()
+
+    metadata.update({"version": FORMAT_VERSION, "assets": assets})
+    footer = json.dumps(metadata, default=str).encode("utf-8")
+    f.write(footer)
+    f.write(len(footer).to_bytes(8, "little"))
+    f.write(MAGIC)
+
+  os.replace(tmp_path, path)
+
+class Snapshot:
+  """A memory-mapped snapshot file.
+
+  Args:
+      path (str): Path to the snapshot file.
+
+  Raises:
+      InvalidSnapshot: If the file is not a snapshot, or has an unsupported version.
+  """
+
+  def __init__(self, path: str) -> None:
+    self.path = path
+    # a buffer over the whole map, that sections are sliced from without copies
+    self.buffer = pa.memory_map(path).read_buffer()
+    self._tables = {}
+
+    size = self.buffer.size
+    trailer_size = 8 + len(MAGIC)
+    if size < len(MAGIC) + trailer_size or self.buffer[:len(MAGIC)].to_pybytes() != MAGIC:
+      raise InvalidSnapshot(f"{path} is not a snapshot")
+
+    trailer = self.buffer[size - trailer_size:].to_pybytes()
+    if trailer[8:] != MAGIC:
+      raise InvalidSnapshot(f"{path} is truncated")
+
+    footer_length = int.from_bytes(trailer[:8], "little")
+    footer = self.buffer.slice(size - trailer_size - footer_length, footer_length)
+    self.metadata = json.loads(footer.to_pybytes())
+
+    if self.metadata.get("version") != FORMAT_VERSION:
+      raise InvalidSnapshot(f"Unsupported snapshot version: {self.metadata.get('version')}")
+
+  @property
+  def asset_names(self) -> List[str]:
+    return list(self.metadata["assets"].keys())
+
+  def table(self, asset_name: str) -> pa.Table:
+    """Get the table of an asset. It points into the memory map, nothing is copied.
+    """
+    if asset_name not in self._tables:
+      section = self.metadata["assets"][asset_name]
+      buffer = self.buffer.slice(section["offset"], section["length"])
+      self._tables[asset_name] = pa.ipc.open_file(buffer).read_all()
+    return self._tables[asset_name]
+
+  def read(self, asset_name: str, columns: List[str] = None, filters: Filters = None) -> pd.DataFrame:
+    """Read an asset from the snapshot into a dataframe.
+
+    Args:
+        asset_name (str): The asset.
+        columns (List[str], optional): Only read these columns.
+        filters (Filters, optional): Only read rows matching these pyarrow-style filters.
+
+    Returns:
+        pd.DataFrame: The asset dataframe.
+    """
+    return table_to_pandas(self.table(asset_name), columns, filters)
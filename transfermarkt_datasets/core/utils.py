@@ -1,10 +1,10 @@
 """A generic set of util functions used across the project.
 """
-from pandas import DataFrame
+from pandas import DataFrame, Series
+import numpy as np
 import yaml
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple, Union
 
-import boto3
 from time import sleep
 
 
@@ -63,7 +63,8 @@ def submit_batch_job_and_wait(
 	) -> None:
 	"""Launch a job in AWS Batch and wait for completion.
 	"""
-	
+	import boto3
+
 	client = boto3.client("batch", region_name="eu-west-1")
 
 	job_definitions = client.describe_job_definitions(
@@ -116,5 +117,196 @@ def submit_batch_job_and_wait(
 		raise Exception(f"Job {job_id} has failed")
 
 
+def read_json_lines(path: str, fields: List[str] = None) -> DataFrame:
+	"""Read a JSON lines file (optionally gzipped) with the multithreaded pyarrow parser.
+
+	When `fields` are given, only those are parsed. Their types are inferred from the first
+	block of the file and every other field is skipped, unless some of them are missing or
+	only null in that block, in which case the whole file is parsed and then projected.
+
+	Args:
+		path (str): Path to the file.
+		fields (List[str], optional): Top level fields to read. Fields that do not exist are ignored.
+
+	Raises:
+		pyarrow.ArrowInvalid: If pyarrow cannot parse the file, for example because it is empty
+			or a field changes type across lines.
+
+	Returns:
+		DataFrame: The parsed records.
+	"""
+	import pyarrow as pa
+	import pyarrow.json as pajson
+
+	parse_options = None
+	if fields is not None:
+		inferred = pajson.open_json(path).schema
+		selected = [inferred.field(name) for name in fields if name in inferred.names]
+		if len(selected) == len(fields) and not any(pa.types.is_null(field.type) for field in selected):
+			parse_options = pajson.ParseOptions(
+				explicit_schema=pa.schema(selected),
+				unexpected_field_behavior="ignore"
+			)
+
+	table = pajson.read_json(path, parse_options=parse_options)
+	if fields is not None:
+		table = table.select([name for name in fields if name in table.column_names])
+
+	return table.to_pandas()
+
 def get_sample_values(df: DataFrame, column: str, n: int) -> List[object]:
-	return list(df[column].unique())[:3]
+	"""Get the first `n` distinct non null values in a column.
+	The column is scanned in growing slices, so only as much of it as needed is read.
+	"""
+	values = df[column]
+	samples = []
+	start, size = 0, max(n * 16, 1024)
+	while start < len(values) and len(samples) < n:
+		for value in values.iloc[start:start + size].dropna().unique():
+			if value not in samples:
+				samples.append(value)
+				if len(samples) == n:
+					break
+		start += size
+		size *= 2
+	return samples
+
+def common_dtype(dtypes: Set) -> object:
+	"""Get a type that can hold the values of all the given types: their common type for
+	numbers and booleans, or for datetimes or timedeltas alone, and objects otherwise.
+	"""
+	if len(dtypes) == 1:
+		return next(iter(dtypes))
+	if all(isinstance(dtype, np.dtype) for dtype in dtypes):
+		kinds = {dtype.kind for dtype in dtypes}
+		if kinds <= set("biufc") or kinds in ({"M"}, {"m"}):
+			return np.result_type(*dtypes)
+	return np.dtype(object)
+
+def concat_preallocated(dfs: List[DataFrame]) -> DataFrame:
+	"""Concatenate dataframes by rows into preallocated columns.
+
+	The inputs are removed from `dfs` as they are copied, so that they can be freed early
+	if the caller holds no other reference to them. Columns missing from some of the inputs
+	are filled with nulls. Columns with differing numeric types across inputs take their
+	common type, as in `pd.concat`, and other differing types are stored as objects.
+
+	Args:
+		dfs (List[DataFrame]): The dataframes to concatenate. The list is emptied.
+
+	Returns:
+		DataFrame: The concatenated dataframe, with a fresh range index.
+	"""
+	columns = []
+	for df in dfs:
+		columns.extend(column for column in df.columns if column not in columns)
+	total = sum(len(df) for df in dfs)
+
+	dtypes = {}
+	for column in columns:
+		dtype = common_dtype({df[column].dtype for df in dfs if column in df.columns})
+		complete = all(column in df.columns for df in dfs)
+		if not complete and isinstance(dtype, np.dtype) and dtype.kind in "iub":
+			# integers and booleans cannot hold the nulls of the inputs missing the column
+			dtype = np.dtype("float64") if dtype.kind != "b" else np.dtype(object)
+		dtypes[column] = dtype
+
+	# extension types (nullable integers, strings, ...) are collected as objects and restored at the end
+	arrays = {
+		column: np.empty(total, dtype=dtype if isinstance(dtype, np.dtype) else object)
+		for column, dtype in dtypes.items()
+	}
+
+	offset = 0
+	while dfs:
+		df = dfs.pop(0)
+		end = offset + len(df)
+		for column, array in arrays.items():
+			if column in df.columns:
+				array[offset:end] = df[column].to_numpy(dtype=array.dtype)
+			else:
+				array[offset:end] = np.array("NaT", dtype=array.dtype) if array.dtype.kind in "mM" else np.nan
+		offset = end
+		del df
+
+	result = DataFrame(arrays, copy=False)
+
+	extension_dtypes = {
+		column: dtype for column, dtype in dtypes.items()
+		if not isinstance(dtype, np.dtype)
+	}
+	if extension_dtypes:
+		result = result.astype(extension_dtypes)
+
+	return result
+
+# a list of (column, op, value) predicates that are AND-ed together, or a list of
+# such lists that are OR-ed together, as in pyarrow.parquet "filters"
+Filters = Union[List[Tuple], List[List[Tuple]]]
+
+def normalize_filters(filters: Filters) -> List[List[Tuple]]:
+	"""Bring filters to their disjunctive normal form (a list of lists of predicates).
+	"""
+	if not filters:
+		return []
+	if isinstance(filters[0], tuple):
+		return [list(filters)]
+	return [list(conjunction) for conjunction in filters]
+
+def get_filters_columns(filters: Filters) -> List[str]:
+	"""Get the names of the columns referenced by a set of filters.
+	"""
+	columns = []
+	for conjunction in normalize_filters(filters):
+		for column, _, _ in conjunction:
+			if column not in columns:
+				columns.append(column)
+	return columns
+
+def filter_dataframe(df: DataFrame, filters: Filters) -> DataFrame:
+	"""Filter a dataframe with a set of pyarrow-style filters, for sources that
+	cannot evaluate them at read time.
+
+	Args:
+		df (DataFrame): The dataframe to filter.
+		filters (Filters): Predicates in the form (column, op, value), where op is one of
+			"=", "==", "!=", "<", "<=", ">", ">=", "in" or "not in".
+
+	Returns:
+		DataFrame: The rows of `df` matching the filters.
+	"""
+	if not filters:
+		return df
+
+	def predicate_mask(column: str, op: str, value) -> Series:
+		values = df[column]
+		if op in ("=", "=="):
+			mask = values == value
+		elif op == "!=":
+			mask = values != value
+		elif op == "<":
+			mask = values < value
+		elif op == "<=":
+			mask = values <= value
+		elif op == ">":
+			mask = values > value
+		elif op == ">=":
+			mask = values >= value
+		elif op == "in":
+			mask = values.isin(value)
+		elif op == "not in":
+			mask = ~values.isin(value)
+		else:
+			raise ValueError(f"Unsupported filter operator: {op}")
+		# comparisons against nulls do not match, as in pyarrow
+		return mask.fillna(False).astype(bool) & values.notna()
+
+	mask = None
+	for conjunction in normalize_filters(filters):
+		conjunction_mask = None
+		for column, op, value in conjunction:
+			predicate = predicate_mask(column, op, value)
+			conjunction_mask = predicate if conjunction_mask is None else conjunction_mask & predicate
+		mask = conjunction_mask if mask is None else mask | conjunction_mask
+
+	return df[mask]
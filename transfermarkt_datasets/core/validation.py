@@ -0,0 +1,196 @@
+"""Streaming, vectorized validation of the prepared files against the asset schemas.
+
+frictionless validates row by row in Python, which is too slow for the larger assets.
+Here the prepared files are read in chunks of raw strings and each field is checked
+against its type with vectorized pandas operations, so whole files are validated
+with bounded memory. Results are reported in the frictionless report format.
+"""
+import time
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+from transfermarkt_datasets.core.schema import Field, Schema
+
+DEFAULT_CHUNKSIZE = 100_000
+
+# how many errors to keep in the report per resource, all of them are counted
+DEFAULT_MAX_ERRORS = 1000
+
+TRUE_VALUES = ["true", "True", "TRUE", "1"]
+FALSE_VALUES = ["false", "False", "FALSE", "0"]
+
+URI_PATTERN = r"[a-zA-Z][a-zA-Z0-9+.-]*://[^\s/?#]+[^\s]*"
+
+def invalid_integers(values: pd.Series) -> pd.Series:
+  return ~values.str.fullmatch(r"[+-]?\d+")
+
+def invalid_numbers(values: pd.Series) -> pd.Series:
+  return pd.to_numeric(values, errors="coerce").isna()
+
+def invalid_dates(values: pd.Series) -> pd.Series:
+  return pd.to_datetime(values, format="%Y-%m-%d", errors="coerce").isna()
+
+def invalid_datetimes(values: pd.Series) -> pd.Series:
+  return pd.to_datetime(values, format="ISO8601", errors="coerce").isna()
+
+def invalid_booleans(values: pd.Series) -> pd.Series:
+  return ~values.isin(TRUE_VALUES + FALSE_VALUES)
+
+def invalid_uris(values: pd.Series) -> pd.Series:
+  return ~values.str.fullmatch(URI_PATTERN)
+
+TYPE_VALIDATORS = {
+  "integer": invalid_integers,
+  "number": invalid_numbers,
+  "date": invalid_dates,
+  "datetime": invalid_datetimes,
+  "boolean": invalid_booleans,
+}
+
+FORM_VALIDATORS = {
+  "uri": invalid_uris,
+}
+
+def get_validator(field: Field) -> Callable[[pd.Series], pd.Series]:
+  """Get the function that flags the values that are invalid for a field, if any.
+  """
+  if field.form in FORM_VALIDATORS:
+    return FORM_VALIDATORS[field.form]
+  return TYPE_VALIDATORS.get(field.type)
+
+def label_error(error_type: str, label: str, field_number: int) -> Dict:
+  titles = {
+    "missing-label": "Missing Label",
+    "extra-label": "Extra Label",
+  }
+  return {
+    "type": error_type,
+    "title": titles[error_type],
+    "description": "The header does not match the fields in the schema.",
+    "message": f"{titles[error_type]} \"{label}\" at position \"{field_number}\"",
+    "tags": ["#table", "#header", "#label"],
+    "note": "",
+    "labels": [],
+    "rowNumbers": [1],
+    "label": label,
+    "fieldName": label,
+    "fieldNumber": field_number
+  }
+
+def type_error(field: Field, field_number: int, row_number: int, cell: str, cells: List[str]) -> Dict:
+  note = f"type is \"{field.type}/{field.form or 'default'}\""
+  return {
+    "type": "type-error",
+    "title": "Type Error",
+    "description": "The value does not match the schema type and format for this field.",
+    "message": (
+      f"Type error in the cell \"{cell}\" in row \"{row_number}\" and "
+      f"field \"{field.name}\" at position \"{field_number}\": {note}"
+    ),
+    "tags": ["#table", "#row", "#cell"],
+    "note": note,
+    "cells": cells,
+    "rowNumber": row_number,
+    "cell": cell,
+    "fieldName": field.name,
+    "fieldNumber": field_number
+  }
+
+def validate_file(
+  path: str,
+  schema: Schema,
+  name: str,
+  chunksize: int = DEFAULT_CHUNKSIZE,
+  max_errors: int = DEFAULT_MAX_ERRORS) -> Dict:
+  """Validate every row of a prepared CSV file against a schema.
+
+  Args:
+      path (str): Path to the (optionally gzipped) CSV file.
+      schema (Schema): The schema the file is expected to follow.
+      name (str): Name of the resource, used in the report.
+      chunksize (int, optional): How many rows to hold in memory at a time.
+      max_errors (int, optional): How many errors to keep in the report. All errors are counted.
+
+  Returns:
+      Dict: A frictionless report task descriptor for the file.
+  """
+  start = time.perf_counter()
+
+  errors = []
+  error_count = 0
+  row_count = 0
+
+  def add_error(error: Dict) -> None:
+    nonlocal error_count
+    error_count += 1
+    if len(errors) < max_errors:
+      errors.append(error)
+
+  labels = list(pd.read_csv(path, nrows=0).columns)
+  for field_number, field in enumerate(schema.fields, start=1):
+    if field.name not in labels:
+      add_error(label_error("missing-label", field.name, field_number))
+  for field_number, label in enumerate(labels, start=1):
+    if label not in schema.field_names:
+      add_error(label_error("extra-label", label, field_number))
+
+  validators = [
+    (labels.index(field.name) + 1, field, get_validator(field))
+    for field in schema.fields
+    if field.name in labels and get_validator(field)
+  ]
+
+  chunks = pd.read_csv(
+    path,
+    dtype=str,
+    keep_default_na=False,
+    na_values=[""],
+    chunksize=chunksize
+  )
+  for chunk in chunks:
+    row_count += len(chunk)
+    for field_number, field, validator in validators:
+      values = chunk[field.name].dropna()
+      invalid = values[validator(values).to_numpy(dtype=bool, na_value=True)]
+      error_count += len(invalid)
+      # only the reported errors are built row by row
+      for index, cell in invalid.head(max(max_errors - len(errors), 0)).items():
+        cells = chunk.loc[index].fillna("").tolist()
+        # the header is row 1
+        errors.append(type_error(field, field_number, index + 2, cell, cells))
+
+  seconds = round(time.perf_counter() - start, 3)
+
+  return {
+    "name": name,
+    "type": "table",
+    "valid": error_count == 0,
+    "place": path,
+    "labels": labels,
+    "stats": {
+      "errors": error_count,
+      "warnings": 0,
+      "seconds": seconds,
+      "fields": len(labels),
+      "rows": row_count
+    },
+    "warnings": [],
+    "errors": errors
+  }
+
+def build_report(tasks: List[Dict], seconds: float) -> Dict:
+  """Wrap a list of task descriptors from `validate_file` into a report descriptor.
+  """
+  return {
+    "valid": all(task["valid"] for task in tasks),
+    "stats": {
+      "tasks": len(tasks),
+      "errors": sum(task["stats"]["errors"] for task in tasks),
+      "warnings": 0,
+      "seconds": round(seconds, 3)
+    },
+    "warnings": [],
+    "errors": [],
+    "tasks": tasks
+  }
@@ -6,10 +6,15 @@ raw data. On 2026-07-11 the acquisition was blocked and wrote 22,324
 that then propagated to the published dataset.
 """
 
+import asyncio
+from datetime import datetime, timedelta, timezone
+import gzip
 import importlib.util
 import json
+import os
 import pathlib
 import tempfile
+import time
 import unittest
 from unittest import mock
 
@@ -96,28 +101,440 @@ class TestPersistGuard(unittest.TestCase):
         self.assertEqual(len(written), 100)
 
 
-class TestTransfersBatchRetry(unittest.TestCase):
-    """Transfers must get the batch-level retry market values already had."""
+class FakeResponse:
+
+    def __init__(self, status, body=None, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def json(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeSession:
+    """Hands out a fixed sequence of responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = 0
+
+    def get(self, **kwargs):
+        self.requests += 1
+        return self.responses.pop(0)
+
+
+class TestFetchData(unittest.TestCase):
+    """Throttling counts as a failure for the controller."""
+
+    def fetch(self, session):
+        controller = tm_api.ConcurrencyController(requests_per_second=1000, burst=1000)
+        with mock.patch.object(tm_api, "RETRY_BACKOFF_BASE", 0):
+            result = asyncio.run(tm_api.fetch_data(session, "url", 1, controller))
+        return result, controller
+
+    def test_429_is_retried_after_retry_after(self):
+        session = FakeSession([
+            FakeResponse(429, headers={"Retry-After": "0.01"}),
+            FakeResponse(200, body={"ok": True}),
+        ])
+
+        result, controller = self.fetch(session)
+
+        self.assertEqual(result, {"response": {"ok": True}, "player_id": 1})
+        self.assertEqual(session.requests, 2)
+        self.assertEqual((controller.failures, controller.successes, controller.backoffs), (1, 1, 1))
+
+    def test_403_backs_off_without_retrying(self):
+        session = FakeSession([FakeResponse(403)])
+
+        result, controller = self.fetch(session)
+
+        self.assertIsNone(result["response"])
+        self.assertEqual(session.requests, 1)
+        self.assertEqual(controller.failures, 1)
+
+    def test_retry_after(self):
+        self.assertEqual(tm_api.retry_after_seconds(FakeResponse(429, headers={"Retry-After": "12"})), 12)
+        self.assertEqual(tm_api.retry_after_seconds(FakeResponse(429, headers={"Retry-After": "1e9"})), tm_api.MAX_RETRY_AFTER)
+        self.assertEqual(tm_api.retry_after_seconds(FakeResponse(429, headers={"Retry-After": "soon"})), 0)
+        self.assertEqual(tm_api.retry_after_seconds(FakeResponse(429)), 0)
+
+
+class TestFetchPlayers(unittest.TestCase):
+    """Both endpoints are fetched for each player in a single pass, streamed to disk."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.calls = []
+        self.failing = set()
+
+    def stores(self):
+        return {
+            label: tm_api.ResponseStore(str(pathlib.Path(self.tmpdir.name) / f"{name}.json"), label)
+            for label, name in [("market values", "market_values"), ("transfers", "transfers")]
+        }
+
+    def fetch(self, player_ids, stores):
+        async def fake_fetch_data(session, url, player_id, controller):
+            self.calls.append(url)
+            failed = url in self.failing and self.calls.count(url) == 1
+            return {"response": None if failed else {"url": url}, "player_id": player_id}
+
+        controllers = tm_api.HostControllers(requests_per_second=1000, burst=1000)
+        with mock.patch.object(tm_api, "fetch_data", fake_fetch_data):
+            try:
+                asyncio.run(tm_api.fetch_players(None, player_ids, controllers, stores))
+            finally:
+                for store in stores.values():
+                    store.close()
+
+    def read(self, path):
+        with open(path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_single_pass_over_both_endpoints(self):
+        # the first transfers request for player 2 fails
+        self.failing = {tm_api.TRANSFERS_API + "2"}
+        stores = self.stores()
+        self.fetch([1, 2, 3], stores)
+
+        # only the failed request is retried
+        self.assertEqual(len(self.calls), 7)
+        self.assertEqual(self.calls[-1], tm_api.TRANSFERS_API + "2")
+
+        for store in stores.values():
+            store.finish()
+            store.commit()
+        transfers = self.read(stores["transfers"].path)
+        self.assertEqual(sorted(item["player_id"] for item in transfers), [1, 2, 3])
+        self.assertIn({"response": {"url": tm_api.TRANSFERS_API + "2"}, "player_id": 2}, transfers)
+        self.assertFalse(pathlib.Path(stores["transfers"].partial_path).exists())
 
     def test_null_transfer_responses_are_retried(self):
-        player_ids = [1, 2, 3, 4]
-        failed_first_time = {2, 3}
+        self.failing = {tm_api.TRANSFERS_API + "2", tm_api.TRANSFERS_API + "3"}
+        stores = self.stores()
+        self.fetch([1, 2, 3, 4], stores)
+
+        self.assertEqual(self.calls[8:], [tm_api.TRANSFERS_API + "2", tm_api.TRANSFERS_API + "3"])
+        self.assertEqual(stores["transfers"].null_ids, set())
+        self.assertEqual(stores["transfers"].completed, {1, 2, 3, 4})
+
+    def test_each_host_has_its_own_controller(self):
+        controllers = {}
+
+        async def fake_fetch_data(session, url, player_id, controller):
+            controllers.setdefault(url.rsplit("/", 1)[0], set()).add(controller)
+            return {"response": {"url": url}, "player_id": player_id}
+
+        stores = self.stores()
+        with mock.patch.object(tm_api, "fetch_data", fake_fetch_data):
+            asyncio.run(tm_api.fetch_players(None, [1, 2], tm_api.HostControllers(), stores))
+        for store in stores.values():
+            store.close()
+
+        # one controller for each endpoint, throttled independently
+        (market_values,), (transfers,) = controllers.values()
+        self.assertIsNot(market_values, transfers)
+
+    def crashed_run(self, player_ids, lines):
+        """Leave a partial transfers file as a run for `player_ids` that crashed would."""
+
+        for path in pathlib.Path(self.tmpdir.name).iterdir():
+            path.unlink()
+        store = self.stores()["transfers"]
+        store.open(player_ids)
+        store.close()
+        with open(store.partial_path, "a") as f:
+            f.writelines(json.dumps(line) + "\n" for line in lines)
+
+    def test_resumes_from_partial_file(self):
+        self.crashed_run([1, 2], [])
+        stores = self.stores()
+        with open(stores["transfers"].partial_path, "w") as f:
+            f.write(json.dumps({"response": {"url": "done"}, "player_id": 1}) + "\n")
+            f.write(json.dumps({"response": None, "player_id": 2}) + "\n")
+            f.write(json.dumps({"response": {"url": "dropped"}, "player_id": 99}) + "\n")
+            # a line cut short by a crash
+            f.write('{"response": {"url": "do')
+
+        self.fetch([1, 2], stores)
+
+        self.assertNotIn(tm_api.TRANSFERS_API + "1", self.calls)
+        self.assertIn(tm_api.TRANSFERS_API + "2", self.calls)
+        self.assertEqual(len(self.calls), 3)
+
+        transfers = self.read(stores["transfers"].partial_path)
+        self.assertEqual([item["player_id"] for item in transfers], [1, 2])
+        self.assertEqual(transfers[0]["response"], {"url": "done"})
+
+    def test_stale_partial_file_is_discarded(self):
+        done = {"response": {"url": "done"}, "player_id": 1}
+
+        # a run for other players
+        self.crashed_run([1, 2, 3], [done])
+        self.fetch([1, 2], self.stores())
+        self.assertEqual(len(self.calls), 4)
+
+        # a run started too long ago
+        self.calls.clear()
+        self.crashed_run([1, 2], [done])
+        later = datetime.now(timezone.utc) + timedelta(hours=tm_api.MAX_PARTIAL_AGE_HOURS + 1)
+        with mock.patch.object(tm_api, "datetime", mock.Mock(wraps=datetime, now=lambda tz: later)):
+            self.fetch([1, 2], self.stores())
+        self.assertEqual(len(self.calls), 4)
+
+        # while a recent run for the same players is resumed
+        self.calls.clear()
+        self.crashed_run([1, 2], [done])
+        self.fetch([1, 2], self.stores())
+        self.assertEqual(len(self.calls), 3)
+
+    def test_failed_run_keeps_raw_file_and_partial_file(self):
+        self.failing = {tm_api.TRANSFERS_API + str(player_id) for player_id in range(10)}
+        stores = self.stores()
+        with open(stores["transfers"].path, "w") as f:
+            f.write("good data\n")
+
+        with mock.patch.object(tm_api, "MAX_BATCH_RETRIES", 0):
+            self.fetch(list(range(10)), stores)
+
+        with self.assertRaises(RuntimeError):
+            stores["transfers"].finish()
+
+        with open(stores["transfers"].path) as f:
+            self.assertEqual(f.read(), "good data\n")
+        # nothing good came back, so there is nothing to resume from
+        self.assertEqual(self.read(stores["transfers"].partial_path), [])
+
+
+class InTmpDirTestCase(unittest.TestCase):
+    """Runs each test from a temporary directory, where the acquirer reads and writes data/raw."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        self.addCleanup(os.chdir, cwd)
+
+
+class TestMultiSeason(InTmpDirTestCase):
+    """Players in several seasons are requested once and written to every season."""
+
+    def test_players_are_fetched_once_for_all_seasons(self):
+        player_ids_by_season = {2023: [1, 2], 2024: [2, 3]}
         calls = []
 
-        async def fake_get_transfers(ids):
-            calls.append(list(ids))
-            # first call fails for some players, retries then succeed
-            if len(calls) == 1:
-                return responses(ids, null_ids=failed_first_time)
-            return responses(ids)
+        async def fake_fetch_data(session, url, player_id, controller):
+            calls.append(url)
+            return {"response": {"url": url}, "player_id": player_id}
+
+        controllers = tm_api.HostControllers(requests_per_second=1000, burst=1000)
+        with mock.patch.object(tm_api, "fetch_data", fake_fetch_data), \
+                mock.patch.object(tm_api, "get_player_ids", lambda season, **kwargs: player_ids_by_season[season]):
+            asyncio.run(tm_api.run_for_seasons([2023, 2024], None, controllers))
+
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(len(set(calls)), 6)
+
+        for season, player_ids in player_ids_by_season.items():
+            for path in tm_api.target_paths(season).values():
+                with open(path) as f:
+                    written = [json.loads(line) for line in f]
+                self.assertEqual(sorted(item["player_id"] for item in written), player_ids)
+
+
+class TestIncremental(InTmpDirTestCase):
+    """Incremental runs only request the players whose data is likely to have changed."""
+
+    def test_only_due_players_are_requested(self):
+        now = datetime(2026, 8, 1, tzinfo=timezone.utc)
+        signals = {
+            player_id: {"current_market_value": "1m", "highest_market_value": "2m", "parent": "10"}
+            for player_id in [1, 2, 3, 4]
+        }
+        fresh, expired = (now - timedelta(days=1)).isoformat(), (now - timedelta(days=60)).isoformat()
+        state_path = "data/raw/transfermarkt-api/players_state.json"
+        pathlib.Path(state_path).parent.mkdir(parents=True)
+        with open(state_path, "w") as f:
+            json.dump({
+                "1": {"signals": signals[1], "fingerprints": {}, "fetched_at": fresh},
+                "2": {"signals": dict(signals[2], parent="11"), "fingerprints": {}, "fetched_at": fresh},
+                "3": {"signals": signals[3], "fingerprints": {}, "fetched_at": expired},
+            }, f)
+
+        for path in tm_api.target_paths(2024).values():
+            pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                f.writelines(json.dumps({"response": {"old": True}, "player_id": pid}) + "\n" for pid in [1, 2, 3])
+
+        calls = []
+
+        async def fake_fetch_data(session, url, player_id, controller):
+            calls.append(player_id)
+            return {"response": {"new": True}, "player_id": player_id}
+
+        state = tm_api.PlayerState(state_path, ttl_days=28, now=now)
+        controllers = tm_api.HostControllers(requests_per_second=1000, burst=1000)
+        with mock.patch.object(tm_api, "fetch_data", fake_fetch_data), \
+                mock.patch.object(tm_api, "get_player_ids", lambda season, **kwargs: [1, 2, 3, 4]), \
+                mock.patch.object(tm_api, "get_change_signals", lambda season: signals):
+            asyncio.run(tm_api.run_for_seasons([2024], None, controllers, state=state))
+
+        # 2 moved clubs, 3 expired and 4 is new, while 1 keeps its previous response
+        self.assertEqual(sorted(set(calls)), [2, 3, 4])
+        for path in tm_api.target_paths(2024).values():
+            with open(path) as f:
+                written = {item["player_id"]: item["response"] for item in map(json.loads, f)}
+            self.assertEqual(written, {1: {"old": True}, 2: {"new": True}, 3: {"new": True}, 4: {"new": True}})
+
+        with open(state_path) as f:
+            saved = json.load(f)
+        self.assertEqual(saved["1"]["fetched_at"], fresh)
+        self.assertEqual(saved["2"]["signals"], signals[2])
+        self.assertEqual(saved["4"]["fetched_at"], now.isoformat())
+        self.assertEqual(set(saved["4"]["fingerprints"]), {"market values", "transfers"})
+
+    def run_with_failures(self, player_ids, due, failing):
+        """Run a season where the players in `due` moved clubs and the requests for `failing` fail."""
+
+        now = datetime(2026, 8, 1, tzinfo=timezone.utc)
+        signals = {player_id: {"parent": "10"} for player_id in player_ids}
+        state_path = "data/raw/transfermarkt-api/players_state.json"
+        pathlib.Path(state_path).parent.mkdir(parents=True)
+        with open(state_path, "w") as f:
+            json.dump({
+                str(player_id): {
+                    "signals": {"parent": "11"} if player_id in due else signals[player_id],
+                    "fingerprints": {},
+                    "fetched_at": now.isoformat()
+                }
+                for player_id in player_ids
+            }, f)
+
+        for path in tm_api.target_paths(2024).values():
+            pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                f.writelines(json.dumps({"response": {"old": True}, "player_id": pid}) + "\n" for pid in player_ids)
+
+        async def fake_fetch_data(session, url, player_id, controller):
+            return {"response": None if player_id in failing else {"new": True}, "player_id": player_id}
+
+        state = tm_api.PlayerState(state_path, now=now)
+        controllers = tm_api.HostControllers(requests_per_second=1000, burst=1000)
+        with mock.patch.object(tm_api, "fetch_data", fake_fetch_data), \
+                mock.patch.object(tm_api, "get_player_ids", lambda season, **kwargs: player_ids), \
+                mock.patch.object(tm_api, "get_change_signals", lambda season: signals):
+            asyncio.run(tm_api.run_for_seasons([2024], None, controllers, state=state))
+
+    def read_responses(self):
+        with open(tm_api.target_paths(2024)["transfers"]) as f:
+            return {item["player_id"]: item["response"] for item in map(json.loads, f)}
+
+    def test_blocked_run_is_not_persisted(self):
+        # a few players are due and every request for them fails
+        with self.assertRaises(RuntimeError):
+            self.run_with_failures(list(range(1, 21)), due={1, 2}, failing={1, 2})
+
+        self.assertEqual(self.read_responses(), {pid: {"old": True} for pid in range(1, 21)})
+
+    def test_failed_players_keep_their_previous_response(self):
+        self.run_with_failures(list(range(1, 11)), due=set(range(1, 11)), failing={3})
 
-        with mock.patch.object(tm_api, "get_transfers", fake_get_transfers):
-            result = tm_api.fetch_with_retries(tm_api.get_transfers, player_ids, "transfers")
+        responses = self.read_responses()
+        self.assertEqual(responses[3], {"old": True})
+        self.assertEqual(responses[4], {"new": True})
+        self.assertEqual(len(responses), 10)
 
-        self.assertGreaterEqual(len(calls), 2, "null transfer responses were never retried")
-        self.assertEqual(calls[1], [2, 3], "retry should only re-request the failed players")
-        self.assertEqual([r["player_id"] for r in result], player_ids)
-        self.assertEqual([r for r in result if r["response"] is None], [])
+
+class TestConcurrencyController(unittest.TestCase):
+    """Requests are admitted by a token bucket and an AIMD concurrency window."""
+
+    def test_window_grows_and_backs_off_once_per_burst_of_failures(self):
+        controller = tm_api.ConcurrencyController(requests_per_second=1000, burst=1000, initial_concurrency=4)
+
+        async def run():
+            slots = [await controller.slot() for _ in range(4)]
+            for slot in slots:
+                slot.fail()
+                await controller.release(slot)
+            self.assertEqual(controller.limit, 2)
+            self.assertEqual(controller.backoffs, 1)
+
+            async with await controller.slot():
+                pass
+            self.assertEqual(controller.limit, 2.5)
+
+        asyncio.run(run())
+
+    def test_in_flight_requests_are_bounded(self):
+        controller = tm_api.ConcurrencyController(
+            requests_per_second=1000, burst=1000, initial_concurrency=3, max_concurrency=3
+        )
+        in_flight = []
+
+        async def request():
+            async with await controller.slot():
+                in_flight.append(controller.in_flight)
+                await asyncio.sleep(0.001)
+
+        async def run():
+            await asyncio.gather(*[request() for _ in range(30)])
+
+        asyncio.run(run())
+        self.assertEqual(len(in_flight), 30)
+        self.assertEqual(max(in_flight), 3)
+        self.assertEqual(controller.in_flight, 0)
+
+    def test_requests_are_rate_limited(self):
+        controller = tm_api.ConcurrencyController(requests_per_second=100, burst=1, initial_concurrency=64)
+
+        async def run():
+            for _ in range(11):
+                async with await controller.slot():
+                    pass
+
+        start = time.monotonic()
+        asyncio.run(run())
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+class TestGetPlayerIds(InTmpDirTestCase):
+    """Player ids are read from the scraper files through the raw cache."""
+
+    def setUp(self):
+        super().setUp()
+        season_path = pathlib.Path("data/raw/transfermarkt-scraper/2025")
+        season_path.mkdir(parents=True)
+        files = {
+            "players.json.gz": [
+                {"href": "/a/spieler/1", "parent": {"href": "/a/verein/10"}},
+                {"href": "/a/spieler/2", "parent": {"href": "/a/verein/11"}},
+                {"href": "/a/spieler/3"},
+            ],
+            "clubs.json.gz": [
+                {"href": "/a/verein/10", "parent": {"href": "/a/wettbewerb/GB1"}},
+                {"href": "/a/verein/11", "parent": {"href": "/a/wettbewerb/ES1"}},
+            ],
+        }
+        for file_name, records in files.items():
+            with gzip.open(season_path / file_name, "wt") as f:
+                f.writelines(json.dumps(record) + "\n" for record in records)
+
+    def test_filters(self):
+        self.assertEqual(tm_api.get_player_ids(2025), [1, 2, 3])
+        self.assertEqual(tm_api.get_player_ids(2025, player_filter={"2"}), [2])
+        self.assertEqual(tm_api.get_player_ids(2025, club_filter={"11"}), [2])
+        self.assertEqual(tm_api.get_player_ids(2025, competition_filter={"GB1"}), [1])
+        self.assertTrue(pathlib.Path("data/raw/.cache/transfermarkt-scraper/2025").is_dir())
 
 
 if __name__ == "__main__":
@@ -1,13 +1,21 @@
 
+import gzip
+import json
+import os
+import tempfile
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from transfermarkt_datasets.core.asset import (
     Asset,
-    RawAsset
+    RawAsset,
+    InvalidPreparedDF
 )
+from transfermarkt_datasets.core.cache import RawCache
 from transfermarkt_datasets.core.schema import Schema, Field
+from transfermarkt_datasets.core.utils import concat_preallocated
 
 class TestAsset(unittest.TestCase):
 
@@ -24,6 +32,63 @@ class TestAsset(unittest.TestCase):
             1000
         )
 
+    def test_load_raw_in_parallel(self):
+
+        class BaseGamesAsset(RawAsset):
+            name = "games"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for season, games in [(2020, [1, 2]), (2021, []), (2022, [3])]:
+                os.makedirs(f"{tmpdir}/{season}")
+                with gzip.open(f"{tmpdir}/{season}/games.json.gz", "wt") as f:
+                    for game_id in games:
+                        f.write(json.dumps({
+                            "game_id": game_id,
+                            "home_club": {"href": f"/club/{game_id}"},
+                            "date": "2020-08-18"
+                        }) + "\n")
+
+            at = BaseGamesAsset(settings={"seasons": [2020, 2021, 2022]})
+            at.raw_files_path = tmpdir
+            at.load_raw(workers=2)
+
+            self.assertEqual(at.raw_df["game_id"].tolist(), [1, 2, 3])
+            self.assertEqual(at.raw_df["season"].tolist(), [2020, 2020, 2022])
+            self.assertEqual(at.raw_df["home_club"][0], {"href": "/club/1"})
+
+            at.load_raw(fields=["game_id", "date"])
+            self.assertEqual(
+                list(at.raw_df.columns),
+                ["game_id", "date", "season", "season_file"]
+            )
+            self.assertTrue(pd.api.types.is_datetime64_any_dtype(at.raw_df["date"]))
+
+            # the same through the raw cache, which cannot hold the empty season
+            at.raw_cache = RawCache(f"{tmpdir}/.cache", raw_root=tmpdir)
+            at.load_raw(fields=["game_id", "date"])
+            at.load_raw(fields=["game_id", "date"])
+            self.assertEqual(at.raw_df["game_id"].tolist(), [1, 2, 3])
+            self.assertTrue(pd.api.types.is_datetime64_any_dtype(at.raw_df["date"]))
+            self.assertEqual(
+                [len([name for name in os.listdir(f"{tmpdir}/.cache/{season}") if name.endswith(".parquet")])
+                 for season in [2020, 2021, 2022]],
+                [1, 0, 1]
+            )
+
+    def test_concat_mixed_types(self):
+
+        def parts():
+            return [
+                pd.DataFrame({"a": [1, 2], "b": [True, False], "c": ["x", "y"]}),
+                pd.DataFrame({"a": [0.5], "b": [3], "d": [1]}),
+            ]
+
+        expected = pd.concat(parts(), ignore_index=True)
+        result = concat_preallocated(parts())
+
+        self.assertEqual(dict(result.dtypes), dict(expected.dtypes))
+        pd.testing.assert_frame_equal(result, expected)
+
     def test_string_representation(self):
 
         class SomeAsset(Asset):
@@ -67,6 +132,34 @@ class TestAsset(unittest.TestCase):
             ["col1", "col2", "col3"]
         )
 
+    def test_df_assignment_does_not_copy(self):
+
+        class TestAsset(Asset):
+            def __init__(self, settings: dict = None) -> None:
+                super().__init__(settings)
+
+                self.schema = Schema(
+                    fields=[
+                        Field(name="col1", type="integer"),
+                        Field(name="col2", type="number")
+                    ]
+                )
+
+        at = TestAsset()
+
+        df = pd.DataFrame(data={"col1": [1, 2], "col2": [0.2, 0.4]})
+        at.prep_df = df
+        self.assertIs(at.prep_df, df)
+
+        df = pd.DataFrame(data={"col2": [0.2, 0.4], "col1": [1, 2]})
+        at.prep_df = df
+        self.assertEqual(list(at.prep_df.columns), ["col1", "col2"])
+        self.assertTrue(np.shares_memory(at.prep_df["col2"].to_numpy(), df["col2"].to_numpy()))
+
+        usage = at.memory_usage()
+        self.assertEqual(list(usage.index), ["Index", "col1", "col2"])
+        self.assertEqual(usage["col1"], 16)
+
     def test_asset_file_name(self):
         class TestAssetAAsset(Asset):
             name = "asset_a"
@@ -125,3 +218,133 @@ class TestAsset(unittest.TestCase):
 
         self.assertTrue(df.equals(df_expected))
 
+    def test_lazy_load(self):
+
+        class TestAsset(Asset):
+            name = "test_asset"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+
+                self.schema = Schema(
+                    fields=[
+                        Field(name="col1", type="string"),
+                        Field(name="col2", type="integer")
+                    ]
+                )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pd.DataFrame(
+                data={"col1": ["a", "b"], "col2": [1, 2]}
+            ).to_csv(f"{tmpdir}/test_asset.csv.gz", index=False)
+
+            at = TestAsset(lazy=True)
+            at.prep_location = tmpdir
+
+            self.assertFalse(at.is_loaded)
+            self.assertEqual(len(at.prep_df), 2)
+            self.assertTrue(at.is_loaded)
+
+            eager = TestAsset()
+            eager.prep_location = tmpdir
+
+            self.assertIsNone(eager.prep_df)
+            self.assertFalse(eager.is_loaded)
+
+    def test_typed_load(self):
+
+        class TestAsset(Asset):
+            name = "test_asset"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+
+                self.schema = Schema(
+                    fields=[
+                        Field(name="some_id", type="integer"),
+                        Field(name="some_name", type="string"),
+                        Field(name="some_value", type="number"),
+                        Field(name="some_date", type="date"),
+                        Field(name="some_flag", type="boolean")
+                    ]
+                )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(f"{tmpdir}/test_asset.csv.gz", "wb") as f:
+                f.write(gzip.compress(
+                    b"some_id,some_name,some_value,some_date,some_flag\n"
+                    b"1,a,0.5,2012-08-05,true\n"
+                    b",,,not-a-date,\n"
+                ))
+
+            for engine in [None, "pyarrow"]:
+                at = TestAsset()
+                at.prep_location = tmpdir
+                at.load_from_prep(engine=engine)
+
+                self.assertEqual(
+                    at.prep_df.dtypes.astype(str).to_dict(),
+                    {
+                        "some_id": "Int64",
+                        "some_name": "string",
+                        "some_value": "float64",
+                        "some_date": "datetime64[ns]",
+                        "some_flag": "boolean"
+                    }
+                )
+                self.assertEqual(at.prep_df["some_id"].isna().sum(), 1)
+                self.assertTrue(pd.isna(at.prep_df["some_date"][1]))
+
+    def test_load_with_projection_and_filters(self):
+
+        class TestAsset(Asset):
+            name = "test_asset"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+
+                self.schema = Schema(
+                    fields=[
+                        Field(name="some_id", type="integer"),
+                        Field(name="season", type="integer"),
+                        Field(name="some_name", type="string")
+                    ]
+                )
+
+        df = pd.DataFrame(
+            data={
+                "some_id": [1, 2, 3],
+                "season": [2012, 2013, 2014],
+                "some_name": ["a", "b", "c"]
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            df.to_csv(f"{tmpdir}/test_asset.csv.gz", index=False)
+
+            for file_format in ["csv", "parquet"]:
+                if file_format == "parquet":
+                    df.to_parquet(f"{tmpdir}/test_asset.parquet", index=False)
+
+                at = TestAsset()
+                at.prep_location = tmpdir
+                at.load_from_prep(
+                    columns=["some_name", "some_id"],
+                    filters=[("season", ">=", 2013)]
+                )
+
+                self.assertEqual(
+                    list(at.prep_df.columns),
+                    ["some_id", "some_name"]
+                )
+                self.assertEqual(
+                    list(at.prep_df["some_id"]),
+                    [2, 3]
+                )
+                self.assertEqual(
+                    str(at.prep_df["some_id"].dtype),
+                    "Int64"
+                )
+
+            with self.assertRaises(InvalidPreparedDF):
+                at.load_from_prep(columns=["not_a_field"])
@@ -0,0 +1,204 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from transfermarkt_datasets.core.asset import Asset
+from transfermarkt_datasets.core.cache import PrepCache, RawCache, file_fingerprint
+from transfermarkt_datasets.core.schema import Schema, Field
+
+class TestPrepCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+        self.source_path = os.path.join(self.tmpdir.name, "some_asset.csv.gz")
+        pd.DataFrame(
+            data={"some_id": [1, 2, 3], "some_name": ["a", "b", "c"]}
+        ).to_csv(self.source_path, index=False)
+
+        self.cache = PrepCache(os.path.join(self.tmpdir.name, ".cache"))
+        self.builds = 0
+
+    def build(self) -> pd.DataFrame:
+        self.builds += 1
+        return pd.read_csv(self.source_path, dtype={"some_id": "Int64", "some_name": "string"})
+
+    def test_file_fingerprint(self):
+
+        fingerprint = file_fingerprint(self.source_path)
+        self.assertEqual(
+            set(fingerprint.keys()),
+            {"size", "mtime_ns", "sha256"}
+        )
+
+        # a matching size and mtime reuse the known hash instead of rehashing
+        known = dict(fingerprint, sha256="known")
+        self.assertEqual(
+            file_fingerprint(self.source_path, known)["sha256"],
+            "known"
+        )
+
+    def test_read_builds_once(self):
+
+        df = self.cache.read(self.source_path, self.build)
+        df_cached = self.cache.read(self.source_path, self.build)
+
+        self.assertEqual(self.builds, 1)
+        self.assertTrue(df.equals(df_cached))
+        self.assertEqual(str(df_cached["some_id"].dtype), "Int64")
+
+    def test_read_with_projection_and_filters(self):
+
+        df = self.cache.read(
+            self.source_path,
+            self.build,
+            columns=["some_name"],
+            filters=[("some_id", ">", 1)]
+        )
+
+        self.assertEqual(list(df.columns), ["some_name"])
+        self.assertEqual(list(df["some_name"]), ["b", "c"])
+
+    def test_changed_source_invalidates_entry(self):
+
+        self.cache.read(self.source_path, self.build)
+
+        pd.DataFrame(
+            data={"some_id": [4], "some_name": ["d"]}
+        ).to_csv(self.source_path, index=False)
+        df = self.cache.read(self.source_path, self.build)
+
+        self.assertEqual(self.builds, 2)
+        self.assertEqual(list(df["some_id"]), [4])
+        self.assertEqual(
+            len([name for name in os.listdir(self.cache.cache_dir) if name.endswith(".arrow")]),
+            1
+        )
+
+    def test_salts_share_the_cache(self):
+
+        def entries():
+            return sorted(name for name in os.listdir(self.cache.cache_dir) if name.endswith(".arrow"))
+
+        # readers with different salts keep each their entry of the current version
+        self.cache.read(self.source_path, self.build, salt="a")
+        self.cache.read(self.source_path, self.build, salt="b")
+        self.cache.read(self.source_path, self.build, salt="a")
+        self.assertEqual(self.builds, 2)
+        self.assertEqual(len(entries()), 2)
+
+        # and both are replaced once the source changes
+        pd.DataFrame(
+            data={"some_id": [4], "some_name": ["d"]}
+        ).to_csv(self.source_path, index=False)
+        self.cache.read(self.source_path, self.build, salt="a")
+        self.assertEqual(entries(), [os.path.basename(self.cache.entry_path(self.source_path, "a"))])
+
+    def test_stale_entry_removed_concurrently(self):
+
+        self.cache.read(self.source_path, self.build)
+        pd.DataFrame(
+            data={"some_id": [4], "some_name": ["d"]}
+        ).to_csv(self.source_path, index=False)
+
+        # another process removes the stale entry between listing and removing it
+        remove = os.remove
+        def remove_twice(path):
+            remove(path)
+            remove(path)
+
+        with mock.patch("os.remove", remove_twice):
+            df = self.cache.read(self.source_path, self.build)
+
+        self.assertEqual(list(df["some_id"]), [4])
+
+    def test_asset_reads_through_cache(self):
+
+        class SomeAsset(Asset):
+            name = "some_asset"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+
+                self.schema = Schema(
+                    fields=[
+                        Field(name="some_id", type="integer"),
+                        Field(name="some_name", type="string")
+                    ]
+                )
+
+        at = SomeAsset()
+        at.prep_location = self.tmpdir.name
+        at.cache = self.cache
+
+        at.load_from_prep()
+        at.load_from_prep()
+
+        self.assertEqual(len(at.prep_df), 3)
+        self.assertEqual(
+            len([name for name in os.listdir(self.cache.cache_dir) if name.endswith(".arrow")]),
+            1
+        )
+
+class TestRawCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+        self.raw_root = os.path.join(self.tmpdir.name, "raw")
+        self.cache = RawCache(os.path.join(self.raw_root, ".cache"), raw_root=self.raw_root)
+
+    def write_season(self, season: int, records: list) -> str:
+        path = os.path.join(self.raw_root, "some-acquirer", str(season), "players.json.gz")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(path, "wt") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+        return path
+
+    def entries(self, season: int) -> list:
+        return [
+            name for name in os.listdir(os.path.join(self.cache.cache_dir, "some-acquirer", str(season)))
+            if name.endswith(".parquet")
+        ]
+
+    def test_read_with_fields(self):
+
+        path = self.write_season(2020, [
+            {"href": "/a/1", "name": "a", "parent": {"href": "/c/10"}},
+            {"href": "/a/2", "name": "b", "parent": {"href": "/c/11"}}
+        ])
+
+        df = self.cache.read(path, ["href", "parent", "missing"])
+
+        self.assertEqual(list(df.columns), ["href", "parent"])
+        self.assertEqual(df["parent"][1], {"href": "/c/11"})
+        self.assertEqual(self.entries(2020), [os.path.basename(self.cache.entry_path(path))])
+
+    def test_seasons_do_not_collide(self):
+
+        path_2020 = self.write_season(2020, [{"href": "/a/1"}])
+        path_2021 = self.write_season(2021, [{"href": "/a/2"}, {"href": "/a/3"}])
+
+        self.assertEqual(len(self.cache.read(path_2020)), 1)
+        self.assertEqual(len(self.cache.read(path_2021)), 2)
+        self.assertEqual(len(self.cache.read(path_2020)), 1)
+
+    def test_changed_source_invalidates_entry(self):
+
+        path = self.write_season(2020, [{"href": "/a/1"}])
+        self.cache.read(path)
+        entry_path = self.cache.entry_path(path)
+
+        path = self.write_season(2020, [{"href": "/a/1"}, {"href": "/a/2"}])
+        df = self.cache.read(path)
+
+        self.assertEqual(len(df), 2)
+        self.assertNotEqual(self.cache.entry_path(path), entry_path)
+        self.assertEqual(len(self.entries(2020)), 1)
@@ -0,0 +1,166 @@
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+
+import pandas as pd
+
+from transfermarkt_datasets.core.asset import Asset
+from transfermarkt_datasets.core.cache import PrepCache
+from transfermarkt_datasets.core.compact import StringPool, compact_dataframe, smallest_integer_dtype
+from transfermarkt_datasets.core.schema import Schema, Field
+
+class TestCompact(unittest.TestCase):
+
+    def setUp(self) -> None:
+        class TestAsset(Asset):
+            name = "test_asset"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+
+                self.schema = Schema(
+                    fields=[
+                        Field(name="some_id", type="integer"),
+                        Field(name="minute", type="integer"),
+                        Field(name="position", type="string", tags=["categorical"]),
+                        Field(name="some_name", type="string")
+                    ]
+                )
+
+        self.asset_class = TestAsset
+        self.df = pd.DataFrame(
+            data={
+                "some_id": [1, 40_000, None],
+                "minute": [1, 90, 120],
+                "position": ["Attack", "Defender", "Attack"],
+                "some_name": ["a", "b", "c"]
+            }
+        )
+
+    def test_smallest_integer_dtype(self):
+
+        self.assertEqual(smallest_integer_dtype(pd.Series([0, 127], dtype="Int64")), "Int8")
+        self.assertEqual(smallest_integer_dtype(pd.Series([-129, None], dtype="Int64")), "Int16")
+        self.assertEqual(smallest_integer_dtype(pd.Series([2**40], dtype="Int64")), "Int64")
+        self.assertEqual(smallest_integer_dtype(pd.Series([None], dtype="Int64")), "Int8")
+
+    def test_compact_dataframe(self):
+
+        schema = self.asset_class().schema
+        df = compact_dataframe(self.df.astype(schema.pandas_dtypes), schema)
+
+        self.assertEqual(
+            df.dtypes.astype(str).to_dict(),
+            {"some_id": "Int32", "minute": "Int8", "position": "category", "some_name": "string"}
+        )
+        self.assertEqual(df["position"].tolist(), ["Attack", "Defender", "Attack"])
+
+    def test_compact_load(self):
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.df.to_csv(f"{tmpdir}/test_asset.csv.gz", index=False)
+
+            for cache in [None, PrepCache(f"{tmpdir}/.cache")]:
+                at = self.asset_class()
+                at.prep_location = tmpdir
+                at.compact = True
+                at.cache = cache
+                at.load_from_prep(filters=[("position", "==", "Attack")])
+
+                self.assertEqual(at.prep_df["some_id"].tolist(), [1, pd.NA])
+                self.assertEqual(str(at.prep_df["minute"].dtype), "Int8")
+                self.assertIsInstance(at.prep_df["position"].dtype, pd.CategoricalDtype)
+
+class TestStringPool(unittest.TestCase):
+
+    def setUp(self) -> None:
+        class ClubsAsset(Asset):
+            name = "clubs"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.schema = Schema(
+                    fields=[
+                        Field(name="club_id", type="integer"),
+                        Field(name="name", type="string", tags=["entity_name"])
+                    ]
+                )
+
+        class GamesAsset(Asset):
+            name = "games"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.schema = Schema(
+                    fields=[
+                        Field(name="game_id", type="integer"),
+                        Field(name="home_club_name", type="string", tags=["entity_name"]),
+                        Field(name="away_club_name", type="string", tags=["entity_name", "categorical"])
+                    ]
+                )
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+        pd.DataFrame(
+            data={"club_id": [1, 2], "name": ["Real Madrid", "Barcelona"]}
+        ).to_csv(f"{self.tmpdir.name}/clubs.csv.gz", index=False)
+        pd.DataFrame(
+            data={
+                "game_id": [1, 2],
+                "home_club_name": ["Real Madrid", "Getafe"],
+                "away_club_name": ["Barcelona", None]
+            }
+        ).to_csv(f"{self.tmpdir.name}/games.csv.gz", index=False)
+
+        self.pool = StringPool()
+        self.clubs = ClubsAsset()
+        self.games = GamesAsset()
+        for asset in [self.clubs, self.games]:
+            asset.prep_location = self.tmpdir.name
+            asset.compact = True
+            asset.string_pool = self.pool
+
+    def test_shared_dictionary(self):
+
+        self.clubs.load_from_prep()
+        version = self.pool.version
+        self.games.load_from_prep()
+
+        # "Getafe" is new to the pool, every name is stored once
+        self.assertGreater(self.pool.version, version)
+        self.assertEqual(len(self.pool), 3)
+
+        clubs, games = self.clubs.prep_df, self.games.prep_df
+        for df, name in [(clubs, "name"), (games, "home_club_name"), (games, "away_club_name")]:
+            self.assertEqual(df[name].dtype, self.pool.dtype)
+
+        # names compare across assets through their codes
+        self.assertEqual(
+            games["home_club_name"].isin(clubs["name"]).tolist(),
+            [True, False]
+        )
+        self.assertEqual(
+            (games["away_club_name"] == clubs["name"][1]).tolist(),
+            [True, False]
+        )
+        self.assertTrue(pd.isna(games["away_club_name"][1]))
+
+    def test_pool_shared_by_threads(self):
+
+        pool = StringPool()
+        barrier = threading.Barrier(8)
+        names = [pd.DataFrame({"name": [f"{worker}-{i}" for i in range(500)]}) for worker in range(8)]
+
+        def encode(df):
+            barrier.wait()
+            return pool.encode(df, ["name"])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            encoded = list(executor.map(encode, names))
+
+        # no addition is lost to a concurrent one, and no value to a stale dtype
+        self.assertEqual(len(pool), 8 * 500)
+        for df, result in zip(names, encoded):
+            self.assertEqual(result["name"].astype(object).tolist(), df["name"].tolist())
@@ -2,12 +2,18 @@
 import pathlib
 import unittest
 import pytest
-from transfermarkt_datasets.core.dataset import Dataset
+from transfermarkt_datasets.core.dataset import Dataset, AssetNotFound, InvalidJoin
 from transfermarkt_datasets.core.asset import Asset
+from transfermarkt_datasets.core.compact import StringPool
+from transfermarkt_datasets.core.integrity import as_field_list
+from transfermarkt_datasets.core.schema import Field, Schema
+
+import pandas as pd
 
 from frictionless.package import Package
 
 import tempfile
+from unittest import mock
 
 import sys
 from os import path
@@ -105,6 +111,20 @@ class BaseSomethingAsset(Asset):
                 ["base_something"]
             )
 
+    def test_asset_manifest_is_up_to_date(self):
+
+        td = Dataset(use_manifest=False)
+
+        self.assertEqual(
+            td.read_asset_manifest(),
+            td.discover_assets(),
+            "the assets manifest is stale, regenerate it with `just asset_manifest`"
+        )
+        self.assertEqual(
+            Dataset().asset_names,
+            td.asset_names
+        )
+
     def test_datapackage(self):
 
         td = self.dataset
@@ -125,3 +145,399 @@ class BaseSomethingAsset(Asset):
             dp_excluded.resource_names,
             ["file1"]
         )
+
+    def test_load_assets_by_name(self):
+
+        td = self.dataset
+        loaded = []
+        for asset in td.assets.values():
+            asset.load_from_prep = lambda name=asset.name, **kwargs: loaded.append(name)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for asset in td.assets.values():
+                asset.prep_location = tmpdir
+                pathlib.Path(asset.prep_path).touch()
+
+            td.load_assets(names=["base_something_b"])
+            self.assertEqual(loaded, ["base_something_b"])
+
+            with self.assertRaises(AssetNotFound):
+                td.load_assets(names=["base_something_c"])
+
+            loaded.clear()
+            td.load_assets()
+            self.assertEqual(loaded, ["base_something_a"])
+
+    def test_load_assets_in_parallel(self):
+
+        td = self.dataset
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for asset in td.assets.values():
+                asset.prep_location = tmpdir
+                asset.schema.add_field(Field(name="some_id", type="integer"))
+                pd.DataFrame(data={"some_id": [1, 2, 3]}).to_csv(asset.prep_path, index=False)
+
+            stats = td.load_assets(
+                names=["base_something_a", "base_something_b"],
+                workers=2
+            )
+
+            self.assertEqual(set(stats.keys()), {"base_something_a", "base_something_b"})
+            for asset_name, asset_stats in stats.items():
+                self.assertEqual(len(td.assets[asset_name].prep_df), 3)
+                self.assertGreater(asset_stats["bytes"], 0)
+                self.assertGreaterEqual(asset_stats["seconds"], 0)
+
+    def test_load_assets_in_processes_compact(self):
+
+        td = Dataset(compact=True)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            names = {
+                "cur_clubs": {"name": ["Real Madrid", "Getafe"]},
+                "cur_games": {"home_club_name": ["Real Madrid", "Barcelona"], "away_club_name": ["Getafe", None]},
+            }
+            for asset_name, columns in names.items():
+                asset = td.assets[asset_name]
+                asset.prep_location = tmpdir
+                df = pd.DataFrame({name: [None, None] for name in asset.schema.field_names})
+                df = df.assign(**columns)
+                df.to_csv(asset.prep_path, index=False)
+
+            stats = td.load_assets(names=list(names), workers=2, executor="process")
+            self.assertEqual(set(stats), set(names))
+            self.assertTrue(all(asset_stats["bytes"] > 0 for asset_stats in stats.values()))
+
+            # entity names are encoded through the pool shared by the dataset
+            clubs, games = td.assets["cur_clubs"].prep_df, td.assets["cur_games"].prep_df
+            for df, name in [(clubs, "name"), (games, "home_club_name"), (games, "away_club_name")]:
+                self.assertEqual(df[name].dtype, td.string_pool.dtype)
+            self.assertEqual(len(td.string_pool), 3)
+            self.assertEqual(games["home_club_name"].isin(clubs["name"]).tolist(), [True, False])
+
+            # the assets are loaded from their files as if read in this process
+            self.assertEqual(td.refresh(), {})
+            self.assertIsNone(td.assets["cur_games"].memory_version)
+
+            clubs_asset = td.assets["cur_clubs"]
+            pd.DataFrame(
+                {name: [None] for name in clubs_asset.schema.field_names}
+            ).assign(name=["Sevilla"]).to_csv(clubs_asset.prep_path, index=False)
+            self.assertEqual(set(td.refresh()), {"cur_clubs"})
+            self.assertEqual(clubs_asset.prep_df["name"].dtype, td.string_pool.dtype)
+            self.assertEqual(len(td.string_pool), 4)
+
+    def test_refresh(self):
+
+        td = self.dataset
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for asset in td.assets.values():
+                asset.prep_location = tmpdir
+                asset.schema.add_field(Field(name="some_id", type="integer"))
+                pd.DataFrame(data={"some_id": [1, 2, 3]}).to_csv(asset.prep_path, index=False)
+
+            td.load_assets(names=["base_something_a", "base_something_b"])
+            self.assertEqual(td.refresh(), {})
+
+            asset_b = td.assets["base_something_b"]
+            loaded_df = asset_b.prep_df
+            pd.DataFrame(data={"some_id": [1, 2, 3, 4]}).to_csv(asset_b.prep_path, index=False)
+
+            stats = td.refresh()
+
+            self.assertEqual(set(stats.keys()), {"base_something_b"})
+            self.assertEqual(asset_b.prep_df["some_id"].tolist(), [1, 2, 3, 4])
+            self.assertEqual(len(loaded_df), 3)
+            self.assertEqual(td.refresh(), {})
+
+    def test_memory_report(self):
+
+        from transfermarkt_datasets.core.compact import StringPool
+
+        td = self.dataset
+        pool = StringPool()
+        asset_a = td.assets["base_something_a"]
+        asset_b = td.assets["base_something_b"]
+        for asset in [asset_a, asset_b]:
+            asset.schema.add_field(Field(name="club_name", type="string", tags=["entity_name"]))
+            asset.string_pool = pool
+
+        asset_a.prep_df = pd.DataFrame(data={"club_name": ["Real Madrid", "Barcelona"] * 50})
+        asset_b.prep_df = pd.DataFrame(data={"club_name": ["Barcelona"]})
+
+        report = td.memory_report()
+
+        self.assertEqual(list(report.columns), ["asset", "column", "dtype", "bytes"])
+        self.assertEqual(
+            report[report["column"] == "club_name"]["asset"].tolist(),
+            ["base_something_a", "base_something_b"]
+        )
+        # the shared categories are only counted once
+        categories_bytes = pool.dtype.categories.memory_usage(deep=True)
+        club_names = report.set_index(["asset", "column"])["bytes"]
+        self.assertGreater(club_names[("base_something_a", "club_name")], categories_bytes)
+        self.assertLess(club_names[("base_something_b", "club_name")], categories_bytes)
+
+    def test_validate_integrity(self):
+
+        td = self.dataset
+        asset_a = td.assets["base_something_a"]
+        asset_b = td.assets["base_something_b"]
+
+        asset_a.schema.add_field(Field(name="some_key", type="integer"))
+        asset_a.schema.add_field(Field(name="some_id", type="integer"))
+        asset_a.schema.primary_key = ["some_key"]
+        asset_b.schema.add_field(Field(name="some_other_id", type="integer"))
+        asset_b.schema.primary_key = ["some_other_id"]
+
+        asset_a.prep_df = pd.DataFrame(
+            data={
+                "some_key": pd.array([1, 2, 2, None], dtype="Int64"),
+                "some_id": pd.array([10, 20, 30, None], dtype="Int64")
+            }
+        )
+        asset_b.prep_df = pd.DataFrame(
+            data={"some_other_id": pd.array([10, 20], dtype="Int64")}
+        )
+
+        report = td.validate_integrity(names=["base_something_a", "base_something_b"])
+        checks = {
+            (check["type"], check["asset"]): check
+            for check in report["checks"]
+        }
+
+        self.assertFalse(report["valid"])
+
+        primary_key_check = checks[("primary-key", "base_something_a")]
+        self.assertEqual(primary_key_check["duplicates"], 1)
+        self.assertEqual(primary_key_check["nulls"], 1)
+        self.assertEqual(primary_key_check["violations"], 2)
+
+        self.assertEqual(checks[("primary-key", "base_something_b")]["violations"], 0)
+
+        foreign_key_check = checks[("foreign-key", "base_something_a")]
+        self.assertEqual(foreign_key_check["rows"], 3)
+        self.assertEqual(foreign_key_check["violations"], 1)
+        self.assertEqual(foreign_key_check["sample"], [{"some_id": 30}])
+
+    def test_validate_integrity_unknown_fields(self):
+
+        td = self.dataset
+        asset_a = td.assets["base_something_a"]
+        asset_a.schema.add_field(Field(name="some_key", type="integer"))
+        asset_a.schema.primary_key = ["some_key"]
+        asset_a.schema.foreign_keys = [
+            {"fields": "missing_id", "reference": {"resource": "base_something_b", "fields": "some_other_id"}}
+        ]
+        asset_a.prep_df = pd.DataFrame(data={"some_key": pd.array([1, 2], dtype="Int64")})
+
+        report = td.validate_integrity(names=["base_something_a"])
+        checks = {check["type"]: check for check in report["checks"]}
+
+        self.assertFalse(report["valid"])
+        self.assertEqual(checks["primary-key"]["violations"], 0)
+        self.assertEqual(
+            checks["foreign-key"]["error"],
+            "Unknown foreign key fields: base_something_a.missing_id, base_something_b.some_other_id"
+        )
+
+    def test_foreign_keys_match_schemas(self):
+
+        td = Dataset()
+
+        for relationship in td.get_relationships():
+            with self.subTest(relationship=relationship):
+                self.assertIn(relationship["to"], td.assets)
+                self.assertLessEqual(
+                    set(as_field_list(relationship["on"]["source"])),
+                    set(td.assets[relationship["from"]].schema.field_names)
+                )
+                self.assertLessEqual(
+                    set(as_field_list(relationship["on"]["target"])),
+                    set(td.assets[relationship["to"]].schema.field_names)
+                )
+
+    def test_join(self):
+
+        class GamesAsset(Asset):
+            name = "games"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.schema = Schema(
+                    fields=[
+                        Field(name="game_id", type="integer"),
+                        Field(name="season", type="integer")
+                    ]
+                )
+
+        class ClubsAsset(Asset):
+            name = "clubs"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.schema = Schema(
+                    fields=[
+                        Field(name="club_id", type="integer"),
+                        Field(name="name", type="string")
+                    ]
+                )
+
+        class ClubGamesAsset(Asset):
+            name = "club_games"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.schema = Schema(
+                    fields=[
+                        Field(name="club_id", type="integer"),
+                        Field(name="game_id", type="integer"),
+                        Field(name="name", type="string")
+                    ]
+                )
+                self.schema.foreign_keys = [
+                    {"fields": "club_id", "reference": {"resource": "clubs", "fields": "club_id"}},
+                    {"fields": "game_id", "reference": {"resource": "games", "fields": "game_id"}}
+                ]
+
+        td = self.dataset
+        td.assets = {
+            "games": GamesAsset(),
+            "clubs": ClubsAsset(),
+            "club_games": ClubGamesAsset()
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for asset in td.assets.values():
+                asset.prep_location = tmpdir
+
+            pd.DataFrame(
+                data={"game_id": [1, 2, 3], "season": [2012, 2013, 2013]}
+            ).to_csv(td.assets["games"].prep_path, index=False)
+            pd.DataFrame(
+                data={"club_id": [10, 20], "name": ["Club A", "Club B"]}
+            ).to_csv(td.assets["clubs"].prep_path, index=False)
+            pd.DataFrame(
+                data={
+                    "club_id": [10, 20, 10, 20, 30],
+                    "game_id": [1, 1, 2, 3, 3],
+                    "name": ["a", "b", "c", "d", "e"]
+                }
+            ).to_csv(td.assets["club_games"].prep_path, index=False)
+
+            # clubs is loaded, so it is joined through its index
+            td.assets["clubs"].load_from_prep()
+
+            df = td.join(
+                "club_games", "games", "clubs",
+                columns=["game_id", "season", "clubs.name", "name"],
+                where=[("season", "==", 2013)]
+            )
+
+            self.assertEqual(
+                list(df.columns),
+                ["game_id", "season", "clubs_name", "club_games_name"]
+            )
+            self.assertEqual(
+                df.astype(object).where(df.notna(), None).values.tolist(),
+                [[2, 2013, "Club A", "c"], [3, 2013, "Club B", "d"], [3, 2013, None, "e"]]
+            )
+
+            # with only some of its columns loaded, clubs is read from the prepared file
+            td.assets["clubs"].load_from_prep(columns=["club_id"])
+
+            df_projected = td.join(
+                "club_games", "games", "clubs",
+                columns=["game_id", "season", "clubs.name", "name"],
+                where=[("season", "==", 2013)]
+            )
+            self.assertTrue(df_projected.equals(df))
+
+            with self.assertRaises(InvalidJoin):
+                td.join("games", "clubs")
+
+    def test_query(self):
+
+        td = self.dataset
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for asset in td.assets.values():
+                asset.prep_location = tmpdir
+
+            # one asset only has a csv file and the other a parquet file
+            asset_a = td.assets["base_something_a"]
+            asset_a.public = True
+            pd.DataFrame(data={"some_id": [1, 2, 2]}).to_csv(asset_a.prep_path, index=False)
+            asset_b = td.assets["base_something_b"]
+            asset_b.public = True
+            pd.DataFrame(data={"some_other_id": [2, 3]}).to_parquet(asset_b.parquet_path, index=False)
+
+            df = td.query(
+                "SELECT some_id, count(*) AS n FROM file1 "
+                "JOIN file2 ON some_id = some_other_id GROUP BY 1"
+            )
+            self.assertEqual(df.to_dict(orient="records"), [{"some_id": 2, "n": 2}])
+
+            table = td.query("SELECT * FROM file2", output="arrow")
+            self.assertEqual(table.num_rows, 2)
+
+            batches = td.query("SELECT * FROM file1", output="batches", batch_size=1)
+            self.assertEqual(sum(batch.num_rows for batch in batches), 3)
+
+    def test_query_results_cache(self):
+
+        td = Dataset(cache_results=True)
+        td.assets = self.dataset.assets
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            td.prep_folder_path = tmpdir
+            asset = td.assets["base_something_a"]
+            asset.prep_location = tmpdir
+            asset.public = True
+            pd.DataFrame(data={"some_id": [1, 2, 2]}).to_csv(asset.prep_path, index=False)
+
+            sql = "SELECT count(*) AS n FROM file1"
+            with mock.patch.object(td, "_query", wraps=td._query) as query:
+                self.assertEqual(td.query(sql)["n"].tolist(), [3])
+                self.assertEqual(td.query(sql + ";")["n"].tolist(), [3])
+                self.assertEqual(query.call_count, 1)
+
+                # changes in the prepared files invalidate the cached results
+                pd.DataFrame(data={"some_id": [1, 2, 3, 4]}).to_csv(asset.prep_path, index=False)
+                self.assertEqual(td.query(sql)["n"].tolist(), [4])
+                self.assertEqual(query.call_count, 2)
+
+    def test_version_tracks_loaded_data(self):
+
+        td = Dataset(cache_results=True)
+        td.assets = self.dataset.assets
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            td.prep_folder_path = tmpdir
+            asset = td.assets["base_something_a"]
+            asset.prep_location = tmpdir
+            asset.schema = Schema(fields=[Field(name="some_id", type="integer")])
+            pd.DataFrame(data={"some_id": [1, 2, 2]}).to_csv(asset.prep_path, index=False)
+
+            version = td.get_version()
+            asset.load_from_prep()
+            self.assertEqual(td.get_version(), version)
+
+            # dataframes assigned in memory and filtered loads are served to joins
+            asset.prep_df = pd.DataFrame(data={"some_id": [3]})
+            assigned = td.get_version()
+            self.assertNotEqual(assigned, version)
+            asset.prep_df = pd.DataFrame(data={"some_id": [3]})
+            self.assertNotIn(td.get_version(), [version, assigned])
+
+            asset.load_from_prep(filters=[("some_id", ">", 1)])
+            self.assertNotIn(td.get_version(), [version, assigned])
+
+            asset.load_from_prep()
+            self.assertEqual(td.get_version(), version)
+
+            td.string_pool = StringPool()
+            self.assertNotEqual(td.get_version(), version)
+
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from transfermarkt_datasets.core.asset import Asset
+from transfermarkt_datasets.core.cache import PrepCache
+from transfermarkt_datasets.core.index import KeyIndex
+from transfermarkt_datasets.core.schema import Schema, Field
+
+class SomeAsset(Asset):
+    name = "some_asset"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.schema = Schema(
+            fields=[
+                Field(name="appearance_id", type="integer"),
+                Field(name="game_id", type="integer"),
+                Field(name="player_id", type="integer")
+            ]
+        )
+        self.schema.primary_key = ["appearance_id"]
+
+class TestKeyIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.df = pd.DataFrame(
+            data={
+                "appearance_id": pd.array([30, 10, 20, 40], dtype="Int64"),
+                "game_id": pd.array([2, 1, 2, None], dtype="Int64"),
+                "player_id": pd.array([7, 7, 8, 8], dtype="Int64")
+            }
+        )
+
+    def test_lookup(self):
+
+        index = KeyIndex.build(self.df, "game_id")
+
+        self.assertEqual(list(index.lookup(2)), [0, 2])
+        self.assertEqual(list(index.lookup(1)), [1])
+        self.assertEqual(list(index.lookup(3)), [])
+        # null keys are not indexed
+        self.assertEqual(len(index), 3)
+
+    def test_lookup_composite_key(self):
+
+        index = KeyIndex.build(self.df, ["player_id", "game_id"])
+
+        self.assertEqual(list(index.lookup((7, 2))), [0])
+        self.assertEqual(list(index.lookup((8, 1))), [])
+
+    def test_save_and_load(self):
+
+        index = KeyIndex.build(self.df, "appearance_id")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "some.index")
+            index.save(path)
+            loaded = KeyIndex.load(path)
+
+        self.assertTrue(loaded.is_unique)
+        self.assertEqual(list(loaded.lookup(20)), [2])
+
+    def test_asset_lookups(self):
+
+        at = SomeAsset()
+        at.prep_df = self.df
+
+        self.assertEqual(at.get(20)["player_id"], 8)
+        with self.assertRaises(KeyError):
+            at.get(50)
+
+        self.assertEqual(
+            list(at.rows_for("game_id", 2)["appearance_id"]),
+            [30, 20]
+        )
+
+    def test_asset_indexes_are_persisted_in_cache(self):
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.df.to_csv(os.path.join(tmpdir, "some_asset.csv.gz"), index=False)
+            cache = PrepCache(os.path.join(tmpdir, ".cache"))
+
+            at = SomeAsset()
+            at.prep_location = tmpdir
+            at.cache = cache
+            at.load_from_prep()
+            at.rows_for("game_id", 2)
+
+            index_path = cache.index_path(at.source_path, ["game_id"], at.schema_signature)
+            self.assertTrue(os.path.exists(index_path))
+
+            other = SomeAsset()
+            other.prep_location = tmpdir
+            other.cache = cache
+            other.load_from_prep()
+
+            self.assertEqual(
+                list(other.rows_for("game_id", 2)["appearance_id"]),
+                [30, 20]
+            )
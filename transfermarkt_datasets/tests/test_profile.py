@@ -0,0 +1,98 @@
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from transfermarkt_datasets.core.asset import Asset
+from transfermarkt_datasets.core.profile import FieldProfiler, HyperLogLog, profile_chunks
+from transfermarkt_datasets.core.schema import Schema, Field
+
+class TestProfile(unittest.TestCase):
+
+    def test_hyperloglog(self):
+
+        sketch = HyperLogLog()
+        for start in range(0, 100_000, 10_000):
+            sketch.update(pd.Series(np.arange(start, start + 10_000) % 50_000))
+
+        self.assertAlmostEqual(sketch.estimate(), 50_000, delta=50_000 * 0.05)
+
+        sketch = HyperLogLog()
+        sketch.update(pd.Series(["a", "b", "c", "a"]))
+        self.assertEqual(sketch.estimate(), 3)
+
+    def test_field_profiler(self):
+
+        profiler = FieldProfiler(top_k=2, sample_size=5)
+        values = pd.Series(["b", None, "a", "b", "c", "b", "a"] * 100, dtype="string")
+        for start in range(0, len(values), 30):
+            profiler.update(values.iloc[start:start + 30])
+
+        profile = profiler.result()
+
+        self.assertEqual(profile["count"], 700)
+        self.assertEqual(profile["nulls"], 100)
+        self.assertEqual((profile["min"], profile["max"]), ("a", "c"))
+        self.assertEqual(profile["distinct"], 3)
+        self.assertEqual(profile["top"], [["b", 300], ["a", 200]])
+        self.assertEqual(len(profile["sample"]), 5)
+        self.assertTrue(set(profile["sample"]).issubset({"a", "b", "c"}))
+        self.assertEqual(profile["first_values"], ["b", "a", "c"])
+
+    def test_profile_chunks(self):
+
+        df = pd.DataFrame(
+            data={
+                "some_id": pd.array([3, 1, None], dtype="Int64"),
+                "date": pd.to_datetime(["2020-01-01", None, "2019-06-30"])
+            }
+        )
+        profile = profile_chunks([df.iloc[:2], df.iloc[2:]], ["some_id", "date"])
+
+        self.assertEqual(
+            {key: profile["some_id"][key] for key in ["nulls", "min", "max", "distinct"]},
+            {"nulls": 1, "min": 1, "max": 3, "distinct": 2}
+        )
+        self.assertEqual(profile["date"]["min"], "2019-06-30T00:00:00")
+
+    def test_asset_profile_is_persisted(self):
+
+        class TestAsset(Asset):
+            name = "test_asset"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.schema = Schema(
+                    fields=[
+                        Field(name="some_id", type="integer"),
+                        Field(name="some_name", type="string")
+                    ]
+                )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pd.DataFrame(
+                data={"some_id": [1, 2, 3], "some_name": ["a", "b", "a"]}
+            ).to_csv(f"{tmpdir}/test_asset.csv.gz", index=False)
+
+            at = TestAsset()
+            at.prep_location = tmpdir
+            profile = at.profile(chunksize=2)
+            self.assertEqual(profile["some_name"]["top"], [["a", 2], ["b", 1]])
+            self.assertFalse(at.is_loaded)
+
+            # a new asset reuses the persisted profile, the data is not scanned again
+            at = TestAsset()
+            at.prep_location = tmpdir
+            with mock.patch.object(at, "iter_prep_chunks") as iter_prep_chunks:
+                self.assertEqual(at.profile(), profile)
+                iter_prep_chunks.assert_not_called()
+
+            # a changed file is profiled again
+            pd.DataFrame(
+                data={"some_id": [1, 2, 3, 4], "some_name": ["a", "b", "b", "b"]}
+            ).to_csv(f"{tmpdir}/test_asset.csv.gz", index=False)
+            at = TestAsset()
+            at.prep_location = tmpdir
+            self.assertEqual(at.profile()["some_name"]["top"], [["b", 3], ["a", 1]])
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+import pyarrow as pa
+
+from transfermarkt_datasets.core.results import ResultCache, normalize_sql, spec_key
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+        self.cache_dir = os.path.join(self.tmpdir.name, "results")
+        self.table = pa.table({"some_id": list(range(100))})
+
+    def test_normalize_sql(self):
+
+        self.assertEqual(
+            normalize_sql("SELECT *\n  FROM games\tWHERE name = 'a  b' ;"),
+            "SELECT * FROM games WHERE name = 'a  b'"
+        )
+        # comments do not swallow the rest of the query once newlines are collapsed
+        self.assertEqual(
+            normalize_sql("SELECT a -- the '--' column\nFROM games /* all\nof them */ WHERE name = '-- b'"),
+            "SELECT a FROM games WHERE name = '-- b'"
+        )
+        self.assertEqual(
+            spec_key({"query": normalize_sql("SELECT 1")}),
+            spec_key({"query": normalize_sql(" SELECT   1;")})
+        )
+
+    def test_get_and_put(self):
+
+        cache = ResultCache(self.cache_dir)
+        self.assertIsNone(cache.get("v1", "some_key"))
+
+        cache.put("v1", "some_key", self.table)
+        self.assertTrue(cache.get("v1", "some_key").equals(self.table))
+
+        # a new cache over the same folder is served from disk
+        cache = ResultCache(self.cache_dir)
+        self.assertTrue(cache.get("v1", "some_key").equals(self.table))
+
+        # a new version does not match older entries, which are dropped from memory
+        self.assertIsNone(cache.get("v2", "some_key"))
+        self.assertEqual(len(cache.entries), 0)
+
+        # but kept on disk for other caches over the same folder, until evicted by size
+        cache.put("v2", "some_key", self.table)
+        self.assertTrue(ResultCache(self.cache_dir).get("v1", "some_key").equals(self.table))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+        cache = ResultCache(self.cache_dir, max_disk_bytes=os.path.getsize(cache._entry_path("some_key")))
+        cache.put("v3", "some_key", self.table)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_lru_eviction(self):
+
+        cache = ResultCache(
+            self.cache_dir,
+            max_memory_bytes=2 * self.table.nbytes,
+            max_disk_bytes=0
+        )
+
+        cache.put("v1", "a", self.table)
+        cache.put("v1", "b", self.table)
+        cache.get("v1", "a")
+        cache.put("v1", "c", self.table)
+
+        # "b" was the least recently used entry
+        self.assertEqual(list(cache.entries.keys()), ["a", "c"])
+        self.assertFalse(os.path.exists(self.cache_dir))
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+
+from transfermarkt_datasets.core.asset import Asset
+from transfermarkt_datasets.core.dataset import Dataset
+from transfermarkt_datasets.core.schema import Schema, Field
+from transfermarkt_datasets.core.snapshot import InvalidSnapshot, Snapshot, write_snapshot
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "dataset.snapshot")
+
+    def test_write_snapshot(self):
+
+        class ClubsAsset(Asset):
+            name = "clubs"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.schema = Schema(
+                    fields=[
+                        Field(name="club_id", type="integer"),
+                        Field(name="name", type="string")
+                    ],
+                    primary_key=["club_id"]
+                )
+
+        class PlayersAsset(Asset):
+            name = "players"
+
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.schema = Schema(
+                    fields=[
+                        Field(name="player_id", type="integer"),
+                        Field(name="club_id", type="integer"),
+                        Field(name="date_of_birth", type="date")
+                    ],
+                    foreign_keys=[
+                        {"fields": "club_id", "reference": {"resource": "clubs", "fields": "club_id"}}
+                    ]
+                )
+
+        td = Dataset()
+        td.assets = {"clubs": ClubsAsset(), "players": PlayersAsset()}
+        for asset in td.assets.values():
+            asset.prep_location = self.tmpdir.name
+
+        pd.DataFrame(
+            data={"club_id": [1, 2], "name": ["Real Madrid", "Barcelona"]}
+        ).to_csv(td.assets["clubs"].prep_path, index=False)
+        pd.DataFrame(
+            data={"player_id": [10, 20, 30], "club_id": [1, 1, 2], "date_of_birth": ["2000-01-01", None, "1999-12-31"]}
+        ).to_csv(td.assets["players"].prep_path, index=False)
+
+        td.write_snapshot(self.path)
+        snapshot = Snapshot(self.path)
+
+        self.assertEqual(snapshot.asset_names, ["clubs", "players"])
+        self.assertEqual(snapshot.table("players").num_rows, 3)
+        self.assertEqual(
+            snapshot.metadata["relationships"],
+            td.get_relationships()
+        )
+        self.assertEqual(
+            snapshot.metadata["assets"]["clubs"]["schema"]["primaryKey"],
+            ["club_id"]
+        )
+        for section in snapshot.metadata["assets"].values():
+            self.assertEqual(section["offset"] % 64, 0)
+
+        df = snapshot.read("players", columns=["player_id"], filters=[("club_id", "==", 1)])
+        self.assertEqual(df["player_id"].tolist(), [10, 20])
+
+        # types are kept as loaded from the prepared files
+        players = td.assets["players"].read_prep()
+        pd.testing.assert_frame_equal(snapshot.read("players"), players)
+
+    def test_open_snapshot(self):
+
+        countries = pd.DataFrame(
+            data={
+                "country_id": pd.array([1, 2], dtype="Int64"),
+                "country_name": pd.array(["Spain", "Italy"], dtype="string"),
+                "country_code": pd.array(["ES", "IT"], dtype="string"),
+                "confederation": pd.array(["europa", "europa"], dtype="string"),
+                "total_clubs": pd.array([20, 20], dtype="Int64"),
+                "total_players": pd.array([500, None], dtype="Int64"),
+                "url": pd.array([None, None], dtype="string")
+            }
+        )
+        write_snapshot(self.path, {"cur_countries": pa.Table.from_pandas(countries)})
+
+        td = Dataset.open_snapshot(self.path)
+        asset = td.assets["cur_countries"]
+
+        self.assertFalse(asset.is_loaded)
+        pd.testing.assert_frame_equal(asset.prep_df, countries)
+        self.assertEqual(
+            td.query("SELECT count(*) AS n FROM countries")["n"].tolist(),
+            [2]
+        )
+
+    def test_invalid_snapshot(self):
+
+        with open(self.path, "wb") as f:
+            f.write(b"not a snapshot")
+
+        with self.assertRaises(InvalidSnapshot):
+            Snapshot(self.path)
@@ -0,0 +1,76 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+from transfermarkt_datasets.core.schema import Schema, Field
+from transfermarkt_datasets.core.validation import validate_file
+
+class TestValidation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+        self.schema = Schema(
+            fields=[
+                Field(name="some_id", type="integer"),
+                Field(name="some_value", type="number"),
+                Field(name="some_date", type="date"),
+                Field(name="some_flag", type="boolean"),
+                Field(name="url", type="string", form="uri")
+            ]
+        )
+
+    def write(self, content: bytes) -> str:
+        path = os.path.join(self.tmpdir.name, "some_asset.csv.gz")
+        with open(path, "wb") as f:
+            f.write(gzip.compress(content))
+        return path
+
+    def test_valid_file(self):
+
+        path = self.write(
+            b"some_id,some_value,some_date,some_flag,url\n"
+            b"1,0.5,2012-08-05,true,https://www.transfermarkt.co.uk/a\n"
+            b",,,,\n"
+        )
+
+        task = validate_file(path, self.schema, "some_asset")
+
+        self.assertTrue(task["valid"])
+        self.assertEqual(task["stats"]["rows"], 2)
+
+    def test_type_errors_across_chunks(self):
+
+        path = self.write(
+            b"some_id,some_value,some_date,some_flag,url\n"
+            b"1,0.5,2012-08-05,true,https://www.transfermarkt.co.uk/a\n"
+            b"1.5,x,2012-13-05,yes,not a url\n"
+            b"3,1,2012-08-05,false,https://www.transfermarkt.co.uk/c\n"
+        )
+
+        task = validate_file(path, self.schema, "some_asset", chunksize=1)
+
+        self.assertFalse(task["valid"])
+        self.assertEqual(task["stats"]["errors"], 5)
+        self.assertEqual(
+            [(error["rowNumber"], error["fieldName"]) for error in task["errors"]],
+            [(3, "some_id"), (3, "some_value"), (3, "some_date"), (3, "some_flag"), (3, "url")]
+        )
+
+    def test_label_errors_and_error_limit(self):
+
+        path = self.write(
+            b"some_id,some_value,some_date,other\n"
+            b"a,b,c,d\n"
+        )
+
+        task = validate_file(path, self.schema, "some_asset", max_errors=2)
+
+        self.assertEqual(task["stats"]["errors"], 6)
+        self.assertEqual(len(task["errors"]), 2)
+        self.assertEqual(
+            [error["type"] for error in task["errors"]],
+            ["missing-label", "missing-label"]
+        )